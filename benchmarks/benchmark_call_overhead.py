@@ -0,0 +1,54 @@
+"""
+Benchmark of the overhead of calling a MeshKernel function.
+
+Compares calls through the prototyped functions of the shared library
+with calls through a library handle without prototypes, where every
+scalar has to be converted by hand.
+"""
+
+import argparse
+import time
+from ctypes import CDLL, byref, c_double, c_int
+
+from meshkernel import Mesh2dFactory, MeshKernel
+from meshkernel.library import get_library_path
+
+
+def benchmark(name: str, function, repetitions: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        function()
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<45} {elapsed / repetitions * 1e6:8.3f} us/call")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repetitions", type=int, default=100000)
+    arguments = parser.parse_args()
+
+    mk = MeshKernel()
+    mk.mesh2d_set(Mesh2dFactory.create_rectilinear_mesh(10, 10))
+    unprototyped_lib = CDLL(str(get_library_path()))
+    index = c_int()
+
+    benchmark(
+        "MeshKernel.mesh2d_get_node_index",
+        lambda: mk.mesh2d_get_node_index(5.0, 5.0, 0.5),
+        arguments.repetitions,
+    )
+    benchmark(
+        "prototyped mkernel_mesh2d_get_node_index",
+        lambda: mk.lib.mkernel_mesh2d_get_node_index(
+            mk._meshkernelid, 5.0, 5.0, 0.5, byref(index)
+        ),
+        arguments.repetitions,
+    )
+    benchmark(
+        "unprototyped mkernel_mesh2d_get_node_index",
+        lambda: unprototyped_lib.mkernel_mesh2d_get_node_index(
+            mk._meshkernelid, c_double(5.0), c_double(5.0), c_double(0.5), byref(index)
+        ),
+        arguments.repetitions,
+    )
@@ -0,0 +1,41 @@
+"""
+Benchmark of `Mesh2dFactory.create_rectilinear_mesh`.
+
+Measures time and peak memory for growing numbers of nodes,
+both should scale linearly with the number of nodes.
+Run with `--max-nodes 100000000` to go up to 10^8 nodes (needs about 5 GB of memory).
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from meshkernel import Mesh2dFactory
+
+
+def benchmark_create_rectilinear_mesh(num_nodes: int) -> None:
+    side = int(num_nodes**0.5)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    mesh2d = Mesh2dFactory.create_rectilinear_mesh(side - 1, side - 1)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    actual_nodes = mesh2d.node_x.size
+    print(
+        f"{actual_nodes:>12d} nodes: {elapsed:8.3f} s, {peak / 2**20:10.1f} MiB peak, "
+        f"{elapsed / actual_nodes * 1e9:6.2f} ns/node, {peak / actual_nodes:6.2f} B/node"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-nodes", type=int, default=10**7)
+    arguments = parser.parse_args()
+
+    num_nodes = 10**4
+    while num_nodes <= arguments.max_nodes:
+        benchmark_create_rectilinear_mesh(num_nodes)
+        num_nodes *= 10
@@ -0,0 +1,95 @@
+"""
+Benchmark of the batched Mesh2d editing methods of `MeshKernel`
+against calling the corresponding single-item method in a loop.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from meshkernel import Mesh2dFactory, MeshKernel
+
+
+def create_meshkernel(size: int) -> MeshKernel:
+    mk = MeshKernel()
+    mk.mesh2d_set(Mesh2dFactory.create_rectilinear_mesh(size, size))
+    return mk
+
+
+def report(name: str, count: int, loop_elapsed: float, batch_elapsed: float) -> None:
+    print(
+        f"{name:<25} {count:>8d} items: loop {loop_elapsed:8.3f} s, "
+        f"batch {batch_elapsed:8.3f} s, speedup {loop_elapsed / batch_elapsed:6.2f}x"
+    )
+
+
+def benchmark_insert_edges(size: int) -> None:
+    # Connect the lower left with the upper right node of every face
+    node_indices = np.arange((size + 1) ** 2, dtype=np.int32).reshape(size + 1, -1)
+    node_pairs = np.column_stack(
+        (node_indices[:-1, :-1].ravel(), node_indices[1:, 1:].ravel())
+    )
+
+    mk = create_meshkernel(size)
+    start = time.perf_counter()
+    for start_node, end_node in node_pairs:
+        mk.mesh2d_insert_edge(int(start_node), int(end_node))
+    loop_elapsed = time.perf_counter() - start
+
+    mk = create_meshkernel(size)
+    start = time.perf_counter()
+    mk.mesh2d_insert_edges(node_pairs)
+    batch_elapsed = time.perf_counter() - start
+
+    report("mesh2d_insert_edges", len(node_pairs), loop_elapsed, batch_elapsed)
+
+
+def benchmark_delete_nodes(size: int) -> None:
+    # Delete every second node of every second row without disconnecting the remaining nodes.
+    # Delete from the back so that the indices of the remaining nodes to delete stay valid.
+    node_indices = np.arange((size + 1) ** 2, dtype=np.int32).reshape(size + 1, -1)
+    node_indices = node_indices[1::2, 1::2].ravel()[::-1]
+
+    mk = create_meshkernel(size)
+    start = time.perf_counter()
+    for node_index in node_indices:
+        mk.mesh2d_delete_node(int(node_index))
+    loop_elapsed = time.perf_counter() - start
+
+    mk = create_meshkernel(size)
+    start = time.perf_counter()
+    mk.mesh2d_delete_nodes(node_indices)
+    batch_elapsed = time.perf_counter() - start
+
+    report("mesh2d_delete_nodes", len(node_indices), loop_elapsed, batch_elapsed)
+
+
+def benchmark_delete_edges(size: int) -> None:
+    # Delete every second edge
+    mesh2d = create_meshkernel(size).mesh2d_get()
+    edge_x = mesh2d.edge_x[::2]
+    edge_y = mesh2d.edge_y[::2]
+
+    mk = create_meshkernel(size)
+    start = time.perf_counter()
+    for x, y in zip(edge_x, edge_y):
+        mk.mesh2d_delete_edge(float(x), float(y))
+    loop_elapsed = time.perf_counter() - start
+
+    mk = create_meshkernel(size)
+    start = time.perf_counter()
+    mk.mesh2d_delete_edges(x=edge_x, y=edge_y)
+    batch_elapsed = time.perf_counter() - start
+
+    report("mesh2d_delete_edges", len(edge_x), loop_elapsed, batch_elapsed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100)
+    arguments = parser.parse_args()
+
+    benchmark_insert_edges(arguments.size)
+    benchmark_delete_nodes(arguments.size)
+    benchmark_delete_edges(arguments.size)
@@ -0,0 +1,55 @@
+"""
+Benchmark of the batched Mesh2d queries of `MeshKernel`.
+
+The batched queries still call MeshKernel once per point, as its API has
+no batched query. The first query on a mesh includes building the spatial
+index of the mesh, which is compared with the cost of querying a whole
+batch of points against the already built index.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from meshkernel import Mesh2dFactory, MeshKernel
+
+
+def create_meshkernel(size: int) -> MeshKernel:
+    mk = MeshKernel()
+    mk.mesh2d_set(Mesh2dFactory.create_rectilinear_mesh(size, size))
+    return mk
+
+
+def report(name: str, count: int, first_elapsed: float, batch_elapsed: float) -> None:
+    print(
+        f"{name:<25} first query {first_elapsed:8.3f} s, "
+        f"{count:>8d} queries {batch_elapsed:8.3f} s "
+        f"({batch_elapsed / first_elapsed:6.2f}x the first query)"
+    )
+
+
+def benchmark_get_edges(size: int, num_points: int) -> None:
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0.0, size, num_points)
+    y = rng.uniform(0.0, size, num_points)
+
+    mk = create_meshkernel(size)
+    start = time.perf_counter()
+    mk.mesh2d_get_edge(size / 2, size / 2)
+    first_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    mk.mesh2d_get_edges(x, y)
+    batch_elapsed = time.perf_counter() - start
+
+    report("mesh2d_get_edges", num_points, first_elapsed, batch_elapsed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=700, help="1M edges by default")
+    parser.add_argument("--points", type=int, default=10000)
+    arguments = parser.parse_args()
+
+    benchmark_get_edges(arguments.size, arguments.points)
@@ -0,0 +1,45 @@
+"""
+Benchmark of saving and loading a Mesh2d.
+
+Compares `Mesh2d.save`/`Mesh2d.load` with and without memory-mapping
+with `numpy.savez`/`numpy.load`. Memory-mapped loading should take
+the same time for any mesh size.
+"""
+
+import argparse
+import tempfile
+import time
+from dataclasses import fields
+from pathlib import Path
+
+import numpy as np
+
+from meshkernel import Mesh2d, Mesh2dFactory
+
+
+def measure(name: str, function) -> None:
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<30} {elapsed * 1e3:10.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=3000)
+    arguments = parser.parse_args()
+
+    mesh2d = Mesh2dFactory.create_rectilinear_mesh(arguments.size, arguments.size)
+    print(f"{mesh2d.node_x.size} nodes, {mesh2d.edge_nodes.size // 2} edges")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "mesh2d.mk"
+        npz_path = Path(directory) / "mesh2d.npz"
+
+        measure("Mesh2d.save", lambda: mesh2d.save(path))
+        arrays = {field.name: getattr(mesh2d, field.name) for field in fields(mesh2d)}
+        measure("numpy.savez", lambda: np.savez(npz_path, **arrays))
+        measure("Mesh2d.load", lambda: Mesh2d.load(path))
+        measure("Mesh2d.load without mmap", lambda: Mesh2d.load(path, mmap=False))
+        measure("numpy.load", lambda: Mesh2d(**np.load(npz_path)))
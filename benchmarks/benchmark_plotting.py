@@ -0,0 +1,63 @@
+"""
+Benchmark of plotting the edges of a large Mesh2d.
+
+Compares drawing all edges with level of detail, which only draws
+the edges within the view limits and one edge per pixel, for the
+full view and after zooming in, and with drawing the edges as image.
+"""
+
+import argparse
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from meshkernel import Mesh2dFactory  # noqa: E402
+from meshkernel.utils import imshow_edges  # noqa: E402
+
+
+def measure(name: str, function) -> None:
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<30} {elapsed * 1e3:10.3f} ms")
+
+
+def zoom(fig, ax) -> None:
+    ax.set_xlim(10.0, 20.0)
+    ax.set_ylim(10.0, 20.0)
+    fig.canvas.draw()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=700)
+    arguments = parser.parse_args()
+
+    mesh2d = Mesh2dFactory.create_rectilinear_mesh(arguments.size, arguments.size)
+    print(f"{mesh2d.edge_nodes.size // 2} edges")
+
+    for level_of_detail in (False, True):
+        fig, ax = plt.subplots()
+        suffix = " with level of detail" if level_of_detail else ""
+
+        def draw():
+            mesh2d.plot_edges(ax, level_of_detail=level_of_detail)
+            fig.canvas.draw()
+
+        measure(f"plot_edges{suffix}", draw)
+        measure(f"zoom{suffix}", lambda: zoom(fig, ax))
+        plt.close(fig)
+
+    fig, ax = plt.subplots()
+
+    def draw_image():
+        imshow_edges(mesh2d.node_x, mesh2d.node_y, mesh2d.edge_nodes, ax)
+        fig.canvas.draw()
+
+    measure("imshow_edges", draw_image)
+    plt.close(fig)
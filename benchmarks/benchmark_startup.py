@@ -0,0 +1,39 @@
+"""
+Benchmark of the construction latency of `MeshKernel` instances.
+
+The first construction includes loading the MeshKernel library,
+all following constructions reuse the already loaded library.
+"""
+
+import argparse
+import time
+
+from meshkernel import MeshKernel
+
+
+def benchmark_first_construction() -> None:
+    start = time.perf_counter()
+    mk = MeshKernel()
+    elapsed = time.perf_counter() - start
+    del mk
+
+    print(f"first construction (loads library): {elapsed * 1e3:8.3f} ms")
+
+
+def benchmark_construction(repetitions: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        mk = MeshKernel()
+        del mk
+    elapsed = time.perf_counter() - start
+
+    print(f"construction and destruction:       {elapsed / repetitions * 1e6:8.3f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repetitions", type=int, default=10000)
+    arguments = parser.parse_args()
+
+    benchmark_first_construction()
+    benchmark_construction(arguments.repetitions)
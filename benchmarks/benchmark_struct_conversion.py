@@ -0,0 +1,90 @@
+"""
+Benchmark of the conversion of small geometries to C structures.
+
+For small geometries the time spent on setting the pointers of the C structures
+dominates the time of a MeshKernel call. Compares the conversion of
+`CMesh2d.from_mesh2d` and `CGeometryList.from_geometrylist` with setting
+the pointers through `numpy.ctypeslib.as_ctypes`.
+"""
+
+import argparse
+import time
+
+import numpy as np
+from numpy.ctypeslib import as_ctypes
+
+from meshkernel import GeometryList, Mesh2d, Mesh2dFactory
+from meshkernel.c_structures import CGeometryList, CMesh2d
+
+
+def benchmark(name: str, function, repetitions: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        function()
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<45} {elapsed / repetitions * 1e6:8.3f} us/call")
+
+
+def from_mesh2d_as_ctypes(mesh2d: Mesh2d) -> CMesh2d:
+    c_mesh2d = CMesh2d()
+    for name in (
+        "edge_nodes",
+        "face_nodes",
+        "nodes_per_face",
+        "node_x",
+        "node_y",
+        "edge_x",
+        "edge_y",
+        "face_x",
+        "face_y",
+    ):
+        setattr(c_mesh2d, name, as_ctypes(getattr(mesh2d, name)))
+    c_mesh2d.num_nodes = mesh2d.node_x.size
+    c_mesh2d.num_edges = mesh2d.edge_nodes.size // 2
+    c_mesh2d.num_faces = mesh2d.face_x.size
+    c_mesh2d.num_face_nodes = mesh2d.face_nodes.size
+    return c_mesh2d
+
+
+def from_geometrylist_as_ctypes(geometry_list: GeometryList) -> CGeometryList:
+    c_geometry_list = CGeometryList()
+    c_geometry_list.geometry_separator = geometry_list.geometry_separator
+    c_geometry_list.inner_outer_separator = geometry_list.inner_outer_separator
+    c_geometry_list.n_coordinates = geometry_list.x_coordinates.size
+    c_geometry_list.x_coordinates = as_ctypes(geometry_list.x_coordinates)
+    c_geometry_list.y_coordinates = as_ctypes(geometry_list.y_coordinates)
+    c_geometry_list.values = as_ctypes(geometry_list.values)
+    return c_geometry_list
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repetitions", type=int, default=100000)
+    arguments = parser.parse_args()
+
+    mesh2d = Mesh2dFactory.create_rectilinear_mesh(2, 2)
+    geometry_list = GeometryList(
+        np.array([0.0, 1.0, 1.0, 0.0, 0.0]), np.array([0.0, 0.0, 1.0, 1.0, 0.0])
+    )
+
+    benchmark(
+        "CMesh2d.from_mesh2d",
+        lambda: CMesh2d.from_mesh2d(mesh2d),
+        arguments.repetitions,
+    )
+    benchmark(
+        "CMesh2d with as_ctypes",
+        lambda: from_mesh2d_as_ctypes(mesh2d),
+        arguments.repetitions,
+    )
+    benchmark(
+        "CGeometryList.from_geometrylist",
+        lambda: CGeometryList.from_geometrylist(geometry_list),
+        arguments.repetitions,
+    )
+    benchmark(
+        "CGeometryList with as_ctypes",
+        lambda: from_geometrylist_as_ctypes(geometry_list),
+        arguments.repetitions,
+    )
@@ -0,0 +1,41 @@
+"""
+Benchmark of writing and reading a Mesh2d as UGRID netCDF file.
+
+Compares the round trip of all arrays with reading only the nodes,
+which skips the edge and face variables.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from meshkernel import Mesh2dFactory, Mesh2dLocation
+from meshkernel.io import ugrid
+
+
+def measure(name: str, function) -> None:
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<30} {elapsed * 1e3:10.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1000)
+    arguments = parser.parse_args()
+
+    mesh2d = Mesh2dFactory.create_rectilinear_mesh(arguments.size, arguments.size)
+    print(f"{mesh2d.node_x.size} nodes, {mesh2d.edge_nodes.size // 2} edges")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "mesh2d.nc"
+
+        measure("write_mesh2d", lambda: ugrid.write_mesh2d(path, mesh2d))
+        measure("read_mesh2d", lambda: ugrid.read_mesh2d(path))
+        measure(
+            "read_mesh2d nodes only",
+            lambda: ugrid.read_mesh2d(path, locations=[Mesh2dLocation.NODES]),
+        )
@@ -1,6 +1,7 @@
 # If you change these imports,
 # do not forget to sync the docs at "docs/api"
-from meshkernel.errors import InputError, MeshKernelError
+from meshkernel.arrays import get_copied_bytes, reset_copied_bytes, set_strict_copies
+from meshkernel.errors import CopyWarning, InputError, MeshKernelError
 from meshkernel.factories import Mesh2dFactory
 from meshkernel.meshkernel import MeshKernel
 from meshkernel.py_structures import (
@@ -12,8 +13,10 @@ from meshkernel.py_structures import (
     Mesh2d,
     Mesh2dLocation,
     MeshRefinementParameters,
+    MultiPolygon,
     OrthogonalizationParameters,
     ProjectToLandBoundaryOption,
     RefinementType,
 )
+from meshkernel.shared_memory import SharedMemoryHandle
 from meshkernel.version import __version__
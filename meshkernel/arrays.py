@@ -0,0 +1,86 @@
+import threading
+import warnings
+
+import numpy as np
+from numpy import ndarray
+
+from meshkernel.errors import CopyWarning
+
+_copied_bytes = 0
+_strict_copies = False
+_lock = threading.Lock()
+
+
+def as_c_array(array, dtype: type, name: str = "array") -> ndarray:
+    """Returns `array` as a C-contiguous 1D array of the given data type.
+    Intended for internal use only.
+
+    The array is only copied if its data type or memory layout differ from what MeshKernel expects.
+    The number of copied bytes is recorded and, in strict mode, a `CopyWarning` is issued for every copy.
+
+    Args:
+        array (array_like): The input array.
+        dtype (type): The data type expected by MeshKernel.
+        name (str, optional): The name of the array used in the warning message.
+
+    Returns:
+        ndarray: `array` itself or a converted copy of it.
+    """
+
+    global _copied_bytes
+
+    if (
+        isinstance(array, ndarray)
+        and array.dtype == dtype
+        and array.ndim == 1
+        and array.flags.c_contiguous
+    ):
+        return array
+
+    result = np.ascontiguousarray(array, dtype=dtype).ravel()
+    if isinstance(array, ndarray) and np.shares_memory(result, array):
+        # Only the dimensions differ, no data has been copied
+        return result
+
+    with _lock:
+        _copied_bytes += result.nbytes
+    if _strict_copies:
+        warnings.warn(
+            f"{name} has been copied to a contiguous {np.dtype(dtype).name} array "
+            f"({result.nbytes} bytes)",
+            CopyWarning,
+            stacklevel=3,
+        )
+
+    return result
+
+
+def get_copied_bytes() -> int:
+    """Gets the number of bytes copied while converting input arrays for MeshKernel.
+
+    Returns:
+        int: The number of copied bytes since the start or the last call to `reset_copied_bytes`.
+    """
+
+    return _copied_bytes
+
+
+def reset_copied_bytes() -> None:
+    """Resets the number of bytes copied while converting input arrays for MeshKernel."""
+
+    global _copied_bytes
+
+    with _lock:
+        _copied_bytes = 0
+
+
+def set_strict_copies(strict: bool) -> None:
+    """Sets whether a `CopyWarning` is issued when an input array has to be copied.
+
+    Args:
+        strict (bool): Whether to warn about copies of input arrays.
+    """
+
+    global _strict_copies
+
+    _strict_copies = bool(strict)
@@ -1,19 +1,100 @@
 from __future__ import annotations
 
 from ctypes import POINTER, Structure, c_double, c_int
+from typing import Iterable, Optional, Set
+from weakref import WeakValueDictionary
 
 import numpy as np
-from numpy.ctypeslib import as_ctypes
+from numpy import ndarray
 
+from meshkernel.arrays import as_c_array
 from meshkernel.py_structures import (
     Contacts,
     GeometryList,
     Mesh1d,
     Mesh2d,
+    Mesh2dLocation,
     MeshRefinementParameters,
     OrthogonalizationParameters,
 )
 
+# The pointer types are created once, instead of on every conversion
+c_double_p = POINTER(c_double)
+c_int_p = POINTER(c_int)
+
+_POINTER_TYPES = {np.double: c_double_p, np.int32: c_int_p}
+
+
+# The views created by `_reuse_or_allocate` by their id, only their memory may be grown into again
+_reused_views: WeakValueDictionary = WeakValueDictionary()
+
+
+def _reuse_or_allocate(
+    array: ndarray, size: int, dtype: type, used_buffers: Optional[Set[int]] = None
+) -> ndarray:
+    """Returns an array of the given size, reusing the memory of `array` if it is large enough.
+
+    Memory is only reused if `array` owns it or if `array` is a view returned by this function earlier.
+    A view of a foreign buffer, such as a part of a caller's memory pool, could otherwise be grown
+    into the memory behind it.
+
+    Args:
+        array (ndarray): The array of which the memory should be reused.
+        size (int): The size of the returned array.
+        dtype (type): The data type of the returned array.
+        used_buffers (Set[int], optional): The addresses of the buffers already reused for other arrays
+                                           of the same structure. They are not reused again and the address
+                                           of the reused buffer is added.
+
+    Returns:
+        ndarray: A view on the memory of `array` or a newly allocated array.
+    """
+
+    if array.base is None:
+        buffer = array
+    elif _reused_views.get(id(array)) is array:
+        buffer = array.base
+    else:
+        buffer = None
+
+    if (
+        isinstance(buffer, ndarray)
+        and buffer.base is None
+        and buffer.dtype == dtype
+        and buffer.ndim == 1
+        and buffer.flags.c_contiguous
+        and buffer.flags.writeable
+        and buffer.size >= size
+        and (used_buffers is None or buffer.ctypes.data not in used_buffers)
+    ):
+        if used_buffers is not None:
+            used_buffers.add(buffer.ctypes.data)
+        view = buffer[:size]
+        _reused_views[id(view)] = view
+        return view
+
+    return np.empty(size, dtype=dtype)
+
+
+# The arrays of a Mesh2d per location with their data type and the dimension determining their size
+_MESH2D_ARRAYS = {
+    Mesh2dLocation.NODES: (
+        ("node_x", np.double, "num_nodes", 1),
+        ("node_y", np.double, "num_nodes", 1),
+    ),
+    Mesh2dLocation.EDGES: (
+        ("edge_nodes", np.int32, "num_edges", 2),
+        ("edge_x", np.double, "num_edges", 1),
+        ("edge_y", np.double, "num_edges", 1),
+    ),
+    Mesh2dLocation.FACES: (
+        ("face_nodes", np.int32, "num_face_nodes", 1),
+        ("nodes_per_face", np.int32, "num_faces", 1),
+        ("face_x", np.double, "num_faces", 1),
+        ("face_y", np.double, "num_faces", 1),
+    ),
+}
+
 
 class CMesh2d(Structure):
     """C-structure intended for internal use only.
@@ -66,65 +147,113 @@ class CMesh2d(Structure):
 
         c_mesh2d = CMesh2d()
 
+        edge_nodes = as_c_array(mesh2d.edge_nodes, np.int32, "edge_nodes")
+        face_nodes = as_c_array(mesh2d.face_nodes, np.int32, "face_nodes")
+        nodes_per_face = as_c_array(mesh2d.nodes_per_face, np.int32, "nodes_per_face")
+        node_x = as_c_array(mesh2d.node_x, np.double, "node_x")
+        node_y = as_c_array(mesh2d.node_y, np.double, "node_y")
+        edge_x = as_c_array(mesh2d.edge_x, np.double, "edge_x")
+        edge_y = as_c_array(mesh2d.edge_y, np.double, "edge_y")
+        face_x = as_c_array(mesh2d.face_x, np.double, "face_x")
+        face_y = as_c_array(mesh2d.face_y, np.double, "face_y")
+
         # Set the pointers
-        c_mesh2d.edge_nodes = as_ctypes(mesh2d.edge_nodes)
-        c_mesh2d.face_nodes = as_ctypes(mesh2d.face_nodes)
-        c_mesh2d.nodes_per_face = as_ctypes(mesh2d.nodes_per_face)
-        c_mesh2d.node_x = as_ctypes(mesh2d.node_x)
-        c_mesh2d.node_y = as_ctypes(mesh2d.node_y)
-        c_mesh2d.edge_x = as_ctypes(mesh2d.edge_x)
-        c_mesh2d.edge_y = as_ctypes(mesh2d.edge_y)
-        c_mesh2d.face_x = as_ctypes(mesh2d.face_x)
-        c_mesh2d.face_y = as_ctypes(mesh2d.face_y)
+        c_mesh2d.edge_nodes = edge_nodes.ctypes.data_as(c_int_p)
+        c_mesh2d.face_nodes = face_nodes.ctypes.data_as(c_int_p)
+        c_mesh2d.nodes_per_face = nodes_per_face.ctypes.data_as(c_int_p)
+        c_mesh2d.node_x = node_x.ctypes.data_as(c_double_p)
+        c_mesh2d.node_y = node_y.ctypes.data_as(c_double_p)
+        c_mesh2d.edge_x = edge_x.ctypes.data_as(c_double_p)
+        c_mesh2d.edge_y = edge_y.ctypes.data_as(c_double_p)
+        c_mesh2d.face_x = face_x.ctypes.data_as(c_double_p)
+        c_mesh2d.face_y = face_y.ctypes.data_as(c_double_p)
+
+        # The pointers do not own the memory, keep the arrays alive as long as the structure
+        c_mesh2d._arrays = (
+            edge_nodes,
+            face_nodes,
+            nodes_per_face,
+            node_x,
+            node_y,
+            edge_x,
+            edge_y,
+            face_x,
+            face_y,
+        )
 
         # Set the sizes
-        c_mesh2d.num_nodes = mesh2d.node_x.size
-        c_mesh2d.num_edges = mesh2d.edge_nodes.size // 2
-        c_mesh2d.num_faces = mesh2d.face_x.size
-        c_mesh2d.num_face_nodes = mesh2d.face_nodes.size
+        c_mesh2d.num_nodes = node_x.size
+        c_mesh2d.num_edges = edge_nodes.size // 2
+        c_mesh2d.num_faces = face_x.size
+        c_mesh2d.num_face_nodes = face_nodes.size
 
         return c_mesh2d
 
-    def allocate_memory(self) -> Mesh2d:
+    def allocate_memory(
+        self,
+        out: Optional[Mesh2d] = None,
+        locations: Optional[Iterable[Mesh2dLocation]] = None,
+        scratch: Optional[Mesh2d] = None,
+    ) -> Mesh2d:
         """Allocate data according to the parameters with the "num_" prefix.
         The pointers are then set to the freshly allocated memory.
         The memory is owned by the Mesh2d instance which is returned by this method.
 
+        If `out` is given, the memory of its arrays is reused where it is large enough,
+        so that memory is only allocated when the dimensions grow.
+        The arrays of `out` are then replaced by views of the requested sizes.
+
+        If `locations` is given, only the arrays of these locations are allocated in the returned instance,
+        its other arrays are empty. The pointers of the other arrays are set to the memory of `scratch`,
+        which is reused in the same way as the memory of `out`.
+
+        Args:
+            out (Mesh2d, optional): The Mesh2d instance whose memory should be reused.
+            locations (Iterable[Mesh2dLocation], optional): The locations of the arrays to allocate.
+                                                            Default is all locations.
+            scratch (Mesh2d, optional): The Mesh2d instance holding the memory of the arrays of the other locations.
+
         Returns:
-            Mesh2d: The object owning the allocated memory.
+            Mesh2d: The object owning the allocated memory, `out` if it is given.
         """
 
-        edge_nodes = np.empty(self.num_edges * 2, dtype=np.int32)
-        face_nodes = np.empty(self.num_face_nodes, dtype=np.int32)
-        nodes_per_face = np.empty(self.num_faces, dtype=np.int32)
-        node_x = np.empty(self.num_nodes, dtype=np.double)
-        node_y = np.empty(self.num_nodes, dtype=np.double)
-        edge_x = np.empty(self.num_edges, dtype=np.double)
-        edge_y = np.empty(self.num_edges, dtype=np.double)
-        face_x = np.empty(self.num_faces, dtype=np.double)
-        face_y = np.empty(self.num_faces, dtype=np.double)
-
-        self.edge_nodes = as_ctypes(edge_nodes)
-        self.face_nodes = as_ctypes(face_nodes)
-        self.nodes_per_face = as_ctypes(nodes_per_face)
-        self.node_x = as_ctypes(node_x)
-        self.node_y = as_ctypes(node_y)
-        self.edge_x = as_ctypes(edge_x)
-        self.edge_y = as_ctypes(edge_y)
-        self.face_x = as_ctypes(face_x)
-        self.face_y = as_ctypes(face_y)
-
-        return Mesh2d(
-            node_x,
-            node_y,
-            edge_nodes,
-            face_nodes,
-            nodes_per_face,
-            edge_x,
-            edge_y,
-            face_x,
-            face_y,
-        )
+        if out is None:
+            out = Mesh2d(
+                np.empty(0, dtype=np.double),
+                np.empty(0, dtype=np.double),
+                np.empty(0, dtype=np.int32),
+            )
+        locations = set(Mesh2dLocation if locations is None else locations)
+        if scratch is None and len(locations) < len(Mesh2dLocation):
+            scratch = Mesh2d(
+                np.empty(0, dtype=np.double),
+                np.empty(0, dtype=np.double),
+                np.empty(0, dtype=np.int32),
+            )
+
+        # No two arrays may share a buffer, as MeshKernel would write one over the other
+        used_buffers = set()
+        for location, arrays in _MESH2D_ARRAYS.items():
+            target = out if location in locations else scratch
+            for name, dtype, num_name, factor in arrays:
+                size = getattr(self, num_name) * factor
+                array = _reuse_or_allocate(
+                    getattr(target, name), size, dtype, used_buffers
+                )
+                setattr(target, name, array)
+                setattr(self, name, array.ctypes.data_as(_POINTER_TYPES[dtype]))
+                if target is scratch:
+                    # Keep the memory of `out` for later calls
+                    setattr(
+                        out,
+                        name,
+                        _reuse_or_allocate(getattr(out, name), 0, dtype, used_buffers),
+                    )
+
+        # The pointers do not own the memory, keep the arrays alive as long as the structure
+        self._arrays = (out, scratch)
+
+        return out
 
 
 class CGeometryList(Structure):
@@ -166,10 +295,21 @@ class CGeometryList(Structure):
 
         c_geometry_list.geometry_separator = geometry_list.geometry_separator
         c_geometry_list.inner_outer_separator = geometry_list.inner_outer_separator
-        c_geometry_list.n_coordinates = geometry_list.x_coordinates.size
-        c_geometry_list.x_coordinates = as_ctypes(geometry_list.x_coordinates)
-        c_geometry_list.y_coordinates = as_ctypes(geometry_list.y_coordinates)
-        c_geometry_list.values = as_ctypes(geometry_list.values)
+        x_coordinates = as_c_array(
+            geometry_list.x_coordinates, np.double, "x_coordinates"
+        )
+        y_coordinates = as_c_array(
+            geometry_list.y_coordinates, np.double, "y_coordinates"
+        )
+        values = as_c_array(geometry_list.values, np.double, "values")
+
+        c_geometry_list.n_coordinates = x_coordinates.size
+        c_geometry_list.x_coordinates = x_coordinates.ctypes.data_as(c_double_p)
+        c_geometry_list.y_coordinates = y_coordinates.ctypes.data_as(c_double_p)
+        c_geometry_list.values = values.ctypes.data_as(c_double_p)
+
+        # The pointers do not own the memory, keep the arrays alive as long as the structure
+        c_geometry_list._arrays = (x_coordinates, y_coordinates, values)
 
         return c_geometry_list
 
@@ -330,14 +470,21 @@ class CMesh1d(Structure):
 
         c_mesh1d = CMesh1d()
 
+        edge_nodes = as_c_array(mesh1d.edge_nodes, np.int32, "edge_nodes")
+        node_x = as_c_array(mesh1d.node_x, np.double, "node_x")
+        node_y = as_c_array(mesh1d.node_y, np.double, "node_y")
+
         # Set the pointers
-        c_mesh1d.edge_nodes = as_ctypes(mesh1d.edge_nodes)
-        c_mesh1d.node_x = as_ctypes(mesh1d.node_x)
-        c_mesh1d.node_y = as_ctypes(mesh1d.node_y)
+        c_mesh1d.edge_nodes = edge_nodes.ctypes.data_as(c_int_p)
+        c_mesh1d.node_x = node_x.ctypes.data_as(c_double_p)
+        c_mesh1d.node_y = node_y.ctypes.data_as(c_double_p)
+
+        # The pointers do not own the memory, keep the arrays alive as long as the structure
+        c_mesh1d._arrays = (edge_nodes, node_x, node_y)
 
         # Set the sizes
-        c_mesh1d.num_nodes = mesh1d.node_x.size
-        c_mesh1d.num_edges = mesh1d.edge_nodes.size // 2
+        c_mesh1d.num_nodes = node_x.size
+        c_mesh1d.num_edges = edge_nodes.size // 2
 
         return c_mesh1d
 
@@ -354,9 +501,10 @@ class CMesh1d(Structure):
         node_x = np.empty(self.num_nodes, dtype=np.double)
         node_y = np.empty(self.num_nodes, dtype=np.double)
 
-        self.edge_nodes = as_ctypes(edge_nodes)
-        self.node_x = as_ctypes(node_x)
-        self.node_y = as_ctypes(node_y)
+        self.edge_nodes = edge_nodes.ctypes.data_as(c_int_p)
+        self.node_x = node_x.ctypes.data_as(c_double_p)
+        self.node_y = node_y.ctypes.data_as(c_double_p)
+        self._arrays = (edge_nodes, node_x, node_y)
 
         return Mesh1d(
             node_x,
@@ -396,9 +544,16 @@ class CContacts(Structure):
 
         c_contacts = CContacts()
 
-        c_contacts.mesh1d_indices = as_ctypes(contacts.mesh1d_indices)
-        c_contacts.mesh2d_indices = as_ctypes(contacts.mesh2d_indices)
-        c_contacts.num_contacts = contacts.mesh1d_indices.size
+        mesh1d_indices = as_c_array(contacts.mesh1d_indices, np.int32, "mesh1d_indices")
+
+        mesh2d_indices = as_c_array(contacts.mesh2d_indices, np.int32, "mesh2d_indices")
+
+        c_contacts.mesh1d_indices = mesh1d_indices.ctypes.data_as(c_int_p)
+        c_contacts.mesh2d_indices = mesh2d_indices.ctypes.data_as(c_int_p)
+        c_contacts.num_contacts = mesh1d_indices.size
+
+        # The pointers do not own the memory, keep the arrays alive as long as the structure
+        c_contacts._arrays = (mesh1d_indices, mesh2d_indices)
 
         return c_contacts
 
@@ -414,7 +569,8 @@ class CContacts(Structure):
         mesh1d_indices = np.empty(self.num_contacts, dtype=np.int32)
         mesh2d_indices = np.empty(self.num_contacts, dtype=np.int32)
 
-        self.mesh1d_indices = as_ctypes(mesh1d_indices)
-        self.mesh2d_indices = as_ctypes(mesh2d_indices)
+        self.mesh1d_indices = mesh1d_indices.ctypes.data_as(c_int_p)
+        self.mesh2d_indices = mesh2d_indices.ctypes.data_as(c_int_p)
+        self._arrays = (mesh1d_indices, mesh2d_indices)
 
         return Contacts(mesh1d_indices, mesh2d_indices)
@@ -8,3 +8,7 @@ class InputError(Error):
 
 class MeshKernelError(Error):
     """Exception raised for errors coming from the MeshKernel library."""
+
+
+class CopyWarning(UserWarning):
+    """Warning issued in strict mode when an input array has to be copied before passing it to MeshKernel."""
@@ -46,41 +46,36 @@ class Mesh2dFactory:
         node_rows = rows + 1
         node_columns = columns + 1
 
-        # Initialize helper objects
-        num_nodes = node_rows * node_columns
-        indices_values = np.empty((node_rows, node_columns))
-
         # Allocate memory for mesh arrays
+        num_nodes = node_rows * node_columns
         node_x = np.empty(num_nodes, dtype=np.double)
         node_y = np.empty(num_nodes, dtype=np.double)
         edge_nodes = np.empty(
             2 * (2 * num_nodes - node_rows - node_columns), dtype=np.int32
         )
 
-        # Calculate node positions
-        node_index = 0
-        for row_index in range(node_rows):
-            for column_index in range(node_columns):
-                node_x[node_index] = column_index * spacing_x + origin_x
-                node_y[node_index] = row_index * spacing_y + origin_y
-                indices_values[row_index, column_index] = (
-                    row_index * node_columns + column_index
-                )
-                node_index += 1
+        # Calculate node positions, nodes are numbered row by row
+        node_x.reshape(node_rows, node_columns)[:] = (
+            np.arange(node_columns) * spacing_x + origin_x
+        )
+        node_y.reshape(node_rows, node_columns)[:] = (
+            np.arange(node_rows) * spacing_y + origin_y
+        )[:, np.newaxis]
+        indices_values = np.arange(num_nodes, dtype=np.int32).reshape(
+            node_rows, node_columns
+        )
 
-        # Calculate edge indices
-        edge_index = 0
-        for row_index in range(node_rows - 1):
-            for column_index in range(node_columns):
-                edge_nodes[edge_index] = indices_values[row_index, column_index]
-                edge_index += 1
-                edge_nodes[edge_index] = indices_values[row_index + 1, column_index]
-                edge_index += 1
-        for row_index in range(node_rows):
-            for column_index in range(node_columns - 1):
-                edge_nodes[edge_index] = indices_values[row_index, column_index + 1]
-                edge_index += 1
-                edge_nodes[edge_index] = indices_values[row_index, column_index]
-                edge_index += 1
+        # Calculate edge indices, first the vertical edges and then the horizontal ones
+        num_vertical_edges = (node_rows - 1) * node_columns
+        vertical_edges = edge_nodes[: 2 * num_vertical_edges].reshape(
+            node_rows - 1, node_columns, 2
+        )
+        vertical_edges[:, :, 0] = indices_values[:-1, :]
+        vertical_edges[:, :, 1] = indices_values[1:, :]
+        horizontal_edges = edge_nodes[2 * num_vertical_edges :].reshape(
+            node_rows, node_columns - 1, 2
+        )
+        horizontal_edges[:, :, 0] = indices_values[:, 1:]
+        horizontal_edges[:, :, 1] = indices_values[:, :-1]
 
         return Mesh2d(node_x, node_y, edge_nodes)
@@ -0,0 +1,561 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+from numpy import ndarray
+
+from meshkernel.errors import InputError
+from meshkernel.py_structures import Contacts, Mesh1d, Mesh2d, Mesh2dLocation
+
+# The number of rows of a variable which are read or written at once
+_CHUNK_SIZE = 1 << 20
+
+_FILL_VALUE = -999
+
+
+def _netcdf4():
+    """For internal use only.
+
+    Imports the optional netCDF4 package, which is installed with `pip install meshkernel[netcdf]`.
+
+    Raises:
+        ImportError: Raised when netCDF4 is not installed.
+
+    Returns:
+        module: The netCDF4 module.
+    """
+
+    try:
+        import netCDF4
+    except ImportError as error:
+        raise ImportError(
+            "Reading and writing UGRID files requires netCDF4, "
+            "install it with `pip install meshkernel[netcdf]`"
+        ) from error
+
+    return netCDF4
+
+
+def _chunks(size: int) -> Iterator[slice]:
+    for start in range(0, size, _CHUNK_SIZE):
+        yield slice(start, min(start + _CHUNK_SIZE, size))
+
+
+def _read_variable(variable, dtype: type) -> ndarray:
+    """For internal use only.
+
+    Reads a variable in chunks into an array of the given data type.
+
+    Args:
+        variable (netCDF4.Variable): The variable to read.
+        dtype (type): The data type of the returned array.
+
+    Returns:
+        ndarray: The values of the variable.
+    """
+
+    variable.set_auto_maskandscale(False)
+    values = np.empty(variable.shape, dtype=dtype)
+    for rows in _chunks(variable.shape[0]):
+        values[rows] = variable[rows]
+
+    return values
+
+
+def _write_variable(variable, values: ndarray) -> None:
+    """For internal use only.
+
+    Writes an array in chunks into a variable.
+
+    Args:
+        variable (netCDF4.Variable): The variable to write.
+        values (ndarray): The values to write.
+    """
+
+    variable.set_auto_maskandscale(False)
+    for rows in _chunks(values.shape[0]):
+        variable[rows] = values[rows]
+
+
+def _read_connectivity(variable) -> ndarray:
+    """For internal use only.
+
+    Reads an index variable, converting the indices to start at 0.
+
+    Args:
+        variable (netCDF4.Variable): The index variable.
+
+    Returns:
+        ndarray: The 0-based indices as integer array.
+    """
+
+    values = _read_variable(variable, np.int32)
+    start_index = int(getattr(variable, "start_index", 0))
+    if start_index != 0:
+        fill_value = int(getattr(variable, "_FillValue", _FILL_VALUE))
+        values[values != fill_value] -= start_index
+
+    return values
+
+
+def _create_variable(
+    dataset, name: str, dtype: type, dimensions: Tuple[str, ...], **attributes
+):
+    """For internal use only.
+
+    Creates a chunked variable with the given attributes.
+
+    Returns:
+        netCDF4.Variable: The created variable.
+    """
+
+    sizes = [len(dataset.dimensions[dimension]) for dimension in dimensions]
+    chunksizes = [min(max(sizes[0], 1), _CHUNK_SIZE)] + [
+        max(size, 1) for size in sizes[1:]
+    ]
+    fill_value = attributes.pop("_FillValue", None)
+    variable = dataset.createVariable(
+        name,
+        dtype,
+        dimensions,
+        chunksizes=chunksizes,
+        fill_value=fill_value,
+    )
+    variable.setncatts(attributes)
+
+    return variable
+
+
+def _find_topology(dataset, name: Optional[str], cf_role: str, **attributes):
+    """For internal use only.
+
+    Finds a topology variable by name, or the first one with the given `cf_role` and attributes.
+
+    Raises:
+        InputError: Raised when no such topology variable exists.
+
+    Returns:
+        netCDF4.Variable: The topology variable.
+    """
+
+    if name is not None:
+        if name not in dataset.variables:
+            raise InputError(f"The file has no variable {name}")
+        return dataset.variables[name]
+
+    for variable in dataset.variables.values():
+        if getattr(variable, "cf_role", None) == cf_role and all(
+            str(getattr(variable, key, None)) == str(value)
+            for key, value in attributes.items()
+        ):
+            return variable
+
+    raise InputError(f"The file has no variable with cf_role {cf_role}")
+
+
+def _topology_variables(dataset, topology, attribute: str) -> Tuple:
+    names = getattr(topology, attribute, "").split()
+    return tuple(dataset.variables[name] for name in names)
+
+
+def write_mesh2d(
+    path: Union[str, Path], mesh2d: Mesh2d, name: str = "mesh2d", mode: str = "w"
+) -> None:
+    """Writes a Mesh2d to a UGRID netCDF file.
+
+    The face nodes are written as a 2D array padded with fill values, which is converted in chunks of faces.
+    netCDF stores a dimension of size 0 as unlimited, so the dimensions and variables of locations
+    without any elements, like the faces of a mesh without faces, are left out.
+
+    Args:
+        path (Union[str, Path]): The path of the file.
+        mesh2d (Mesh2d): The Mesh2d to write.
+        name (str, optional): The name of the mesh topology variable. Default is `mesh2d`.
+        mode (str, optional): `w` to create a new file or `a` to add the mesh to an existing file. Default is `w`.
+    """
+
+    netCDF4 = _netcdf4()
+
+    num_nodes = mesh2d.node_x.size
+    num_edges = mesh2d.edge_nodes.size // 2
+    num_faces = mesh2d.nodes_per_face.size
+    max_face_nodes = max(int(mesh2d.nodes_per_face.max()), 1) if num_faces else 0
+
+    with netCDF4.Dataset(path, mode) as dataset:
+        dataset.Conventions = "CF-1.8 UGRID-1.0"
+        topology = dataset.createVariable(name, "i4")
+        topology.setncatts(
+            {
+                "cf_role": "mesh_topology",
+                "long_name": "Topology data of 2D mesh",
+                "topology_dimension": 2,
+            }
+        )
+
+        if num_nodes:
+            dataset.createDimension(f"{name}_nNodes", num_nodes)
+            topology.node_coordinates = f"{name}_node_x {name}_node_y"
+            topology.node_dimension = f"{name}_nNodes"
+        if num_edges:
+            dataset.createDimension(f"{name}_nEdges", num_edges)
+            if "Two" not in dataset.dimensions:
+                dataset.createDimension("Two", 2)
+            topology.edge_node_connectivity = f"{name}_edge_nodes"
+            topology.edge_dimension = f"{name}_nEdges"
+            if mesh2d.edge_x.size:
+                topology.edge_coordinates = f"{name}_edge_x {name}_edge_y"
+        if num_faces:
+            dataset.createDimension(f"{name}_nFaces", num_faces)
+            dataset.createDimension(f"{name}_nMax_face_nodes", max_face_nodes)
+            topology.face_node_connectivity = f"{name}_face_nodes"
+            topology.face_dimension = f"{name}_nFaces"
+            topology.max_face_nodes_dimension = f"{name}_nMax_face_nodes"
+            if mesh2d.face_x.size:
+                topology.face_coordinates = f"{name}_face_x {name}_face_y"
+
+        for location, dimension, size, coordinates in (
+            ("node", "nNodes", num_nodes, (mesh2d.node_x, mesh2d.node_y)),
+            ("edge", "nEdges", num_edges, (mesh2d.edge_x, mesh2d.edge_y)),
+            ("face", "nFaces", num_faces, (mesh2d.face_x, mesh2d.face_y)),
+        ):
+            if size == 0 or coordinates[0].size == 0:
+                continue
+            for axis, values in zip("xy", coordinates):
+                variable = _create_variable(
+                    dataset,
+                    f"{name}_{location}_{axis}",
+                    "f8",
+                    (f"{name}_{dimension}",),
+                    mesh=name,
+                    location=location,
+                    standard_name=f"projection_{axis}_coordinate",
+                    long_name=f"{axis}-coordinate of mesh {location}s",
+                )
+                _write_variable(variable, values)
+
+        if num_edges:
+            edge_nodes = _create_variable(
+                dataset,
+                f"{name}_edge_nodes",
+                "i4",
+                (f"{name}_nEdges", "Two"),
+                cf_role="edge_node_connectivity",
+                mesh=name,
+                location="edge",
+                long_name="Start and end nodes of mesh edges",
+                start_index=0,
+            )
+            _write_variable(edge_nodes, mesh2d.edge_nodes.reshape(-1, 2))
+
+        if num_faces == 0:
+            return
+
+        face_nodes = _create_variable(
+            dataset,
+            f"{name}_face_nodes",
+            "i4",
+            (f"{name}_nFaces", f"{name}_nMax_face_nodes"),
+            cf_role="face_node_connectivity",
+            mesh=name,
+            location="face",
+            long_name="Vertex nodes of mesh faces (counterclockwise)",
+            start_index=0,
+            _FillValue=np.int32(_FILL_VALUE),
+        )
+        face_nodes.set_auto_maskandscale(False)
+        offsets = np.concatenate(([0], np.cumsum(mesh2d.nodes_per_face)))
+        for faces in _chunks(num_faces):
+            nodes_per_face = mesh2d.nodes_per_face[faces]
+            padded = np.full(
+                (nodes_per_face.size, max_face_nodes), _FILL_VALUE, dtype=np.int32
+            )
+            padded[
+                np.arange(max_face_nodes) < nodes_per_face[:, np.newaxis]
+            ] = mesh2d.face_nodes[offsets[faces.start] : offsets[faces.stop]]
+            face_nodes[faces] = padded
+
+
+def read_mesh2d(
+    path: Union[str, Path],
+    name: Optional[str] = None,
+    locations: Optional[Iterable[Mesh2dLocation]] = None,
+) -> Mesh2d:
+    """Reads a Mesh2d from a UGRID netCDF file.
+
+    Only the variables of the requested locations are read. Face nodes padded with fill values
+    are compacted in chunks of faces.
+
+    Args:
+        path (Union[str, Path]): The path of the file.
+        name (str, optional): The name of the mesh topology variable. Default is the first 2D mesh topology.
+        locations (Iterable[Mesh2dLocation], optional): The locations of the arrays to read, the other arrays
+                                                        are empty. Default is all locations.
+
+    Raises:
+        InputError: Raised when the file has no such mesh topology.
+
+    Returns:
+        Mesh2d: The Mesh2d read from the file.
+    """
+
+    netCDF4 = _netcdf4()
+    locations = set(Mesh2dLocation if locations is None else locations)
+    mesh2d = Mesh2d(
+        np.empty(0, dtype=np.double),
+        np.empty(0, dtype=np.double),
+        np.empty(0, dtype=np.int32),
+    )
+
+    with netCDF4.Dataset(path, "r") as dataset:
+        topology = _find_topology(dataset, name, "mesh_topology", topology_dimension=2)
+
+        node_coordinates = _topology_variables(dataset, topology, "node_coordinates")
+        if Mesh2dLocation.NODES in locations and node_coordinates:
+            mesh2d.node_x = _read_variable(node_coordinates[0], np.double)
+            mesh2d.node_y = _read_variable(node_coordinates[1], np.double)
+
+        edge_nodes = _topology_variables(dataset, topology, "edge_node_connectivity")
+        if Mesh2dLocation.EDGES in locations and edge_nodes:
+            mesh2d.edge_nodes = _read_connectivity(edge_nodes[0]).ravel()
+            edge_coordinates = _topology_variables(
+                dataset, topology, "edge_coordinates"
+            )
+            if edge_coordinates:
+                mesh2d.edge_x = _read_variable(edge_coordinates[0], np.double)
+                mesh2d.edge_y = _read_variable(edge_coordinates[1], np.double)
+
+        face_nodes = _topology_variables(dataset, topology, "face_node_connectivity")
+        if Mesh2dLocation.FACES in locations and face_nodes:
+            mesh2d.face_nodes, mesh2d.nodes_per_face = _read_face_nodes(face_nodes[0])
+            face_coordinates = _topology_variables(
+                dataset, topology, "face_coordinates"
+            )
+            if face_coordinates:
+                mesh2d.face_x = _read_variable(face_coordinates[0], np.double)
+                mesh2d.face_y = _read_variable(face_coordinates[1], np.double)
+
+    return mesh2d
+
+
+def _read_face_nodes(variable) -> Tuple[ndarray, ndarray]:
+    """For internal use only.
+
+    Reads face nodes padded with fill values in chunks of faces and compacts them.
+
+    Args:
+        variable (netCDF4.Variable): The face node connectivity variable.
+
+    Returns:
+        Tuple[ndarray, ndarray]: The face nodes and the number of nodes per face.
+    """
+
+    variable.set_auto_maskandscale(False)
+    fill_value = int(getattr(variable, "_FillValue", _FILL_VALUE))
+    start_index = int(getattr(variable, "start_index", 0))
+
+    num_faces = variable.shape[0]
+    nodes_per_face = np.empty(num_faces, dtype=np.int32)
+    face_nodes = []
+    for faces in _chunks(num_faces):
+        padded = variable[faces]
+        valid = (padded != fill_value) & (padded >= start_index)
+        nodes_per_face[faces] = valid.sum(axis=1)
+        face_nodes.append((padded[valid] - start_index).astype(np.int32))
+
+    if not face_nodes:
+        return np.empty(0, dtype=np.int32), nodes_per_face
+    return np.concatenate(face_nodes), nodes_per_face
+
+
+def write_mesh1d(
+    path: Union[str, Path], mesh1d: Mesh1d, name: str = "mesh1d", mode: str = "a"
+) -> None:
+    """Writes a Mesh1d to a UGRID netCDF file.
+
+    netCDF stores a dimension of size 0 as unlimited, so the dimensions and variables of
+    the nodes or edges are left out when the mesh has none.
+
+    Args:
+        path (Union[str, Path]): The path of the file.
+        mesh1d (Mesh1d): The Mesh1d to write.
+        name (str, optional): The name of the mesh topology variable. Default is `mesh1d`.
+        mode (str, optional): `w` to create a new file or `a` to add the mesh to an existing file. Default is `a`.
+    """
+
+    netCDF4 = _netcdf4()
+
+    num_nodes = mesh1d.node_x.size
+    num_edges = mesh1d.edge_nodes.size // 2
+
+    with netCDF4.Dataset(path, mode) as dataset:
+        dataset.Conventions = "CF-1.8 UGRID-1.0"
+        topology = dataset.createVariable(name, "i4")
+        topology.setncatts(
+            {
+                "cf_role": "mesh_topology",
+                "long_name": "Topology data of 1D mesh",
+                "topology_dimension": 1,
+            }
+        )
+
+        if num_nodes == 0:
+            return
+
+        dataset.createDimension(f"{name}_nNodes", num_nodes)
+        topology.node_coordinates = f"{name}_node_x {name}_node_y"
+        topology.node_dimension = f"{name}_nNodes"
+        for axis, values in zip("xy", (mesh1d.node_x, mesh1d.node_y)):
+            variable = _create_variable(
+                dataset,
+                f"{name}_node_{axis}",
+                "f8",
+                (f"{name}_nNodes",),
+                mesh=name,
+                location="node",
+                standard_name=f"projection_{axis}_coordinate",
+                long_name=f"{axis}-coordinate of mesh nodes",
+            )
+            _write_variable(variable, values)
+
+        if num_edges == 0:
+            return
+
+        dataset.createDimension(f"{name}_nEdges", num_edges)
+        if "Two" not in dataset.dimensions:
+            dataset.createDimension("Two", 2)
+        topology.edge_node_connectivity = f"{name}_edge_nodes"
+        topology.edge_dimension = f"{name}_nEdges"
+        edge_nodes = _create_variable(
+            dataset,
+            f"{name}_edge_nodes",
+            "i4",
+            (f"{name}_nEdges", "Two"),
+            cf_role="edge_node_connectivity",
+            mesh=name,
+            location="edge",
+            long_name="Start and end nodes of mesh edges",
+            start_index=0,
+        )
+        _write_variable(edge_nodes, mesh1d.edge_nodes.reshape(-1, 2))
+
+
+def read_mesh1d(path: Union[str, Path], name: Optional[str] = None) -> Mesh1d:
+    """Reads a Mesh1d from a UGRID netCDF file.
+
+    Args:
+        path (Union[str, Path]): The path of the file.
+        name (str, optional): The name of the mesh topology variable. Default is the first 1D mesh topology.
+
+    Raises:
+        InputError: Raised when the file has no such mesh topology.
+
+    Returns:
+        Mesh1d: The Mesh1d read from the file.
+    """
+
+    netCDF4 = _netcdf4()
+
+    with netCDF4.Dataset(path, "r") as dataset:
+        topology = _find_topology(dataset, name, "mesh_topology", topology_dimension=1)
+        mesh1d = Mesh1d(
+            np.empty(0, dtype=np.double),
+            np.empty(0, dtype=np.double),
+            np.empty(0, dtype=np.int32),
+        )
+
+        node_coordinates = _topology_variables(dataset, topology, "node_coordinates")
+        if node_coordinates:
+            mesh1d.node_x = _read_variable(node_coordinates[0], np.double)
+            mesh1d.node_y = _read_variable(node_coordinates[1], np.double)
+
+        edge_nodes = _topology_variables(dataset, topology, "edge_node_connectivity")
+        if edge_nodes:
+            mesh1d.edge_nodes = _read_connectivity(edge_nodes[0]).ravel()
+
+        return mesh1d
+
+
+def write_contacts(
+    path: Union[str, Path],
+    contacts: Contacts,
+    name: str = "mesh1d_mesh2d_contacts",
+    mesh1d_name: str = "mesh1d",
+    mesh2d_name: str = "mesh2d",
+    mode: str = "a",
+) -> None:
+    """Writes Contacts to a UGRID netCDF file as links between Mesh1d nodes and Mesh2d faces.
+
+    netCDF stores a dimension of size 0 as unlimited, so without any contacts the contact variable
+    is written as a scalar without values.
+
+    Args:
+        path (Union[str, Path]): The path of the file.
+        contacts (Contacts): The contacts to write.
+        name (str, optional): The name of the contact variable. Default is `mesh1d_mesh2d_contacts`.
+        mesh1d_name (str, optional): The name of the Mesh1d topology variable. Default is `mesh1d`.
+        mesh2d_name (str, optional): The name of the Mesh2d topology variable. Default is `mesh2d`.
+        mode (str, optional): `w` to create a new file or `a` to add the contacts to an existing file.
+                              Default is `a`.
+    """
+
+    netCDF4 = _netcdf4()
+
+    attributes = {
+        "cf_role": "mesh_topology_contact",
+        "contact": f"{mesh1d_name}: node {mesh2d_name}: face",
+        "long_name": "Contacts between mesh1d nodes and mesh2d faces",
+        "start_index": 0,
+    }
+
+    with netCDF4.Dataset(path, mode) as dataset:
+        dataset.Conventions = "CF-1.8 UGRID-1.0"
+        if contacts.mesh1d_indices.size == 0:
+            variable = dataset.createVariable(name, "i4")
+            variable.setncatts(attributes)
+            return
+
+        dataset.createDimension(f"{name}_nContacts", contacts.mesh1d_indices.size)
+        if "Two" not in dataset.dimensions:
+            dataset.createDimension("Two", 2)
+
+        variable = _create_variable(
+            dataset, name, "i4", (f"{name}_nContacts", "Two"), **attributes
+        )
+        _write_variable(
+            variable,
+            np.column_stack((contacts.mesh1d_indices, contacts.mesh2d_indices)),
+        )
+
+
+def read_contacts(path: Union[str, Path], name: Optional[str] = None) -> Contacts:
+    """Reads Contacts between Mesh1d nodes and Mesh2d faces from a UGRID netCDF file.
+
+    Args:
+        path (Union[str, Path]): The path of the file.
+        name (str, optional): The name of the contact variable. Default is the first contact variable.
+
+    Raises:
+        InputError: Raised when the file has no such contact variable.
+
+    Returns:
+        Contacts: The contacts read from the file.
+    """
+
+    netCDF4 = _netcdf4()
+
+    with netCDF4.Dataset(path, "r") as dataset:
+        variable = _find_topology(dataset, name, "mesh_topology_contact")
+        if variable.ndim == 0:
+            return Contacts(np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32))
+        indices = _read_connectivity(variable)
+
+        # The order of the meshes is given by the contact attribute, e.g. "mesh1d: node mesh2d: face"
+        locations = getattr(variable, "contact", "").split()[1::2]
+        if locations == ["face", "node"]:
+            indices = indices[:, ::-1]
+
+        return Contacts(
+            np.ascontiguousarray(indices[:, 0]), np.ascontiguousarray(indices[:, 1])
+        )
@@ -0,0 +1,304 @@
+import platform
+import threading
+from ctypes import CDLL, POINTER, c_char_p, c_double, c_int, c_size_t
+from pathlib import Path
+from typing import Optional
+
+from meshkernel.c_structures import (
+    CContacts,
+    CGeometryList,
+    CMesh1d,
+    CMesh2d,
+    CMeshRefinementParameters,
+    COrthogonalizationParameters,
+)
+
+# The argument types of the C functions of the MeshKernel API used by MeshKernelPy.
+# All functions return an integer status code, see `meshkernel.meshkernel.Status`.
+PROTOTYPES = {
+    "mkernel_allocate_state": (c_int, POINTER(c_int)),
+    "mkernel_deallocate_state": (c_int,),
+    "mkernel_get_error": (POINTER(c_char_p),),
+    "mkernel_get_version": (POINTER(c_char_p),),
+    "mkernel_get_splines": (POINTER(CGeometryList), POINTER(CGeometryList), c_int),
+    "mkernel_mesh2d_set": (c_int, POINTER(CMesh2d)),
+    "mkernel_mesh2d_get_dimensions": (c_int, POINTER(CMesh2d)),
+    "mkernel_mesh2d_get_data": (c_int, POINTER(CMesh2d)),
+    "mkernel_mesh2d_delete": (c_int, POINTER(CGeometryList), c_int, c_int),
+    "mkernel_mesh2d_insert_edge": (c_int, c_int, c_int, POINTER(c_int)),
+    "mkernel_mesh2d_insert_node": (c_int, c_double, c_double, POINTER(c_int)),
+    "mkernel_mesh2d_delete_node": (c_int, c_int),
+    "mkernel_mesh2d_move_node": (c_int, c_double, c_double, c_int),
+    "mkernel_mesh2d_delete_edge": (c_int, c_double, c_double),
+    "mkernel_mesh2d_get_edge": (c_int, c_double, c_double, POINTER(c_int)),
+    "mkernel_mesh2d_get_node_index": (
+        c_int,
+        c_double,
+        c_double,
+        c_double,
+        POINTER(c_int),
+    ),
+    "mkernel_mesh2d_count_hanging_edges": (c_int, POINTER(c_int)),
+    "mkernel_mesh2d_get_hanging_edges": (c_int, POINTER(c_int)),
+    "mkernel_mesh2d_delete_hanging_edges": (c_int,),
+    "mkernel_mesh2d_make_mesh_from_polygon": (c_int, POINTER(CGeometryList)),
+    "mkernel_mesh2d_make_mesh_from_samples": (c_int, POINTER(CGeometryList)),
+    "mkernel_mesh2d_refine_based_on_samples": (
+        c_int,
+        POINTER(CGeometryList),
+        c_double,
+        c_int,
+        POINTER(CMeshRefinementParameters),
+    ),
+    "mkernel_mesh2d_refine_based_on_polygon": (
+        c_int,
+        POINTER(CGeometryList),
+        POINTER(CMeshRefinementParameters),
+    ),
+    "mkernel_mesh2d_flip_edges": (
+        c_int,
+        c_int,
+        c_int,
+        POINTER(CGeometryList),
+        POINTER(CGeometryList),
+    ),
+    "mkernel_mesh2d_count_obtuse_triangles": (c_int, POINTER(c_int)),
+    "mkernel_mesh2d_get_obtuse_triangles_mass_centers": (c_int, POINTER(CGeometryList)),
+    "mkernel_mesh2d_count_small_flow_edge_centers": (c_int, c_double, POINTER(c_int)),
+    "mkernel_mesh2d_get_small_flow_edge_centers": (
+        c_int,
+        c_double,
+        POINTER(CGeometryList),
+    ),
+    "mkernel_mesh2d_delete_small_flow_edges_and_small_triangles": (
+        c_int,
+        c_double,
+        c_double,
+    ),
+    "mkernel_mesh2d_count_mesh_boundaries_as_polygons": (c_int, POINTER(c_int)),
+    "mkernel_mesh2d_get_mesh_boundaries_as_polygons": (c_int, POINTER(CGeometryList)),
+    "mkernel_mesh2d_merge_nodes": (c_int, POINTER(CGeometryList), c_double),
+    "mkernel_mesh2d_merge_two_nodes": (c_int, c_int, c_int),
+    "mkernel_mesh2d_count_nodes_in_polygons": (
+        c_int,
+        POINTER(CGeometryList),
+        c_int,
+        POINTER(c_int),
+    ),
+    "mkernel_mesh2d_get_nodes_in_polygons": (
+        c_int,
+        POINTER(CGeometryList),
+        c_int,
+        POINTER(c_int),
+    ),
+    "mkernel_mesh2d_compute_orthogonalization": (
+        c_int,
+        c_int,
+        POINTER(COrthogonalizationParameters),
+        POINTER(CGeometryList),
+        POINTER(CGeometryList),
+    ),
+    "mkernel_mesh2d_get_orthogonality": (c_int, POINTER(CGeometryList)),
+    "mkernel_mesh2d_get_smoothness": (c_int, POINTER(CGeometryList)),
+    "mkernel_mesh2d_triangulation_interpolation": (
+        c_int,
+        POINTER(CGeometryList),
+        c_int,
+        POINTER(CGeometryList),
+    ),
+    "mkernel_mesh2d_averaging_interpolation": (
+        c_int,
+        POINTER(CGeometryList),
+        c_int,
+        c_int,
+        c_double,
+        c_size_t,
+        POINTER(CGeometryList),
+    ),
+    "mkernel_polygon_count_refine": (
+        c_int,
+        POINTER(CGeometryList),
+        c_int,
+        c_int,
+        c_double,
+        POINTER(c_int),
+    ),
+    "mkernel_polygon_refine": (
+        c_int,
+        POINTER(CGeometryList),
+        c_int,
+        c_int,
+        c_double,
+        POINTER(CGeometryList),
+    ),
+    "mkernel_polygon_get_included_points": (
+        c_int,
+        POINTER(CGeometryList),
+        POINTER(CGeometryList),
+        POINTER(CGeometryList),
+    ),
+    "mkernel_mesh1d_set": (c_int, POINTER(CMesh1d)),
+    "mkernel_mesh1d_get_dimensions": (c_int, POINTER(CMesh1d)),
+    "mkernel_mesh1d_get_data": (c_int, POINTER(CMesh1d)),
+    "mkernel_contacts_get_dimensions": (c_int, POINTER(CContacts)),
+    "mkernel_contacts_get_data": (c_int, POINTER(CContacts)),
+    "mkernel_contacts_compute_single": (c_int, POINTER(c_int), POINTER(CGeometryList)),
+    "mkernel_contacts_compute_multiple": (c_int, POINTER(c_int)),
+    "mkernel_contacts_compute_with_polygons": (
+        c_int,
+        POINTER(c_int),
+        POINTER(CGeometryList),
+    ),
+    "mkernel_contacts_compute_with_points": (
+        c_int,
+        POINTER(c_int),
+        POINTER(CGeometryList),
+    ),
+    "mkernel_contacts_compute_boundary": (
+        c_int,
+        POINTER(c_int),
+        POINTER(CGeometryList),
+        c_double,
+    ),
+}
+
+_library: Optional[CDLL] = None
+_library_lock = threading.Lock()
+
+
+def get_library_path() -> Path:
+    """Get the path of the MeshKernel library shipped with MeshKernelPy.
+
+    Raises:
+        OSError: This gets raised in case MeshKernel is used within an unsupported OS.
+
+    Returns:
+        Path: The path of the MeshKernel library.
+    """
+
+    system = platform.system()
+    if system == "Windows":
+        return Path(__file__).parent / "MeshKernelApi.dll"
+    elif system == "Linux":
+        return Path(__file__).parent / "libMeshKernelApi.so"
+    elif system == "Darwin":
+        return Path(__file__).parent / "libMeshKernelApi.dylib"
+    else:
+        raise OSError(f"Unsupported operating system: {system}")
+
+
+def load_library() -> CDLL:
+    """Intended for internal use only.
+
+    Loads the MeshKernel library, resolves its functions and sets their prototypes.
+    This happens only once per process, subsequent calls return the same library object.
+    The function is thread-safe.
+
+    Raises:
+        OSError: This gets raised in case MeshKernel is used within an unsupported OS.
+
+    Returns:
+        CDLL: The loaded MeshKernel library.
+    """
+
+    global _library
+
+    library = _library
+    if library is not None:
+        return library
+
+    with _library_lock:
+        if _library is None:
+            library = CDLL(str(get_library_path()))
+
+            # Accessing a function of a `CDLL` caches it as an attribute of the library object,
+            # so every function is resolved and prototyped exactly once
+            for function_name, argtypes in PROTOTYPES.items():
+                function = getattr(library, function_name)
+                function.argtypes = argtypes
+                function.restype = c_int
+
+            _library = library
+
+    return _library
+
+
+class StateLock:
+    """Intended for internal use only.
+
+    Guards the states of the MeshKernel library, which are kept in a container global to the process.
+    Calls on existing states share the lock, so that independent states can be used from several threads
+    at the same time, since ctypes releases the GIL during the calls.
+    Allocating and deallocating states changes the container and holds the lock exclusively.
+    Threads waiting for the exclusive lock take precedence over new shared holders.
+    """
+
+    def __init__(self):
+        # A reentrant lock, since a garbage collected `MeshKernel` may deallocate its state
+        # while the current thread is inside one of these methods
+        self._lock = threading.RLock()
+        self._condition = threading.Condition(self._lock)
+        self._shared_holders = 0
+        self._exclusive_owner: Optional[int] = None
+        self._exclusive_waiting = 0
+        self._local = threading.local()
+
+    def _shared_depth(self) -> int:
+        return getattr(self._local, "depth", 0)
+
+    def acquire_shared(self) -> None:
+        """Acquires the lock shared with other threads.
+        A thread already holding the lock shared acquires it again without waiting.
+        """
+
+        # The depth is increased first, so that a deallocation triggered by the garbage collector
+        # in the meantime does not wait for this thread
+        depth = self._shared_depth()
+        self._local.depth = depth + 1
+        with self._lock:
+            if depth == 0:
+                while self._exclusive_owner is not None or self._exclusive_waiting:
+                    self._condition.wait()
+            self._shared_holders += 1
+
+    def release_shared(self) -> None:
+        """Releases the lock acquired by `acquire_shared`."""
+
+        with self._lock:
+            self._shared_holders -= 1
+            if self._shared_holders == 0 and self._exclusive_waiting:
+                self._condition.notify_all()
+        self._local.depth -= 1
+
+    def acquire_exclusive(self) -> bool:
+        """Acquires the lock exclusively, waiting for all other holders to release it.
+
+        Returns:
+            bool: Whether the lock has been acquired. It is not acquired if the current thread holds it already,
+                  since waiting would never end. This can happen when a `MeshKernel` instance is garbage collected
+                  while the thread is calling the library.
+        """
+
+        thread_id = threading.get_ident()
+        if self._shared_depth() > 0 or self._exclusive_owner == thread_id:
+            return False
+
+        with self._lock:
+            self._exclusive_waiting += 1
+            while self._exclusive_owner is not None or self._shared_holders:
+                self._condition.wait()
+            self._exclusive_waiting -= 1
+            self._exclusive_owner = thread_id
+
+        return True
+
+    def release_exclusive(self) -> None:
+        """Releases the lock acquired by `acquire_exclusive`."""
+
+        with self._lock:
+            self._exclusive_owner = None
+            self._condition.notify_all()
+
+
+# The lock guarding the states of the MeshKernel library
+state_lock = StateLock()
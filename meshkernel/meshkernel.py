@@ -1,14 +1,12 @@
 import logging
-import platform
-from ctypes import CDLL, byref, c_char_p, c_double, c_int, c_size_t
+from ctypes import byref, c_char_p, c_int
 from enum import IntEnum, unique
-from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable, List, Optional, Tuple
 
 import numpy as np
 from numpy import ndarray
-from numpy.ctypeslib import as_ctypes
 
+from meshkernel.arrays import as_c_array
 from meshkernel.c_structures import (
     CContacts,
     CGeometryList,
@@ -16,8 +14,10 @@ from meshkernel.c_structures import (
     CMesh2d,
     CMeshRefinementParameters,
     COrthogonalizationParameters,
+    c_int_p,
 )
 from meshkernel.errors import InputError, MeshKernelError
+from meshkernel.library import load_library, state_lock
 from meshkernel.py_structures import (
     AveragingMethod,
     Contacts,
@@ -34,6 +34,12 @@ from meshkernel.version import __version__
 
 logger = logging.getLogger(__name__)
 
+# States of garbage collected instances, which could not be deallocated immediately
+_pending_deallocations: List[c_int] = []
+
+# Part of the message of the error raised by MeshKernel when no node is found within the search radius
+_NODE_NOT_FOUND_MESSAGE = "could not find"
+
 
 @unique
 class Status(IntEnum):
@@ -43,7 +49,17 @@ class Status(IntEnum):
 
 
 class MeshKernel:
-    """This class is the entry point for interacting with the MeshKernel library"""
+    """This class is the entry point for interacting with the MeshKernel library
+
+    Thread safety:
+        Different instances can be used from different threads at the same time.
+        The GIL is released while MeshKernel computes, so independent meshes are processed in parallel.
+        A single instance must not be used by several threads at the same time.
+
+        The MeshKernel library keeps the message of the last error in a single buffer for the whole process.
+        The status of every call is checked separately, so a failing call always raises a `MeshKernelError`.
+        However, if calls on other instances fail at the same time, its message may stem from one of them.
+    """
 
     def __init__(self, is_geographic: bool = False):
         """Constructor of MeshKernel
@@ -56,18 +72,12 @@ class MeshKernel:
             OSError: This gets raised in case MeshKernel is used within an unsupported OS.
         """
 
-        # Determine OS
-        system = platform.system()
-        if system == "Windows":
-            lib_path = Path(__file__).parent / "MeshKernelApi.dll"
-        elif system == "Linux":
-            lib_path = Path(__file__).parent / "libMeshKernelApi.so"
-        elif system == "Darwin":
-            lib_path = Path(__file__).parent / "libMeshKernelApi.dylib"
-        else:
-            raise OSError(f"Unsupported operating system: {system}")
-
-        self.lib = CDLL(str(lib_path))
+        self.lib = load_library()
+        self._mesh2d_scratch = Mesh2d(
+            np.empty(0, dtype=np.double),
+            np.empty(0, dtype=np.double),
+            np.empty(0, dtype=np.int32),
+        )
         self._allocate_state(is_geographic)
 
     def __del__(self):
@@ -81,9 +91,9 @@ class MeshKernel:
         """
 
         self._meshkernelid = c_int()
-        self._execute_function(
+        self._execute_function_exclusively(
             self.lib.mkernel_allocate_state,
-            c_int(is_geographic),
+            is_geographic,
             byref(self._meshkernelid),
         )
 
@@ -95,10 +105,13 @@ class MeshKernel:
         should never be called manually
         """
 
-        self._execute_function(
+        if not self._execute_function_exclusively(
             self.lib.mkernel_deallocate_state,
             self._meshkernelid,
-        )
+        ):
+            # The garbage collector destroyed this instance while the current thread was calling MeshKernel,
+            # the state is deallocated with the next allocation or deallocation
+            _pending_deallocations.append(self._meshkernelid)
 
     def mesh2d_set(self, mesh2d: Mesh2d) -> None:
         """Sets the two-dimensional mesh state of the MeshKernel.
@@ -114,17 +127,35 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_set, self._meshkernelid, byref(c_mesh2d)
         )
 
-    def mesh2d_get(self) -> Mesh2d:
+    def mesh2d_get(
+        self,
+        out: Optional[Mesh2d] = None,
+        locations: Optional[Iterable[Mesh2dLocation]] = None,
+    ) -> Mesh2d:
         """Gets the two-dimensional mesh state from the MeshKernel.
 
         Please note that this involves a copy of the data.
+        In order to avoid allocating new arrays for every call, a previously returned Mesh2d
+        can be passed as `out`. Its memory is then reused and only grows when the mesh dimensions increase.
+
+        If only the arrays of some locations are needed, for example only the node coordinates,
+        these locations can be passed as `locations`. The arrays of the other locations are left empty.
+        Since the MeshKernel library always fills all arrays, their data is received in internal buffers.
+        These buffers are allocated by the first such call, so its peak memory is not reduced,
+        and they are kept for the lifetime of this instance. The saving only applies to repeated calls,
+        which reuse the buffers instead of allocating the arrays of all locations again.
+
+        Args:
+            out (Mesh2d, optional): The Mesh2d instance which is filled in place.
+            locations (Iterable[Mesh2dLocation], optional): The locations of which to get the arrays.
+                                                            Default is all locations.
 
         Returns:
-            Mesh2d: A copy of the two-dimensional mesh state.
+            Mesh2d: A copy of the two-dimensional mesh state, `out` if it is given.
         """
 
         c_mesh2d = self._mesh2d_get_dimensions()
-        mesh2d = c_mesh2d.allocate_memory()
+        mesh2d = c_mesh2d.allocate_memory(out, locations, self._mesh2d_scratch)
         self._execute_function(
             self.lib.mkernel_mesh2d_get_data, self._meshkernelid, byref(c_mesh2d)
         )
@@ -167,8 +198,8 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_delete,
             self._meshkernelid,
             byref(c_geometry_list),
-            c_int(delete_option),
-            c_int(invert_deletion),
+            delete_option,
+            invert_deletion,
         )
 
     def mesh2d_insert_edge(self, start_node: int, end_node: int) -> int:
@@ -186,13 +217,73 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_insert_edge,
             self._meshkernelid,
-            c_int(start_node),
-            c_int(end_node),
+            start_node,
+            end_node,
             byref(edge_index),
         )
 
         return edge_index.value
 
+    def mesh2d_insert_edges(self, node_pairs: ndarray) -> ndarray:
+        """Insert new mesh2d edges, each connecting a pair of given nodes.
+
+        The new edges are appended to the edges of the mesh at once and the mesh state is rebuilt
+        only once afterwards, instead of inserting every edge with a separate call as `mesh2d_insert_edge` does.
+        Since this transfers the whole mesh, it pays off for many edges rather than for a few.
+        A pair of nodes which is already connected, or which occurs earlier in the batch, is not inserted again,
+        its existing edge index is returned instead.
+
+        Args:
+            node_pairs (ndarray): A (N, 2) integer array describing the start and end node of each new edge.
+
+        Raises:
+            InputError: Raised when `node_pairs` is not a (N, 2) integer array of indices of distinct mesh nodes.
+
+        Returns:
+            ndarray: The integer array describing the index of the edge of each node pair.
+        """
+
+        node_pairs = np.asarray(node_pairs)
+        if node_pairs.ndim != 2 or node_pairs.shape[1] != 2:
+            raise InputError("`node_pairs` needs to be an array with shape (N, 2)")
+        if node_pairs.size > 0 and not np.issubdtype(node_pairs.dtype, np.integer):
+            raise InputError("`node_pairs` needs to be an integer array")
+        if node_pairs.size == 0:
+            return np.empty(0, dtype=np.int32)
+
+        mesh2d = self.mesh2d_get(locations=(Mesh2dLocation.NODES, Mesh2dLocation.EDGES))
+        num_nodes = mesh2d.node_x.size
+        node_pairs = self._validate_indices(
+            node_pairs.ravel(), num_nodes, "node_pairs"
+        ).reshape(-1, 2)
+        if np.any(node_pairs[:, 0] == node_pairs[:, 1]):
+            raise InputError("`node_pairs` must not connect a node with itself")
+
+        # Identify the edges by their sorted node pairs, the first edge of each pair is kept
+        edge_nodes = mesh2d.edge_nodes.reshape(-1, 2)
+        num_edges = edge_nodes.shape[0]
+        all_pairs = np.concatenate((edge_nodes, node_pairs)).astype(np.int64)
+        keys = all_pairs.min(axis=1) * num_nodes + all_pairs.max(axis=1)
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        first_position = first[inverse.ravel()]
+
+        positions = np.arange(num_edges, num_edges + node_pairs.shape[0])
+        inserted = first_position[num_edges:] == positions
+        edge_indices = np.arange(num_edges + node_pairs.shape[0], dtype=np.int32)
+        edge_indices[positions[inserted]] = num_edges + np.arange(
+            np.count_nonzero(inserted), dtype=np.int32
+        )
+
+        self.mesh2d_set(
+            Mesh2d(
+                mesh2d.node_x,
+                mesh2d.node_y,
+                np.concatenate((edge_nodes, node_pairs[inserted])).ravel(),
+            )
+        )
+
+        return edge_indices[first_position[num_edges:]]
+
     def mesh2d_insert_node(self, x: float, y: float) -> int:
         """Insert a new node at the specified coordinates
 
@@ -209,12 +300,44 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_insert_node,
             self._meshkernelid,
-            c_double(x),
-            c_double(y),
+            x,
+            y,
             byref(index),
         )
         return index.value
 
+    def mesh2d_insert_nodes(self, x: ndarray, y: ndarray) -> ndarray:
+        """Insert new nodes at the specified coordinates.
+
+        The coordinates are validated and converted once for the whole batch.
+        If the insertion of a node fails, the nodes before it remain inserted.
+
+        Args:
+            x (ndarray): A 1D double array describing the x-coordinates of the new nodes.
+            y (ndarray): A 1D double array describing the y-coordinates of the new nodes.
+
+        Raises:
+            InputError: Raised when `x` and `y` are not 1D arrays of the same size.
+
+        Returns:
+            ndarray: The integer array describing the indices of the new nodes.
+        """
+
+        x, y = self._validate_coordinates(x, y)
+
+        function = self.lib.mkernel_mesh2d_insert_node
+        index = c_int()
+        c_index = byref(index)
+        indices = []
+
+        for node_x, node_y in zip(x.tolist(), y.tolist()):
+            self._execute_function(
+                function, self._meshkernelid, node_x, node_y, c_index
+            )
+            indices.append(index.value)
+
+        return np.array(indices, dtype=np.int32)
+
     def mesh2d_delete_node(self, node_index: int) -> None:
         """Deletes a Mesh2d node with the given `index`.
 
@@ -229,7 +352,37 @@ class MeshKernel:
             raise InputError("node_index needs to be a positive integer")
 
         self._execute_function(
-            self.lib.mkernel_mesh2d_delete_node, self._meshkernelid, c_int(node_index)
+            self.lib.mkernel_mesh2d_delete_node, self._meshkernelid, node_index
+        )
+
+    def mesh2d_delete_nodes(self, node_indices: ndarray) -> None:
+        """Deletes a batch of Mesh2d nodes together with their connected edges.
+
+        The nodes are removed from the mesh at once and the mesh state is rebuilt only once afterwards,
+        instead of once per node as with `mesh2d_delete_node`.
+
+        Args:
+            node_indices (ndarray): A 1D integer array describing the indices of the nodes to be deleted.
+
+        Raises:
+            InputError: Raised when `node_indices` contains indices outside of the mesh nodes.
+        """
+
+        mesh2d = self.mesh2d_get(locations=(Mesh2dLocation.NODES, Mesh2dLocation.EDGES))
+        num_nodes = mesh2d.node_x.size
+        node_indices = self._validate_indices(node_indices, num_nodes, "node_indices")
+
+        kept_nodes = np.ones(num_nodes, dtype=bool)
+        kept_nodes[node_indices] = False
+        edge_nodes = mesh2d.edge_nodes.reshape(-1, 2)
+        kept_edges = kept_nodes[edge_nodes].all(axis=1)
+
+        # Renumber the nodes of the kept edges
+        new_node_indices = np.cumsum(kept_nodes, dtype=np.int32) - 1
+        new_edge_nodes = new_node_indices[edge_nodes[kept_edges]].ravel()
+
+        self.mesh2d_set(
+            Mesh2d(mesh2d.node_x[kept_nodes], mesh2d.node_y[kept_nodes], new_edge_nodes)
         )
 
     def mesh2d_move_node(self, x: float, y: float, node_index: int) -> None:
@@ -250,10 +403,79 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_move_node,
             self._meshkernelid,
-            c_double(x),
-            c_double(y),
-            c_int(node_index),
+            x,
+            y,
+            node_index,
+        )
+
+    def mesh2d_move_nodes(self, node_indices: ndarray, x: ndarray, y: ndarray) -> None:
+        """Moves a batch of Mesh2d nodes to new positions.
+
+        All moves are applied to the node coordinates at once and the mesh state,
+        including its spatial indices, is rebuilt only once afterwards.
+
+        Args:
+            node_indices (ndarray): A 1D integer array describing the indices of the nodes to be moved.
+            x (ndarray): A 1D double array describing the x-coordinates of the new positions of the nodes.
+            y (ndarray): A 1D double array describing the y-coordinates of the new positions of the nodes.
+
+        Raises:
+            InputError: Raised when the arrays do not have the same size, or when `node_indices`
+                        contains duplicates or indices outside of the mesh nodes.
+        """
+
+        x, y = self._validate_coordinates(x, y)
+        node_indices = self._validate_indices(
+            node_indices, self._mesh2d_get_dimensions().num_nodes, "node_indices"
         )
+        if node_indices.shape != x.shape:
+            raise InputError("`node_indices`, `x` and `y` need to have the same size")
+        if np.unique(node_indices).size != node_indices.size:
+            raise InputError("`node_indices` must not contain duplicates")
+
+        mesh2d = self.mesh2d_get(locations=(Mesh2dLocation.NODES, Mesh2dLocation.EDGES))
+        mesh2d.node_x[node_indices] = x
+        mesh2d.node_y[node_indices] = y
+
+        self.mesh2d_set(Mesh2d(mesh2d.node_x, mesh2d.node_y, mesh2d.edge_nodes))
+
+    def mesh2d_set_node_coordinates(
+        self, node_x: ndarray, node_y: ndarray, edge_nodes: Optional[ndarray] = None
+    ) -> None:
+        """Sets the coordinates of all Mesh2d nodes, keeping the connectivity of the mesh.
+
+        The MeshKernel library cannot update node coordinates in place, so this still rebuilds the whole
+        mesh state with `mesh2d_set`. Unless `edge_nodes` is given, the edges are first taken from the current
+        state with a full `mesh2d_get`. Pass the edge nodes of the mesh, for example of an earlier `mesh2d_get`,
+        to skip that transfer when the coordinates are set repeatedly.
+
+        Args:
+            node_x (ndarray): A 1D double array describing the new x-coordinates of the nodes.
+            node_y (ndarray): A 1D double array describing the new y-coordinates of the nodes.
+            edge_nodes (ndarray, optional): A 1D integer array describing the nodes composing each edge
+                                            of the current mesh. Default is the edges of the current state.
+
+        Raises:
+            InputError: Raised when the sizes of `node_x` and `node_y` differ from the number of mesh nodes,
+                        or when the size of `edge_nodes` differs from twice the number of mesh edges.
+        """
+
+        node_x, node_y = self._validate_coordinates(node_x, node_y)
+
+        c_mesh2d = self._mesh2d_get_dimensions()
+        if node_x.size != c_mesh2d.num_nodes:
+            raise InputError(
+                f"`node_x` and `node_y` need to have the size {c_mesh2d.num_nodes}"
+            )
+
+        if edge_nodes is None:
+            edge_nodes = self.mesh2d_get(locations=(Mesh2dLocation.EDGES,)).edge_nodes
+        elif np.size(edge_nodes) != 2 * c_mesh2d.num_edges:
+            raise InputError(
+                f"`edge_nodes` needs to have the size {2 * c_mesh2d.num_edges}"
+            )
+
+        self.mesh2d_set(Mesh2d(node_x, node_y, edge_nodes))
 
     def mesh2d_delete_edge(self, x_coordinate: float, y_coordinate: float) -> None:
         """Deletes the closest mesh2d edge to a point.
@@ -267,8 +489,53 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_delete_edge,
             self._meshkernelid,
-            c_double(x_coordinate),
-            c_double(y_coordinate),
+            x_coordinate,
+            y_coordinate,
+        )
+
+    def mesh2d_delete_edges(
+        self,
+        edge_indices: Optional[ndarray] = None,
+        x: Optional[ndarray] = None,
+        y: Optional[ndarray] = None,
+    ) -> None:
+        """Deletes a batch of mesh2d edges, given by their indices or by points.
+
+        The edges are removed from the mesh at once and the mesh state is rebuilt only once afterwards,
+        instead of once per edge as with `mesh2d_delete_edge`.
+        If points are given, the closest edge to each point is found by `mesh2d_get_edges`, which queries
+        MeshKernel once per point. All edges are found in the mesh before the deletion, so a point closest to
+        an edge that is already deleted for another point does not delete a second edge,
+        as it would with consecutive calls of `mesh2d_delete_edge`.
+
+        Args:
+            edge_indices (ndarray, optional): A 1D integer array describing the indices of the edges to be deleted.
+            x (ndarray, optional): A 1D double array describing the x-coordinates of the points.
+            y (ndarray, optional): A 1D double array describing the y-coordinates of the points.
+
+        Raises:
+            InputError: Raised when neither or both of `edge_indices` and the points `x` and `y` are given,
+                        or when `edge_indices` contains indices outside of the mesh edges.
+        """
+
+        if (edge_indices is None) == (x is None and y is None):
+            raise InputError(
+                "Either `edge_indices` or the points `x` and `y` are needed"
+            )
+        if edge_indices is None:
+            edge_indices = self.mesh2d_get_edges(x, y)
+
+        mesh2d = self.mesh2d_get(locations=(Mesh2dLocation.NODES, Mesh2dLocation.EDGES))
+        edge_nodes = mesh2d.edge_nodes.reshape(-1, 2)
+        edge_indices = self._validate_indices(
+            edge_indices, edge_nodes.shape[0], "edge_indices"
+        )
+
+        kept_edges = np.ones(edge_nodes.shape[0], dtype=bool)
+        kept_edges[edge_indices] = False
+
+        self.mesh2d_set(
+            Mesh2d(mesh2d.node_x, mesh2d.node_y, edge_nodes[kept_edges].ravel())
         )
 
     def mesh2d_get_edge(self, x: float, y: float) -> int:
@@ -287,13 +554,46 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_get_edge,
             self._meshkernelid,
-            c_double(x),
-            c_double(y),
+            x,
+            y,
             byref(index),
         )
 
         return index.value
 
+    def mesh2d_get_edges(self, x: ndarray, y: ndarray) -> ndarray:
+        """Gets the closest mesh2d edge to each point of a batch.
+
+        The MeshKernel library has no batched query, so `mkernel_mesh2d_get_edge` is still called once per point.
+        The batch only saves validating and converting every point separately,
+        the spatial index of the mesh edges is built by the first query and reused by the following ones.
+
+        Args:
+            x (ndarray): A 1D double array describing the x-coordinates of the points.
+            y (ndarray): A 1D double array describing the y-coordinates of the points.
+
+        Raises:
+            InputError: Raised when `x` and `y` are not 1D arrays of the same size.
+
+        Returns:
+            ndarray: The integer array describing the index of the closest edge of each point.
+        """
+
+        x, y = self._validate_coordinates(x, y)
+
+        function = self.lib.mkernel_mesh2d_get_edge
+        index = c_int()
+        c_index = byref(index)
+        indices = []
+
+        for point_x, point_y in zip(x.tolist(), y.tolist()):
+            self._execute_function(
+                function, self._meshkernelid, point_x, point_y, c_index
+            )
+            indices.append(index.value)
+
+        return np.array(indices, dtype=np.int32)
+
     def mesh2d_get_node_index(self, x: float, y: float, search_radius: float) -> int:
         """Finds the node closest to a point within a given search radius.
 
@@ -311,14 +611,70 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_get_node_index,
             self._meshkernelid,
-            c_double(x),
-            c_double(y),
-            c_double(search_radius),
+            x,
+            y,
+            search_radius,
             byref(index),
         )
 
         return index.value
 
+    def mesh2d_get_node_indices(
+        self, x: ndarray, y: ndarray, search_radius: float
+    ) -> ndarray:
+        """Finds the nodes closest to a batch of points within a given search radius.
+
+        The spatial index of the mesh nodes is shared by all points of the batch.
+
+        Args:
+            x (ndarray): A 1D double array describing the x-coordinates of the points.
+            y (ndarray): A 1D double array describing the y-coordinates of the points.
+            search_radius (float): The search radius.
+
+        Raises:
+            InputError: Raised when `x` and `y` are not 1D arrays of the same size,
+                        when `search_radius` is not positive or when the mesh has no nodes.
+            MeshKernelError: Raised when MeshKernel fails for another reason than finding no node.
+
+        Returns:
+            ndarray: The integer array describing the index of the closest node of each point.
+                     Points without a node within the search radius get the index -1.
+        """
+
+        x, y = self._validate_coordinates(x, y)
+        if not search_radius > 0.0:
+            raise InputError("`search_radius` needs to be positive")
+
+        # Every failure in the loop is taken as "no node found", so rule out the other failures first
+        if self._mesh2d_get_dimensions().num_nodes == 0:
+            raise InputError("The mesh has no nodes")
+
+        function = self.lib.mkernel_mesh2d_get_node_index
+        index = c_int()
+        c_index = byref(index)
+        indices = []
+
+        state_lock.acquire_shared()
+        try:
+            for point_x, point_y in zip(x.tolist(), y.tolist()):
+                status = function(
+                    self._meshkernelid, point_x, point_y, search_radius, c_index
+                )
+                if status == Status.SUCCESS:
+                    indices.append(index.value)
+                    continue
+
+                # MeshKernel reports a point without node within the search radius as an exception,
+                # it is only told apart from other failures by its message
+                error_message = self._get_error()
+                if _NODE_NOT_FOUND_MESSAGE not in error_message.lower():
+                    raise MeshKernelError(error_message)
+                indices.append(-1)
+        finally:
+            state_lock.release_shared()
+
+        return np.array(indices, dtype=np.int32)
+
     def mesh2d_get_hanging_edges(self) -> ndarray:
         """Gets the indices of hanging edges. A hanging edge is an edge where one of the two nodes is not connected.
 
@@ -335,7 +691,7 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_get_hanging_edges,
             self._meshkernelid,
-            byref(c_hanging_edges),
+            c_hanging_edges,
         )
 
         return hanging_edges
@@ -422,9 +778,9 @@ class MeshKernel:
             self.lib.mkernel_polygon_count_refine,
             self._meshkernelid,
             byref(c_polygon),
-            c_int(first_node),
-            c_int(second_node),
-            c_double(target_edge_length),
+            first_node,
+            second_node,
+            target_edge_length,
             byref(c_n_polygon_nodes),
         )
 
@@ -440,9 +796,9 @@ class MeshKernel:
             self.lib.mkernel_polygon_refine,
             self._meshkernelid,
             byref(c_polygon),
-            c_int(first_node),
-            c_int(second_node),
-            c_double(target_edge_length),
+            first_node,
+            second_node,
+            target_edge_length,
             byref(c_refined_polygon),
         )
 
@@ -479,8 +835,8 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_refine_based_on_samples,
             self._meshkernelid,
             byref(c_samples),
-            c_double(relative_search_radius),
-            c_int(minimum_num_samples),
+            relative_search_radius,
+            minimum_num_samples,
             byref(c_refinement_params),
         )
 
@@ -569,8 +925,8 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_flip_edges,
             self._meshkernelid,
-            c_int(triangulation_required),
-            c_int(project_to_land_boundary_required),
+            triangulation_required,
+            project_to_land_boundary_required,
             byref(c_selecting_polygon),
             byref(c_land_boundaries),
         )
@@ -637,7 +993,7 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_count_small_flow_edge_centers,
             self._meshkernelid,
-            c_double(small_flow_edges_length_threshold),
+            small_flow_edges_length_threshold,
             byref(n_small_flow_edge_centers),
         )
 
@@ -669,7 +1025,7 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_get_small_flow_edge_centers,
             self._meshkernelid,
-            c_double(small_flow_edges_length_threshold),
+            small_flow_edges_length_threshold,
             byref(c_geometry_list),
         )
 
@@ -693,8 +1049,8 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_delete_small_flow_edges_and_small_triangles,
             self._meshkernelid,
-            c_double(small_flow_edges_length_threshold),
-            c_double(min_fractional_area_triangles),
+            small_flow_edges_length_threshold,
+            min_fractional_area_triangles,
         )
 
     def get_splines(
@@ -731,7 +1087,7 @@ class MeshKernel:
             self.lib.mkernel_get_splines,
             byref(c_geometry_list_in),
             byref(c_geometry_list_out),
-            c_int(number_of_points_between_nodes),
+            number_of_points_between_nodes,
         )
 
         return geometry_list_out
@@ -795,7 +1151,7 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_merge_nodes,
             self._meshkernelid,
             byref(c_geometry_list),
-            c_double(merging_distance),
+            merging_distance,
         )
 
     def mesh2d_merge_two_nodes(self, first_node: int, second_node: int) -> None:
@@ -809,8 +1165,8 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_merge_two_nodes,
             self._meshkernelid,
-            c_int(first_node),
-            c_int(second_node),
+            first_node,
+            second_node,
         )
 
     def mesh2d_get_nodes_in_polygons(
@@ -840,7 +1196,7 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_get_nodes_in_polygons,
             self._meshkernelid,
             byref(c_geometry_list),
-            c_int(inside),
+            inside,
             c_selected_nodes,
         )
 
@@ -866,7 +1222,7 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_count_nodes_in_polygons,
             self._meshkernelid,
             byref(c_geometry_list),
-            c_int(inside),
+            inside,
             byref(c_number_of_mesh_nodes),
         )
         return c_number_of_mesh_nodes.value
@@ -970,8 +1326,8 @@ class MeshKernel:
             polygons (GeometryList): The polygons selecting the area where the contacts will be be generated.
         """
 
-        node_mask_int = node_mask.astype(np.int32)
-        c_node_mask = as_ctypes(node_mask_int)
+        node_mask_int = as_c_array(node_mask, np.int32, "node_mask")
+        c_node_mask = node_mask_int.ctypes.data_as(c_int_p)
         c_polygons = CGeometryList.from_geometrylist(polygons)
 
         self._execute_function(
@@ -989,8 +1345,8 @@ class MeshKernel:
                                  should not be connected
         """
 
-        node_mask_int = node_mask.astype(np.int32)
-        c_node_mask = as_ctypes(node_mask_int)
+        node_mask_int = as_c_array(node_mask, np.int32, "node_mask")
+        c_node_mask = node_mask_int.ctypes.data_as(c_int_p)
 
         self._execute_function(
             self.lib.mkernel_contacts_compute_multiple,
@@ -1010,8 +1366,8 @@ class MeshKernel:
 
         """
 
-        node_mask_int = node_mask.astype(np.int32)
-        c_node_mask = as_ctypes(node_mask_int)
+        node_mask_int = as_c_array(node_mask, np.int32, "node_mask")
+        c_node_mask = node_mask_int.ctypes.data_as(c_int_p)
         c_polygons = CGeometryList.from_geometrylist(polygons)
 
         self._execute_function(
@@ -1033,8 +1389,8 @@ class MeshKernel:
             points (GeometryList): The points selecting the Mesh2d faces to connect.
 
         """
-        node_mask_int = node_mask.astype(np.int32)
-        c_node_mask = as_ctypes(node_mask_int)
+        node_mask_int = as_c_array(node_mask, np.int32, "node_mask")
+        c_node_mask = node_mask_int.ctypes.data_as(c_int_p)
         c_points = CGeometryList.from_geometrylist(points)
 
         self._execute_function(
@@ -1058,8 +1414,8 @@ class MeshKernel:
 
         """
 
-        node_mask_int = node_mask.astype(np.int32)
-        c_node_mask = as_ctypes(node_mask_int)
+        node_mask_int = as_c_array(node_mask, np.int32, "node_mask")
+        c_node_mask = node_mask_int.ctypes.data_as(c_int_p)
         c_polygons = CGeometryList.from_geometrylist(polygons)
 
         self._execute_function(
@@ -1067,7 +1423,7 @@ class MeshKernel:
             self._meshkernelid,
             c_node_mask,
             byref(c_polygons),
-            c_double(search_radius),
+            search_radius,
         )
 
     def mesh2d_compute_orthogonalization(
@@ -1101,7 +1457,7 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_compute_orthogonalization,
             self._meshkernelid,
-            c_int(project_to_land_boundary_option),
+            project_to_land_boundary_option,
             byref(c_orthogonalization_params),
             byref(c_selecting_polygon),
             byref(c_land_boundaries),
@@ -1155,6 +1511,23 @@ class MeshKernel:
         return geometry_list_out
 
     def _get_error(self) -> str:
+        """For internal use only.
+
+        Gets the message of the last error.
+        No other call can change the message while it is read, see the thread safety notes of this class.
+
+        Returns:
+            str: The error message.
+        """
+
+        locked = state_lock.acquire_exclusive()
+        try:
+            return self._read_error()
+        finally:
+            if locked:
+                state_lock.release_exclusive()
+
+    def _read_error(self) -> str:
         c_error_message = c_char_p()
         self.lib.mkernel_get_error(byref(c_error_message))
         return c_error_message.value.decode("ASCII")
@@ -1188,7 +1561,7 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_triangulation_interpolation,
             self._meshkernelid,
             byref(c_samples),
-            c_int(location_type),
+            location_type,
             byref(c_interpolated_samples),
         )
 
@@ -1230,10 +1603,10 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_averaging_interpolation,
             self._meshkernelid,
             byref(c_samples),
-            c_int(location_type),
-            c_int(averaging_method),
-            c_double(relative_search_size),
-            c_size_t(min_samples),
+            location_type,
+            averaging_method,
+            relative_search_size,
+            min_samples,
             byref(c_interpolated_samples),
         )
 
@@ -1270,6 +1643,110 @@ class MeshKernel:
             MeshKernelError: This exception gets raised,
                              if the MeshKernel library reports an error.
         """
-        if function(*args) != Status.SUCCESS:
+        state_lock.acquire_shared()
+        try:
+            status = function(*args)
+        finally:
+            state_lock.release_shared()
+
+        if status != Status.SUCCESS:
             error_message = self._get_error()
             raise MeshKernelError(error_message)
+
+    def _execute_function_exclusively(self, function: Callable, *args) -> bool:
+        """For internal use only.
+
+        Executes a C function of MeshKernel which allocates or deallocates a state and checks its status.
+        No other call runs at the same time. The states of garbage collected instances which could not be
+        deallocated immediately are deallocated first.
+
+        Args:
+            function (Callable): The function which we want to call.
+            args: Arguments which will be passed to `function`.
+
+        Raises:
+            MeshKernelError: This exception gets raised,
+                             if the MeshKernel library reports an error.
+
+        Returns:
+            bool: Whether `function` has been executed. It is not executed if the current thread is calling
+                  MeshKernel already, which only happens if the garbage collector destroys an instance.
+        """
+
+        if not state_lock.acquire_exclusive():
+            return False
+
+        error_message = None
+        try:
+            while _pending_deallocations:
+                meshkernelid = _pending_deallocations.pop()
+                if self.lib.mkernel_deallocate_state(meshkernelid) != Status.SUCCESS:
+                    logger.warning(
+                        "Could not deallocate state %d: %s",
+                        meshkernelid.value,
+                        self._read_error(),
+                    )
+
+            if function(*args) != Status.SUCCESS:
+                error_message = self._read_error()
+        finally:
+            state_lock.release_exclusive()
+
+        if error_message is not None:
+            raise MeshKernelError(error_message)
+
+        return True
+
+    @staticmethod
+    def _validate_coordinates(x: ndarray, y: ndarray) -> Tuple[ndarray, ndarray]:
+        """For internal use only.
+
+        Validates the coordinates of a batch of points.
+
+        Args:
+            x (ndarray): The x-coordinates of the points.
+            y (ndarray): The y-coordinates of the points.
+
+        Raises:
+            InputError: Raised when `x` and `y` are not 1D arrays of the same size.
+
+        Returns:
+            Tuple[ndarray, ndarray]: The coordinates as 1D double arrays.
+        """
+
+        x = np.asarray(x, dtype=np.double)
+        y = np.asarray(y, dtype=np.double)
+        if x.ndim != 1 or x.shape != y.shape:
+            raise InputError("`x` and `y` need to be 1D arrays of the same size")
+
+        return x, y
+
+    @staticmethod
+    def _validate_indices(indices: ndarray, size: int, name: str) -> ndarray:
+        """For internal use only.
+
+        Validates a batch of indices into an array of the given size.
+
+        Args:
+            indices (ndarray): The indices.
+            size (int): The size of the indexed array.
+            name (str): The name of the indices used in the error messages.
+
+        Raises:
+            InputError: Raised when `indices` is not a 1D integer array with values in [0, `size`).
+
+        Returns:
+            ndarray: The indices as 1D integer array.
+        """
+
+        indices = np.asarray(indices)
+        if indices.size == 0:
+            return indices.astype(np.int32).ravel()
+        if indices.ndim != 1 or not np.issubdtype(indices.dtype, np.integer):
+            raise InputError(f"`{name}` needs to be a 1D integer array")
+        if np.any((indices < 0) | (indices >= size)):
+            raise InputError(
+                f"`{name}` needs to contain indices between 0 and {size - 1}"
+            )
+
+        return indices
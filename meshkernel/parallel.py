@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from meshkernel.errors import InputError
+from meshkernel.meshkernel import MeshKernel
+from meshkernel.py_structures import Mesh2d
+from meshkernel.shared_memory import SharedMemoryHandle
+
+
+@dataclass
+class MeshKernelCall:
+    """A call of a `MeshKernel` method within a `MeshJob`.
+
+    Attributes:
+        method (str): The name of the `MeshKernel` method.
+        args (tuple, optional): The positional arguments of the method. Default is no arguments.
+        kwargs (Dict[str, Any], optional): The keyword arguments of the method. Default is no arguments.
+    """
+
+    method: str
+    args: tuple = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class MeshJob:
+    """A description of an independent mesh job processed by `run_jobs`.
+
+    A new `MeshKernel` state is created for every job, `mesh2d` is set and
+    the calls are executed in order. All attributes have to be picklable.
+
+    Attributes:
+        calls (Sequence[MeshKernelCall]): The `MeshKernel` method calls.
+        mesh2d (Mesh2d, optional): The Mesh2d which is set before the calls. Default is no Mesh2d.
+        is_geographic (bool, optional): Whether the mesh is cartesian (False) or spherical (True).
+                                        Default is `False`.
+    """
+
+    calls: Sequence[MeshKernelCall]
+    mesh2d: Optional[Mesh2d] = None
+    is_geographic: bool = False
+
+
+@dataclass
+class MeshJobResult:
+    """The result of a `MeshJob`.
+
+    Attributes:
+        mesh2d (Mesh2d): The Mesh2d after the last call.
+        return_values (List[Any]): The return values of the calls. They are pickled, unlike `mesh2d`.
+    """
+
+    mesh2d: Mesh2d
+    return_values: List[Any]
+
+
+def run_jobs(
+    jobs: Iterable[MeshJob], max_workers: Optional[int] = None
+) -> List[MeshJobResult]:
+    """Runs independent mesh jobs in a pool of processes.
+
+    On POSIX systems, the resulting Mesh2d of each job is passed back through shared memory
+    instead of being pickled, and its arrays are views of that memory.
+
+    Args:
+        jobs (Iterable[MeshJob]): The jobs to run.
+        max_workers (int, optional): The maximum number of processes. Default is the number of processors.
+
+    Raises:
+        InputError: Raised when a job calls something else than a public `MeshKernel` method.
+        MeshKernelError: Raised when a job fails in MeshKernel.
+
+    Returns:
+        List[MeshJobResult]: The results in the order of the jobs.
+    """
+
+    jobs = list(jobs)
+    for job in jobs:
+        for call in job.calls:
+            if call.method.startswith("_") or not callable(
+                getattr(MeshKernel, call.method, None)
+            ):
+                raise InputError(f"{call.method} is not a method of MeshKernel")
+
+    if not jobs:
+        return []
+
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_job, job) for job in jobs]
+        try:
+            for future in futures:
+                mesh2d, return_values = future.result()
+                results.append(MeshJobResult(_receive_mesh2d(mesh2d), return_values))
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+            # Remove the shared memory of the jobs finished after the failing one
+            for future in futures[len(results) + 1 :]:
+                if not future.cancelled() and future.exception() is None:
+                    mesh2d, _ = future.result()
+                    if isinstance(mesh2d, SharedMemoryHandle):
+                        mesh2d.unlink()
+            raise
+
+    return results
+
+
+def _run_job(job: MeshJob) -> Tuple[Union[SharedMemoryHandle, Mesh2d], List[Any]]:
+    """For internal use only.
+
+    Runs a single job in a worker process.
+
+    Args:
+        job (MeshJob): The job to run.
+
+    Returns:
+        Tuple[Union[SharedMemoryHandle, Mesh2d], List[Any]]: The handle of the shared memory block holding
+                                                             the resulting Mesh2d and the return values of the calls.
+                                                             On Windows, shared memory is released when the worker
+                                                             closes it, so the Mesh2d itself is returned instead.
+    """
+
+    mk = MeshKernel(job.is_geographic)
+    if job.mesh2d is not None:
+        mk.mesh2d_set(job.mesh2d)
+
+    return_values = [
+        getattr(mk, call.method)(*call.args, **call.kwargs) for call in job.calls
+    ]
+
+    mesh2d = mk.mesh2d_get()
+    if os.name == "posix":
+        return mesh2d.to_shared_memory(), return_values
+    return mesh2d, return_values
+
+
+def _receive_mesh2d(mesh2d: Union[SharedMemoryHandle, Mesh2d]) -> Mesh2d:
+    """For internal use only.
+
+    Receives the Mesh2d returned by `_run_job`.
+    The arrays of a Mesh2d in shared memory are attached without copying and the block is unlinked.
+
+    Args:
+        mesh2d (Union[SharedMemoryHandle, Mesh2d]): The Mesh2d or the handle of the shared memory block holding it.
+
+    Returns:
+        Mesh2d: The received Mesh2d.
+    """
+
+    if isinstance(mesh2d, SharedMemoryHandle):
+        try:
+            return Mesh2d.from_shared_memory(mesh2d)
+        finally:
+            mesh2d.unlink()
+    return mesh2d
@@ -1,12 +1,36 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from enum import IntEnum, unique
+from pathlib import Path
+from typing import Union
 
 import numpy as np
 from numpy import ndarray
 
-from meshkernel.utils import plot_edges
+from meshkernel.shared_memory import (
+    SharedMemoryHandle,
+    from_shared_memory,
+    to_shared_memory,
+)
+from meshkernel.storage import load, save
+from meshkernel.utils import plot_contacts, plot_edges, plot_faces
+
+# Dataclasses support `__slots__` as of Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _empty_double_array() -> ndarray:
+    return np.empty(0, dtype=np.double)
+
+
+def _empty_int_array() -> ndarray:
+    return np.empty(0, dtype=np.int32)
+
+
+def _zero_offsets() -> ndarray:
+    return np.zeros(1, dtype=np.int32)
 
 
 @unique
@@ -77,7 +101,7 @@ class AveragingMethod(IntEnum):
     MIN_ABS = 6
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Mesh2d:
     """This class is used for getting and setting two-dimensional mesh data.
 
@@ -97,42 +121,122 @@ class Mesh2d:
     node_x: ndarray
     node_y: ndarray
     edge_nodes: ndarray
-    face_nodes: ndarray = np.empty(0, dtype=np.int32)
-    nodes_per_face: ndarray = np.empty(0, dtype=np.int32)
-    edge_x: ndarray = np.empty(0, dtype=np.double)
-    edge_y: ndarray = np.empty(0, dtype=np.double)
-    face_x: ndarray = np.empty(0, dtype=np.double)
-    face_y: ndarray = np.empty(0, dtype=np.double)
-
-    def plot_edges(self, ax, *args, **kwargs):
+    face_nodes: ndarray = field(default_factory=_empty_int_array)
+    nodes_per_face: ndarray = field(default_factory=_empty_int_array)
+    edge_x: ndarray = field(default_factory=_empty_double_array)
+    edge_y: ndarray = field(default_factory=_empty_double_array)
+    face_x: ndarray = field(default_factory=_empty_double_array)
+    face_y: ndarray = field(default_factory=_empty_double_array)
+
+    def plot_edges(self, ax, *args, level_of_detail=False, **kwargs):
         """Plots the edges at a given axes.
-        `args` and `kwargs` will be used as parameters of the `plot` method of matplotlib.
+        `args` and `kwargs` will be used as parameters of the `LineCollection` of matplotlib.
 
         Args:
             ax (matplotlib.axes.Axes): The axes where to plot the edges
-        """
-        plot_edges(self.node_x, self.node_y, self.edge_nodes, ax, *args, **kwargs)
+            level_of_detail (bool, optional): Whether to only draw the edges within the view limits,
+                                              merging edges smaller than a pixel. Default is `False`.
 
-    def plot_faces(self, ax, *args, **kwargs):
+        Returns:
+            matplotlib.collections.LineCollection: The collection of edges.
+        """
+        return plot_edges(
+            self.node_x,
+            self.node_y,
+            self.edge_nodes,
+            ax,
+            *args,
+            level_of_detail=level_of_detail,
+            **kwargs,
+        )
+
+    def plot_faces(self, ax, *args, face_values=None, level_of_detail=False, **kwargs):
         """Plots the faces at a given axes.
-        `args` and `kwargs` will be used as parameters of the `plot` method of matplotlib.
+        A single positional argument is used as face color, like the format string of the `fill` method of
+        matplotlib. `kwargs` will be used as parameters of the `PolyCollection` of matplotlib.
 
         Args:
             ax (matplotlib.axes.Axes): The axes where to plot the faces
+            face_values (ndarray, optional): A 1D double array with a value per face used to color the faces.
+            level_of_detail (bool, optional): Whether to only draw the faces within the view limits,
+                                              merging faces smaller than a pixel. Default is `False`.
+
+        Raises:
+            InputError: Raised when the positional arguments are not a single color.
+
+        Returns:
+            matplotlib.collections.PolyCollection: The collection of faces, e.g. to create a colorbar.
         """
-        node_position = 0
-        for num_nodes in self.nodes_per_face:
-            # Calculate values to draw
-            face_nodes = self.face_nodes[node_position : (node_position + num_nodes)]
-            face_nodes_x = self.node_x[face_nodes]
-            face_nodes_y = self.node_y[face_nodes]
-            node_position += num_nodes
+        return plot_faces(
+            self.node_x,
+            self.node_y,
+            self.face_nodes,
+            self.nodes_per_face,
+            ax,
+            *args,
+            face_values=face_values,
+            level_of_detail=level_of_detail,
+            **kwargs,
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Saves the Mesh2d to a binary file, which can be loaded by `load`.
+
+        The file holds a small header followed by the raw arrays, so that they can be memory-mapped.
 
-            # Draw polygon
-            ax.fill(face_nodes_x, face_nodes_y, *args, **kwargs)
+        Args:
+            path (Union[str, Path]): The path of the file.
+        """
+        save(self, path)
 
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap: bool = True) -> Mesh2d:
+        """Loads a Mesh2d from a file saved by `save`.
 
-@dataclass
+        By default, the arrays are mapped read-only into memory. Loading then takes the same time
+        for any mesh size and data is only read from disk when it is accessed, for example by `MeshKernel.mesh2d_set`.
+
+        Args:
+            path (Union[str, Path]): The path of the file.
+            mmap (bool, optional): Whether to map the arrays read-only into memory instead of reading them into
+                                   writeable arrays. Default is `True`.
+
+        Raises:
+            InputError: Raised when the file does not contain a Mesh2d.
+
+        Returns:
+            Mesh2d: The loaded Mesh2d.
+        """
+        return load(cls, path, mmap)
+
+    def to_shared_memory(self) -> SharedMemoryHandle:
+        """Copies the arrays into a new shared memory block.
+        Other processes can then create a Mesh2d from the returned handle without copying the arrays again.
+        Call `unlink` on the handle once no more process needs to attach to the block.
+
+        Returns:
+            SharedMemoryHandle: The picklable handle of the shared memory block.
+        """
+        return to_shared_memory(self)
+
+    @classmethod
+    def from_shared_memory(
+        cls, handle: SharedMemoryHandle, copy: bool = False
+    ) -> Mesh2d:
+        """Creates a Mesh2d from the arrays in a shared memory block created by `to_shared_memory`.
+
+        Args:
+            handle (SharedMemoryHandle): The handle of the shared memory block.
+            copy (bool, optional): Whether to copy the arrays out of the block. By default, the arrays are views
+                                   of the block, which stays mapped as long as they exist. Default is `False`.
+
+        Returns:
+            Mesh2d: The created instance.
+        """
+        return from_shared_memory(cls, handle, copy)
+
+
+@dataclass(**_SLOTS)
 class GeometryList:
     """A class to describe a list of geometries.
 
@@ -147,10 +251,207 @@ class GeometryList:
 
     x_coordinates: ndarray
     y_coordinates: ndarray
-    values: ndarray = np.empty(0, dtype=np.double)
+    values: ndarray = field(default_factory=_empty_double_array)
     geometry_separator: float = -999.0
     inner_outer_separator: float = -998.0
 
+    def to_shared_memory(self) -> SharedMemoryHandle:
+        """Copies the arrays into a new shared memory block.
+        Other processes can then create a GeometryList from the returned handle without copying the arrays again.
+        Call `unlink` on the handle once no more process needs to attach to the block.
+
+        Returns:
+            SharedMemoryHandle: The picklable handle of the shared memory block.
+        """
+        return to_shared_memory(self)
+
+    @classmethod
+    def from_shared_memory(
+        cls, handle: SharedMemoryHandle, copy: bool = False
+    ) -> GeometryList:
+        """Creates a GeometryList from the arrays in a shared memory block created by `to_shared_memory`.
+
+        Args:
+            handle (SharedMemoryHandle): The handle of the shared memory block.
+            copy (bool, optional): Whether to copy the arrays out of the block. By default, the arrays are views
+                                   of the block, which stays mapped as long as they exist. Default is `False`.
+
+        Returns:
+            GeometryList: The created instance.
+        """
+        return from_shared_memory(cls, handle, copy)
+
+
+@dataclass(**_SLOTS)
+class MultiPolygon:
+    """A class to describe polygons with holes by offsets into the coordinate arrays,
+    instead of the separators used by `GeometryList`.
+
+    The coordinates of ring `j` are `x_coordinates[ring_offsets[j]:ring_offsets[j + 1]]`.
+    The rings of polygon `i` are `ring_offsets[polygon_offsets[i]:polygon_offsets[i + 1]]`,
+    the first one being the outer ring and the others its holes.
+
+    Attributes:
+        x_coordinates (ndarray, optional): A 1D double array describing the x-coordinates of the nodes.
+        y_coordinates (ndarray, optional): A 1D double array describing the y-coordinates of the nodes.
+        values (ndarray, optional): A 1D double array describing the values of the nodes.
+        ring_offsets (ndarray, optional): A 1D integer array with the offset of each ring in the coordinates,
+                                          followed by the number of coordinates.
+        polygon_offsets (ndarray, optional): A 1D integer array with the offset of each polygon in the rings,
+                                             followed by the number of rings.
+    """
+
+    x_coordinates: ndarray = field(default_factory=_empty_double_array)
+    y_coordinates: ndarray = field(default_factory=_empty_double_array)
+    values: ndarray = field(default_factory=_empty_double_array)
+    ring_offsets: ndarray = field(default_factory=_zero_offsets)
+    polygon_offsets: ndarray = field(default_factory=_zero_offsets)
+
+    @property
+    def num_polygons(self) -> int:
+        """The number of polygons."""
+        return self.polygon_offsets.size - 1
+
+    def polygon(self, index: int) -> MultiPolygon:
+        """Gets a single polygon, without scanning the other polygons.
+        The coordinate arrays of the returned instance are views of those of this instance.
+
+        Args:
+            index (int): The index of the polygon.
+
+        Raises:
+            IndexError: Raised when there is no polygon with this index.
+
+        Returns:
+            MultiPolygon: The polygon with its holes.
+        """
+        if not -self.num_polygons <= index < self.num_polygons:
+            raise IndexError(f"Polygon index {index} is out of range")
+        index %= self.num_polygons
+
+        ring_offsets = self.ring_offsets[
+            self.polygon_offsets[index] : self.polygon_offsets[index + 1] + 1
+        ]
+        start, stop = ring_offsets[0], ring_offsets[-1]
+        return MultiPolygon(
+            self.x_coordinates[start:stop],
+            self.y_coordinates[start:stop],
+            self.values[start:stop] if self.values.size else _empty_double_array(),
+            ring_offsets - start,
+            np.array([0, ring_offsets.size - 1], dtype=np.int32),
+        )
+
+    def bounding_boxes(self) -> ndarray:
+        """Computes the bounding box of each polygon.
+
+        Returns:
+            ndarray: A 2D double array with the minimum x, minimum y, maximum x and maximum y of each polygon.
+                     The bounding box of a polygon without coordinates is NaN.
+        """
+        starts = self.ring_offsets[self.polygon_offsets]
+        non_empty = np.flatnonzero(starts[1:] > starts[:-1])
+
+        boxes = np.full((self.num_polygons, 4), np.nan)
+        if non_empty.size:
+            starts = starts[non_empty]
+            boxes[non_empty, 0] = np.minimum.reduceat(self.x_coordinates, starts)
+            boxes[non_empty, 1] = np.minimum.reduceat(self.y_coordinates, starts)
+            boxes[non_empty, 2] = np.maximum.reduceat(self.x_coordinates, starts)
+            boxes[non_empty, 3] = np.maximum.reduceat(self.y_coordinates, starts)
+
+        return boxes
+
+    def to_geometry_list(
+        self, geometry_separator: float = -999.0, inner_outer_separator: float = -998.0
+    ) -> GeometryList:
+        """Converts the polygons to a GeometryList, putting separators between the rings.
+
+        Args:
+            geometry_separator (float, optional): The value separating the polygons. Default is `-999.0`.
+            inner_outer_separator (float, optional): The value separating the rings of a polygon.
+                                                     Default is `-998.0`.
+
+        Returns:
+            GeometryList: The polygons with separators.
+        """
+        num_rings = self.ring_offsets.size - 1
+        if num_rings <= 0:
+            return GeometryList(
+                _empty_double_array(),
+                _empty_double_array(),
+                geometry_separator=geometry_separator,
+                inner_outer_separator=inner_outer_separator,
+            )
+
+        # Every ring but the first is preceded by a separator
+        ring = np.arange(1, num_rings)
+        separator_positions = self.ring_offsets[1:-1] + ring - 1
+        is_polygon_start = np.zeros(num_rings + 1, dtype=bool)
+        is_polygon_start[self.polygon_offsets] = True
+        separators = np.where(
+            is_polygon_start[1:-1], geometry_separator, inner_outer_separator
+        )
+        coordinate_positions = np.arange(self.x_coordinates.size) + np.repeat(
+            np.arange(num_rings), np.diff(self.ring_offsets)
+        )
+
+        arrays = []
+        for coordinates in (self.x_coordinates, self.y_coordinates, self.values):
+            if coordinates.size == 0:
+                arrays.append(_empty_double_array())
+                continue
+            array = np.empty(self.x_coordinates.size + num_rings - 1, dtype=np.double)
+            array[separator_positions] = separators
+            array[coordinate_positions] = coordinates
+            arrays.append(array)
+
+        return GeometryList(
+            *arrays,
+            geometry_separator=geometry_separator,
+            inner_outer_separator=inner_outer_separator,
+        )
+
+    @classmethod
+    def from_geometry_list(cls, geometry_list: GeometryList) -> MultiPolygon:
+        """Creates polygons from a GeometryList, replacing its separators by offsets.
+
+        Args:
+            geometry_list (GeometryList): The polygons with separators.
+
+        Returns:
+            MultiPolygon: The created instance.
+        """
+        x_coordinates = geometry_list.x_coordinates
+        if x_coordinates.size == 0:
+            return cls()
+
+        is_geometry_separator = x_coordinates == geometry_list.geometry_separator
+        is_separator = is_geometry_separator | (
+            x_coordinates == geometry_list.inner_outer_separator
+        )
+        separators = np.flatnonzero(is_separator)
+        is_coordinate = ~is_separator
+        num_coordinates = x_coordinates.size - separators.size
+
+        ring_offsets = np.empty(separators.size + 2, dtype=np.int32)
+        ring_offsets[0] = 0
+        ring_offsets[1:-1] = separators - np.arange(separators.size)
+        ring_offsets[-1] = num_coordinates
+
+        polygon_starts = 1 + np.flatnonzero(is_geometry_separator[separators])
+        polygon_offsets = np.concatenate(
+            ([0], polygon_starts, [separators.size + 1])
+        ).astype(np.int32)
+
+        values = geometry_list.values
+        return cls(
+            x_coordinates[is_coordinate],
+            geometry_list.y_coordinates[is_coordinate],
+            values[is_coordinate] if values.size else _empty_double_array(),
+            ring_offsets,
+            polygon_offsets,
+        )
+
 
 @dataclass
 class OrthogonalizationParameters:
@@ -203,7 +504,7 @@ class MeshRefinementParameters:
     max_refinement_iterations: int = 10
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Mesh1d:
     """This class is used for getting and setting one-dimensional mesh data.
 
@@ -217,17 +518,56 @@ class Mesh1d:
     node_y: ndarray
     edge_nodes: ndarray
 
-    def plot_edges(self, ax, *args, **kwargs):
+    def plot_edges(self, ax, *args, level_of_detail=False, **kwargs):
         """Plots the edges at a given axes.
-        `args` and `kwargs` will be used as parameters of the `plot` method of matplotlib.
+        `args` and `kwargs` will be used as parameters of the `LineCollection` of matplotlib.
 
         Args:
             ax (matplotlib.axes.Axes): The axes where to plot the edges
+            level_of_detail (bool, optional): Whether to only draw the edges within the view limits,
+                                              merging edges smaller than a pixel. Default is `False`.
+
+        Returns:
+            matplotlib.collections.LineCollection: The collection of edges.
         """
-        plot_edges(self.node_x, self.node_y, self.edge_nodes, ax, *args, **kwargs)
+        return plot_edges(
+            self.node_x,
+            self.node_y,
+            self.edge_nodes,
+            ax,
+            *args,
+            level_of_detail=level_of_detail,
+            **kwargs,
+        )
+
+    def to_shared_memory(self) -> SharedMemoryHandle:
+        """Copies the arrays into a new shared memory block.
+        Other processes can then create a Mesh1d from the returned handle without copying the arrays again.
+        Call `unlink` on the handle once no more process needs to attach to the block.
+
+        Returns:
+            SharedMemoryHandle: The picklable handle of the shared memory block.
+        """
+        return to_shared_memory(self)
 
+    @classmethod
+    def from_shared_memory(
+        cls, handle: SharedMemoryHandle, copy: bool = False
+    ) -> Mesh1d:
+        """Creates a Mesh1d from the arrays in a shared memory block created by `to_shared_memory`.
 
-@dataclass
+        Args:
+            handle (SharedMemoryHandle): The handle of the shared memory block.
+            copy (bool, optional): Whether to copy the arrays out of the block. By default, the arrays are views
+                                   of the block, which stays mapped as long as they exist. Default is `False`.
+
+        Returns:
+            Mesh1d: The created instance.
+        """
+        return from_shared_memory(cls, handle, copy)
+
+
+@dataclass(**_SLOTS)
 class Contacts:
     """This class describes the contacts between a mesh1d and mesh2d.
 
@@ -241,16 +581,25 @@ class Contacts:
 
     def plot_edges(self, ax, mesh1d, mesh2d, *args, **kwargs):
         """Plots the edges at a given axes.
-        `args` and `kwargs` will be used as parameters of the `plot` method of matplotlib.
+        `args` and `kwargs` will be used as parameters of the `LineCollection` of matplotlib.
 
         Args:
             ax (matplotlib.axes.Axes): The axes where to plot the edges
             mesh1d (Mesh1d): The mesh1d instance used to plot the contacts
             mesh2d (Mesh2d): The mesh2d instance used to plot the contacts
-        """
 
-        for mesh1d_index, mesh2d_index in zip(self.mesh1d_indices, self.mesh2d_indices):
-            node_x = [mesh1d.node_x[mesh1d_index], mesh2d.face_x[mesh2d_index]]
-            node_y = [mesh1d.node_y[mesh1d_index], mesh2d.face_y[mesh2d_index]]
+        Returns:
+            matplotlib.collections.LineCollection: The collection of contacts.
+        """
 
-            ax.plot(node_x, node_y, *args, **kwargs)
+        return plot_contacts(
+            mesh1d.node_x,
+            mesh1d.node_y,
+            mesh2d.face_x,
+            mesh2d.face_y,
+            self.mesh1d_indices,
+            self.mesh2d_indices,
+            ax,
+            *args,
+            **kwargs,
+        )
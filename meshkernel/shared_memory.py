@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import ctypes
+import os
+import sys
+from dataclasses import dataclass, fields
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from numpy import ndarray
+
+# Offsets of the arrays in a shared memory block or file are aligned to this number of bytes
+ALIGNMENT = 64
+
+
+@dataclass(frozen=True)
+class SharedMemoryHandle:
+    """A picklable reference to the arrays of a mesh structure in a shared memory block.
+
+    It is created by the `to_shared_memory` method of `Mesh2d`, `Mesh1d` and `GeometryList`
+    and passed to their `from_shared_memory` method in any process of the same machine.
+
+    The block is owned by the handle: it is neither removed when the creating process exits
+    nor when the arrays attached to it are garbage collected. Call `unlink` once no more process
+    needs to attach to it. The memory is released after all attached arrays have been garbage collected.
+    On Windows, the block is released as soon as no process has it open anymore.
+
+    Attributes:
+        name (str): The name of the shared memory block.
+        layout (Tuple[Tuple[str, str, int, int], ...]): The name, data type, offset and size of each array.
+        attributes (Dict[str, Any]): The attributes of the mesh structure which are not arrays.
+    """
+
+    name: str
+    layout: Tuple[Tuple[str, str, int, int], ...]
+    attributes: Dict[str, Any]
+
+    def unlink(self) -> None:
+        """Removes the shared memory block, so that no more process can attach to it."""
+
+        shared_memory = SharedMemory(name=self.name)
+        shared_memory.close()
+        shared_memory.unlink()
+
+
+class _SharedArray:
+    """For internal use only.
+
+    Exposes a part of a shared memory block as an array interface.
+    Arrays created from it keep the block mapped for as long as they exist.
+    """
+
+    def __init__(self, shared_memory: SharedMemory, dtype: str, offset: int, size: int):
+        self._shared_memory = shared_memory
+        address = ctypes.addressof(ctypes.c_char.from_buffer(shared_memory.buf))
+        self.__array_interface__ = {
+            "shape": (size,),
+            "typestr": dtype,
+            "data": (address + offset, False),
+            "version": 3,
+        }
+
+
+def _open_shared_memory(name: Optional[str] = None, size: int = 0) -> SharedMemory:
+    """For internal use only.
+
+    Creates a new shared memory block, if `name` is None, or attaches to an existing one.
+    The block is not tracked by the resource tracker of this process, which would remove it when the process exits.
+
+    Args:
+        name (str, optional): The name of an existing block.
+        size (int, optional): The size of a new block in bytes.
+
+    Returns:
+        SharedMemory: The shared memory block.
+    """
+
+    create = name is None
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, create=create, size=size, track=False)
+
+    shared_memory = SharedMemory(name, create=create, size=size)
+    if os.name == "posix":
+        resource_tracker.unregister(shared_memory._name, "shared_memory")
+    return shared_memory
+
+
+def split_fields(structure) -> Tuple[Dict[str, ndarray], Dict[str, Any]]:
+    """For internal use only.
+
+    Splits the fields of a mesh structure into arrays and other attributes.
+
+    Args:
+        structure: The dataclass instance holding the arrays.
+
+    Returns:
+        Tuple[Dict[str, ndarray], Dict[str, Any]]: The arrays and the other attributes by field name.
+    """
+
+    arrays = {}
+    attributes = {}
+    for structure_field in fields(structure):
+        value = getattr(structure, structure_field.name)
+        if isinstance(value, ndarray):
+            arrays[structure_field.name] = value
+        else:
+            attributes[structure_field.name] = value
+
+    return arrays, attributes
+
+
+def array_layout(
+    arrays: Dict[str, ndarray]
+) -> Tuple[Tuple[Tuple[str, str, int, int], ...], int]:
+    """For internal use only.
+
+    Places arrays one after another in a single buffer, each one starting at an aligned offset.
+
+    Args:
+        arrays (Dict[str, ndarray]): The arrays by name.
+
+    Returns:
+        Tuple[Tuple[Tuple[str, str, int, int], ...], int]: The name, data type, offset and size of each array
+                                                           and the size of the buffer in bytes.
+    """
+
+    layout = []
+    offset = 0
+    for name, array in arrays.items():
+        layout.append((name, array.dtype.str, offset, array.size))
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+
+    return tuple(layout), offset
+
+
+def to_shared_memory(structure) -> SharedMemoryHandle:
+    """For internal use only.
+
+    Copies the arrays of a mesh structure into a new shared memory block.
+
+    Args:
+        structure: The dataclass instance holding the arrays.
+
+    Returns:
+        SharedMemoryHandle: The handle of the shared memory block.
+    """
+
+    arrays, attributes = split_fields(structure)
+    layout, nbytes = array_layout(arrays)
+
+    # A shared memory block must not be empty
+    shared_memory = _open_shared_memory(size=max(nbytes, 1))
+    try:
+        for name, dtype, offset, size in layout:
+            target = np.ndarray(size, dtype, shared_memory.buf, offset)
+            target[:] = arrays[name].ravel()
+            del target
+    finally:
+        shared_memory.close()
+
+    return SharedMemoryHandle(shared_memory.name, layout, attributes)
+
+
+def from_shared_memory(cls, handle: SharedMemoryHandle, copy: bool = False):
+    """For internal use only.
+
+    Creates a mesh structure from the arrays in a shared memory block.
+
+    Args:
+        cls (type): The dataclass of the mesh structure.
+        handle (SharedMemoryHandle): The handle of the shared memory block.
+        copy (bool, optional): Whether to copy the arrays out of the block, instead of attaching to it.
+                               Default is `False`.
+
+    Returns:
+        The mesh structure.
+    """
+
+    shared_memory = _open_shared_memory(handle.name)
+    arrays = {
+        name: np.asarray(_SharedArray(shared_memory, dtype, offset, size))
+        for name, dtype, offset, size in handle.layout
+    }
+    if copy:
+        arrays = {name: array.copy() for name, array in arrays.items()}
+        shared_memory.close()
+
+    return cls(**arrays, **handle.attributes)
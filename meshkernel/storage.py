@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+import mmap as mmap_module
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+
+from meshkernel.errors import InputError
+from meshkernel.shared_memory import ALIGNMENT, array_layout, split_fields
+
+# The file starts with the magic string, followed by the header size and the JSON header
+_MAGIC = b"\x93MESHKERNEL"
+_HEADER_SIZE_BYTES = 4
+_FORMAT_VERSION = 1
+
+
+def save(structure, path: Union[str, Path]) -> None:
+    """For internal use only.
+
+    Saves the arrays of a mesh structure to a binary file.
+
+    The file starts with a magic string, the size of the header as a little-endian 32-bit integer
+    and a JSON header with the name, data type, offset and size of each array.
+    The raw arrays follow, each one starting at an aligned offset, so that they can be memory-mapped.
+
+    Args:
+        structure: The dataclass instance holding the arrays.
+        path (Union[str, Path]): The path of the file.
+    """
+
+    arrays, attributes = split_fields(structure)
+    layout, _ = array_layout(arrays)
+    header = json.dumps(
+        {
+            "format_version": _FORMAT_VERSION,
+            "type": type(structure).__name__,
+            "arrays": layout,
+            "attributes": attributes,
+        }
+    ).encode("utf-8")
+
+    # The header is padded with spaces, so that the arrays start at an aligned offset
+    header_end = len(_MAGIC) + _HEADER_SIZE_BYTES + len(header)
+    header += b" " * (-header_end % ALIGNMENT)
+
+    with open(path, "wb") as file:
+        file.write(_MAGIC)
+        file.write(len(header).to_bytes(_HEADER_SIZE_BYTES, "little"))
+        file.write(header)
+        data_start = file.tell()
+        for name, _, offset, _ in layout:
+            file.write(b"\0" * (data_start + offset - file.tell()))
+            file.write(memoryview(np.ascontiguousarray(arrays[name])).cast("B"))
+
+
+def load(cls, path: Union[str, Path], mmap: bool = True):
+    """For internal use only.
+
+    Loads a mesh structure saved by `save`.
+
+    Args:
+        cls (type): The dataclass of the mesh structure.
+        path (Union[str, Path]): The path of the file.
+        mmap (bool, optional): Whether to map the arrays read-only into memory instead of reading them.
+                               Default is `True`.
+
+    Raises:
+        InputError: Raised when the file does not contain a mesh structure of type `cls`.
+
+    Returns:
+        The mesh structure.
+    """
+
+    with open(path, "rb") as file:
+        if file.read(len(_MAGIC)) != _MAGIC:
+            raise InputError(f"{path} is not a MeshKernelPy file")
+        header_size = int.from_bytes(file.read(_HEADER_SIZE_BYTES), "little")
+        header = json.loads(file.read(header_size).decode("utf-8"))
+        if header["format_version"] > _FORMAT_VERSION:
+            raise InputError(
+                f"{path} has format version {header['format_version']}, "
+                f"only versions up to {_FORMAT_VERSION} are supported"
+            )
+        if header["type"] != cls.__name__:
+            raise InputError(
+                f"{path} contains a {header['type']}, not a {cls.__name__}"
+            )
+
+        data_start = file.tell()
+        if mmap:
+            buffer = mmap_module.mmap(file.fileno(), 0, access=mmap_module.ACCESS_READ)
+        else:
+            buffer = bytearray(file.seek(0, 2))
+            file.seek(0)
+            file.readinto(buffer)
+
+    arrays = {
+        name: np.frombuffer(buffer, dtype, size, data_start + offset)
+        for name, dtype, offset, size in header["arrays"]
+    }
+
+    return cls(**arrays, **header["attributes"])
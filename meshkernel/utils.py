@@ -1,12 +1,14 @@
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib import colors as mcolors
-from matplotlib.collections import LineCollection
+from matplotlib.collections import LineCollection, PolyCollection
 
+from meshkernel.errors import InputError
 
-def plot_edges(node_x, node_y, edge_nodes, ax, *args, **kwargs):
+
+def plot_edges(node_x, node_y, edge_nodes, ax, *args, level_of_detail=False, **kwargs):
     """Plots the edges at a given axes.
-    `args` and `kwargs` will be used as parameters of the `plot` method.
+    `args` and `kwargs` will be used as parameters of the `LineCollection`.
 
 
     Args:
@@ -14,6 +16,12 @@ def plot_edges(node_x, node_y, edge_nodes, ax, *args, **kwargs):
         node_y (ndarray): A 1D double array describing the y-coordinates of the nodes.
         edge_nodes (ndarray, optional): A 1D integer array describing the nodes composing each mesh 2d edge.
         ax (matplotlib.axes.Axes): The axes where to plot the edges
+        level_of_detail (bool, optional): Whether to only draw the edges within the view limits, keeping a single
+                                          edge per pixel for edges smaller than a pixel. The edges are selected
+                                          again whenever the view limits change. Default is `False`.
+
+    Returns:
+        matplotlib.collections.LineCollection: The collection of edges.
     """
     n_edge = int(edge_nodes.size / 2)
     edge_coords = np.empty((n_edge, 2, 2), dtype=np.float64)
@@ -23,6 +31,666 @@ def plot_edges(node_x, node_y, edge_nodes, ax, *args, **kwargs):
     edge_coords[:, 0, 1] = node_y[node_0]
     edge_coords[:, 1, 0] = node_x[node_1]
     edge_coords[:, 1, 1] = node_y[node_1]
+    if level_of_detail:
+        line_segments = _LevelOfDetailLineCollection(edge_coords, *args, **kwargs)
+        _add_level_of_detail_collection(ax, line_segments)
+        return line_segments
+
     line_segments = LineCollection(edge_coords, *args, **kwargs)
     ax.add_collection(line_segments)
     ax.autoscale(enable=True)
+
+    return line_segments
+
+
+def plot_contacts(
+    mesh1d_node_x,
+    mesh1d_node_y,
+    mesh2d_face_x,
+    mesh2d_face_y,
+    mesh1d_indices,
+    mesh2d_indices,
+    ax,
+    *args,
+    **kwargs,
+):
+    """Plots the contacts between mesh1d nodes and mesh2d faces at a given axes.
+    `args` and `kwargs` will be used as parameters of the `LineCollection`.
+
+    Args:
+        mesh1d_node_x (ndarray): A 1D double array describing the x-coordinates of the mesh1d nodes.
+        mesh1d_node_y (ndarray): A 1D double array describing the y-coordinates of the mesh1d nodes.
+        mesh2d_face_x (ndarray): A 1D double array describing the x-coordinates of the mesh2d face centers.
+        mesh2d_face_y (ndarray): A 1D double array describing the y-coordinates of the mesh2d face centers.
+        mesh1d_indices (ndarray): A 1D integer array describing the mesh1d node of each contact.
+        mesh2d_indices (ndarray): A 1D integer array describing the mesh2d face of each contact.
+        ax (matplotlib.axes.Axes): The axes where to plot the contacts
+
+    Returns:
+        matplotlib.collections.LineCollection: The collection of contacts.
+    """
+    contact_coords = np.empty((mesh1d_indices.size, 2, 2), dtype=np.float64)
+    contact_coords[:, 0, 0] = mesh1d_node_x[mesh1d_indices]
+    contact_coords[:, 0, 1] = mesh1d_node_y[mesh1d_indices]
+    contact_coords[:, 1, 0] = mesh2d_face_x[mesh2d_indices]
+    contact_coords[:, 1, 1] = mesh2d_face_y[mesh2d_indices]
+    line_segments = LineCollection(contact_coords, *args, **kwargs)
+    ax.add_collection(line_segments)
+    ax.autoscale(enable=True)
+
+    return line_segments
+
+
+def plot_faces(
+    node_x,
+    node_y,
+    face_nodes,
+    nodes_per_face,
+    ax,
+    *args,
+    face_values=None,
+    level_of_detail=False,
+    **kwargs,
+):
+    """Plots the faces at a given axes as a single `PolyCollection`.
+    A single positional argument is used as face color, like the format string of the `fill` method.
+    `kwargs` will be used as parameters of the `PolyCollection`.
+
+    The vertices are gathered per group of faces with the same number of nodes, rather than padded
+    to the largest face. The faces are drawn in their own order, faces without nodes are skipped.
+
+    Args:
+        node_x (ndarray): A 1D double array describing the x-coordinates of the nodes.
+        node_y (ndarray): A 1D double array describing the y-coordinates of the nodes.
+        face_nodes (ndarray): A 1D integer array describing the nodes composing each mesh 2d face.
+        nodes_per_face (ndarray): A 1D integer array describing the number of nodes for each face.
+        ax (matplotlib.axes.Axes): The axes where to plot the faces
+        face_values (ndarray, optional): A 1D double array with a value per face, which is mapped to
+                                         the face colors by the colormap of the collection.
+        level_of_detail (bool, optional): Whether to only draw the faces within the view limits, keeping a single
+                                          face per pixel for faces smaller than a pixel. The faces are selected
+                                          again whenever the view limits change. Default is `False`.
+
+    Raises:
+        InputError: Raised when the positional arguments are not a single color.
+
+    Returns:
+        matplotlib.collections.PolyCollection: The collection of faces, e.g. to create a colorbar.
+    """
+    if args:
+        if len(args) > 1 or not mcolors.is_color_like(args[0]):
+            raise InputError(
+                "The only positional argument of `plot_faces` is the face color, "
+                "pass the other parameters of the `PolyCollection` as keyword arguments"
+            )
+        kwargs.setdefault("facecolor", args[0])
+
+    drawn = np.asarray(nodes_per_face) > 0
+    position = np.cumsum(drawn) - 1
+    verts = [None] * int(drawn.sum())
+    face_coords = []
+    positions = []
+    for faces, nodes in _face_node_groups(face_nodes, nodes_per_face):
+        coords = np.stack((node_x[nodes], node_y[nodes]), axis=-1)
+        face_coords.append(coords)
+        positions.append(position[faces])
+        for i, face_verts in zip(position[faces], coords):
+            verts[i] = face_verts
+
+    if face_values is not None:
+        face_values = np.asarray(face_values)[drawn]
+
+    if level_of_detail:
+        collection = _LevelOfDetailPolyCollection(
+            verts, face_coords, positions, face_values, **kwargs
+        )
+        _add_level_of_detail_collection(ax, collection)
+        return collection
+
+    collection = PolyCollection(verts, **kwargs)
+    if face_values is not None:
+        collection.set_array(face_values)
+    ax.add_collection(collection)
+    ax.autoscale(enable=True)
+
+    return collection
+
+
+def _face_node_groups(face_nodes, nodes_per_face):
+    """For internal use only.
+
+    Groups the faces by their number of nodes, skipping the faces without nodes.
+
+    Args:
+        face_nodes (ndarray): A 1D integer array describing the nodes composing each mesh 2d face.
+        nodes_per_face (ndarray): A 1D integer array describing the number of nodes for each face.
+
+    Yields:
+        Tuple[ndarray, ndarray]: The indices of the faces of a group and a 2D integer array with their nodes.
+    """
+    nodes_per_face = np.asarray(nodes_per_face)
+    offsets = np.cumsum(nodes_per_face) - nodes_per_face
+
+    for num_nodes in np.unique(nodes_per_face):
+        if num_nodes <= 0:
+            continue
+        faces = np.flatnonzero(nodes_per_face == num_nodes)
+        yield faces, face_nodes[offsets[faces, np.newaxis] + np.arange(num_nodes)]
+
+
+class _LevelOfDetail:
+    """For internal use only.
+
+    Selects the elements of a mesh, given by groups of elements with the same number of vertices,
+    which are visible in the view limits of an axes.
+    Of the elements smaller than a pixel, only the first one in each pixel is selected.
+
+    Args:
+        coords (List[ndarray]): A 3D double array with the vertices of the elements of each group.
+        positions (List[ndarray], optional): The position of each element of each group among all elements.
+                                             Default is the order of the groups.
+    """
+
+    def __init__(self, coords, positions=None):
+        bounds = [
+            (
+                group[:, :, 0].min(axis=1),
+                group[:, :, 0].max(axis=1),
+                group[:, :, 1].min(axis=1),
+                group[:, :, 1].max(axis=1),
+            )
+            for group in coords
+            if group.size
+        ] or [(np.empty(0),) * 4]
+        bounds = [np.concatenate(bound) for bound in zip(*bounds)]
+        if positions:
+            order = np.concatenate(positions)
+            for i, bound in enumerate(bounds):
+                bounds[i] = np.empty_like(bound)
+                bounds[i][order] = bound
+        self._min_x, self._max_x, self._min_y, self._max_y = bounds
+
+    def datalim(self):
+        """Returns the lower left and upper right corners of all elements, or `None` without elements."""
+        if self._min_x.size == 0:
+            return None
+        return [
+            [self._min_x.min(), self._min_y.min()],
+            [self._max_x.max(), self._max_y.max()],
+        ]
+
+    def select(self, ax):
+        """Selects the visible elements.
+
+        Args:
+            ax (matplotlib.axes.Axes): The axes defining the view limits and the pixel size.
+
+        Returns:
+            ndarray: The sorted indices of the selected elements.
+        """
+        x_0, x_1 = sorted(ax.get_xlim())
+        y_0, y_1 = sorted(ax.get_ylim())
+        visible = np.flatnonzero(
+            (self._max_x >= x_0)
+            & (self._min_x <= x_1)
+            & (self._max_y >= y_0)
+            & (self._min_y <= y_1)
+        )
+
+        columns = max(int(ax.bbox.width), 1)
+        rows = max(int(ax.bbox.height), 1)
+        pixel_x = (x_1 - x_0) / columns
+        pixel_y = (y_1 - y_0) / rows
+        small = (self._max_x[visible] - self._min_x[visible] < pixel_x) & (
+            self._max_y[visible] - self._min_y[visible] < pixel_y
+        )
+        if not small.any():
+            return visible
+
+        small_visible = visible[small]
+        column = np.clip(
+            ((self._min_x[small_visible] - x_0) / pixel_x).astype(np.int64),
+            0,
+            columns - 1,
+        )
+        row = np.clip(
+            ((self._min_y[small_visible] - y_0) / pixel_y).astype(np.int64),
+            0,
+            rows - 1,
+        )
+        _, first = np.unique(row * columns + column, return_index=True)
+
+        return np.sort(np.concatenate((visible[~small], small_visible[first])))
+
+
+class _LevelOfDetailLineCollection(LineCollection):
+    """For internal use only.
+
+    A `LineCollection` drawing only the segments selected by a `_LevelOfDetail` for the current view.
+    """
+
+    def __init__(self, segments, *args, **kwargs):
+        super().__init__([], *args, **kwargs)
+        self._all_segments = segments
+        self._level_of_detail = _LevelOfDetail([segments])
+        self._view = None
+
+    def invalidate_view(self, ax=None):
+        self._view = None
+
+    def draw(self, renderer):
+        view = (self.axes.bbox.width, self.axes.bbox.height)
+        if self._view != view:
+            self.set_segments(
+                self._all_segments[self._level_of_detail.select(self.axes)]
+            )
+            self._view = view
+        super().draw(renderer)
+
+
+class _LevelOfDetailPolyCollection(PolyCollection):
+    """For internal use only.
+
+    A `PolyCollection` drawing only the polygons selected by a `_LevelOfDetail` for the current view.
+    The color limits are those of all values, so that the colors do not change with the view.
+    """
+
+    def __init__(self, verts, coords, positions, values, **kwargs):
+        super().__init__([], **kwargs)
+        self._all_verts = verts
+        self._all_values = None if values is None else np.asarray(values)
+        self._level_of_detail = _LevelOfDetail(coords, positions)
+        self._view = None
+        if self._all_values is not None:
+            self.set_array(self._all_values[:0])
+            self.norm.autoscale_None(self._all_values)
+
+    def invalidate_view(self, ax=None):
+        self._view = None
+
+    def draw(self, renderer):
+        view = (self.axes.bbox.width, self.axes.bbox.height)
+        if self._view != view:
+            selected = self._level_of_detail.select(self.axes)
+            self.set_verts([self._all_verts[i] for i in selected])
+            if self._all_values is not None:
+                self.set_array(self._all_values[selected])
+            self._view = view
+        super().draw(renderer)
+
+
+def _add_level_of_detail_collection(ax, collection):
+    """For internal use only.
+
+    Adds a level of detail collection to an axes, autoscaling the axes to all elements.
+    The elements are selected again on the next draw after the view limits changed.
+
+    Args:
+        ax (matplotlib.axes.Axes): The axes where to add the collection
+        collection: The `_LevelOfDetailLineCollection` or `_LevelOfDetailPolyCollection`.
+    """
+    ax.add_collection(collection, autolim=False)
+    datalim = collection._level_of_detail.datalim()
+    if datalim is not None:
+        ax.update_datalim(datalim)
+    ax.autoscale(enable=True)
+
+    ax.callbacks.connect("xlim_changed", collection.invalidate_view)
+    ax.callbacks.connect("ylim_changed", collection.invalidate_view)
+
+
+# The number of edges, faces or pixel samples which are rasterized at once
+_RASTER_CHUNK_SIZE = 1 << 18
+
+
+def _to_pixels(x, y, extent, shape):
+    """For internal use only.
+
+    Converts coordinates to continuous pixel coordinates, with pixel (0, 0) at the lower left of the extent.
+    """
+    x_min, x_max, y_min, y_max = extent
+    rows, columns = shape
+    return (
+        (x - x_min) * (columns / (x_max - x_min)),
+        (y - y_min) * (rows / (y_max - y_min)),
+    )
+
+
+def _check_raster(extent, shape):
+    """For internal use only.
+
+    Checks that the extent and the shape of an image are not empty.
+
+    Raises:
+        InputError: Raised when the extent or the shape is empty.
+    """
+    x_min, x_max, y_min, y_max = extent
+    if not (x_max > x_min and y_max > y_min):
+        raise InputError(f"The extent {extent} of the image is empty")
+    rows, columns = shape
+    if rows <= 0 or columns <= 0:
+        raise InputError(f"The shape {shape} of the image is empty")
+
+
+def _budget_parts(sizes):
+    """For internal use only.
+
+    Splits consecutive elements into parts whose sizes add up to about `_RASTER_CHUNK_SIZE`.
+    A part exceeds it by at most the size of its last element.
+
+    Args:
+        sizes (ndarray): A 1D integer array with the size of each element, such as its number of samples.
+
+    Returns:
+        Iterator[Tuple[int, int]]: The first and the past the end element of each part.
+    """
+    cumulative = np.cumsum(sizes)
+    total = int(cumulative[-1]) if cumulative.size else 0
+    bounds = np.searchsorted(
+        cumulative, np.arange(_RASTER_CHUNK_SIZE, total, _RASTER_CHUNK_SIZE), "right"
+    )
+    bounds = np.unique(np.concatenate(([0], bounds, [cumulative.size])))
+    return zip(bounds[:-1].tolist(), bounds[1:].tolist())
+
+
+def _pixel_indices(column, row, shape):
+    """For internal use only.
+
+    Converts continuous pixel coordinates within the image to flat pixel indices.
+    """
+    rows, columns = shape
+    column = np.clip(column.astype(np.int64), 0, columns - 1)
+    row = np.clip(row.astype(np.int64), 0, rows - 1)
+    return row * columns + column
+
+
+def rasterize_edges(node_x, node_y, edge_nodes, extent, shape):
+    """Rasterizes the edges into an image counting the edges crossing each pixel.
+    The edges are clipped to the extent and sampled at least once per pixel,
+    so that the cost grows with the image size rather than with the length of the edges.
+    The samples are taken in parts of limited size, so that the memory does not grow with the edges either.
+
+    The image is displayed by `ax.imshow(image, origin="lower", extent=extent)`.
+
+    Args:
+        node_x (ndarray): A 1D double array describing the x-coordinates of the nodes.
+        node_y (ndarray): A 1D double array describing the y-coordinates of the nodes.
+        edge_nodes (ndarray): A 1D integer array describing the nodes composing each mesh edge.
+        extent (Tuple[float, float, float, float]): The x_min, x_max, y_min and y_max of the image.
+        shape (Tuple[int, int]): The number of rows and columns of the image.
+
+    Raises:
+        InputError: Raised when the extent or the shape of the image is empty.
+
+    Returns:
+        ndarray: A 2D integer array with the number of edges crossing each pixel, the first row at the bottom.
+    """
+    _check_raster(extent, shape)
+    rows, columns = shape
+    counts = np.zeros(rows * columns, dtype=np.int64)
+
+    for start in range(0, edge_nodes.size // 2, _RASTER_CHUNK_SIZE):
+        edges = edge_nodes[2 * start : 2 * (start + _RASTER_CHUNK_SIZE)]
+        x_0, y_0 = _to_pixels(node_x[edges[0::2]], node_y[edges[0::2]], extent, shape)
+        x_1, y_1 = _to_pixels(node_x[edges[1::2]], node_y[edges[1::2]], extent, shape)
+        dx = x_1 - x_0
+        dy = y_1 - y_0
+
+        # Clip the edges to the image with the Liang-Barsky algorithm
+        t_enter = np.zeros_like(x_0)
+        t_exit = np.ones_like(x_0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for p_0, d, size in ((x_0, dx, columns), (y_0, dy, rows)):
+                t_a = -p_0 / d
+                t_b = (size - p_0) / d
+                parallel = d == 0
+                inside = (p_0 >= 0) & (p_0 <= size)
+                t_a[parallel] = np.where(inside[parallel], -np.inf, np.inf)
+                t_b[parallel] = np.where(inside[parallel], np.inf, -np.inf)
+                t_enter = np.maximum(t_enter, np.minimum(t_a, t_b))
+                t_exit = np.minimum(t_exit, np.maximum(t_a, t_b))
+
+        visible = np.flatnonzero(t_enter <= t_exit)
+        t_enter = t_enter[visible]
+        t_length = t_exit[visible] - t_enter
+        x_0, y_0, dx, dy = x_0[visible], y_0[visible], dx[visible], dy[visible]
+
+        # Sample each clipped edge at least once per pixel it crosses
+        pixel_length = np.maximum(np.abs(dx), np.abs(dy)) * t_length
+        num_samples = np.ceil(pixel_length).astype(np.int64) + 1
+        for begin, end in _budget_parts(num_samples):
+            part_samples = num_samples[begin:end]
+            edge = np.repeat(np.arange(begin, end), part_samples)
+            first_sample = np.cumsum(part_samples) - part_samples
+            sample = np.arange(edge.size) - first_sample[edge - begin]
+            t = t_enter[edge] + t_length[edge] * (
+                sample / np.maximum(num_samples[edge] - 1, 1)
+            )
+            pixels = _pixel_indices(
+                x_0[edge] + t * dx[edge], y_0[edge] + t * dy[edge], shape
+            )
+
+            # Count every edge once per pixel
+            new_pixel = np.ones(pixels.size, dtype=bool)
+            new_pixel[1:] = (pixels[1:] != pixels[:-1]) | (edge[1:] != edge[:-1])
+            counts += np.bincount(pixels[new_pixel], minlength=counts.size)
+
+    return counts.reshape(shape)
+
+
+def rasterize_faces(
+    node_x, node_y, face_nodes, nodes_per_face, face_values, extent, shape
+):
+    """Rasterizes a value per face into an image holding the mean value of the faces covering each pixel.
+    A face covers the pixels whose centers are inside it. Faces too small to cover any pixel center
+    contribute to the pixel of their center instead, so that no face is lost. Faces without nodes are skipped.
+    The faces are prepared in chunks grouped by their number of nodes and the pixel centers are tested
+    in parts of limited size, so that the memory grows with the chunk and the image size only.
+
+    The image is displayed by `ax.imshow(image, origin="lower", extent=extent)`.
+
+    Args:
+        node_x (ndarray): A 1D double array describing the x-coordinates of the nodes.
+        node_y (ndarray): A 1D double array describing the y-coordinates of the nodes.
+        face_nodes (ndarray): A 1D integer array describing the nodes composing each mesh 2d face.
+        nodes_per_face (ndarray): A 1D integer array describing the number of nodes for each face.
+        face_values (ndarray): A 1D double array with a value per face, such as orthogonality or bathymetry.
+        extent (Tuple[float, float, float, float]): The x_min, x_max, y_min and y_max of the image.
+        shape (Tuple[int, int]): The number of rows and columns of the image.
+
+    Raises:
+        InputError: Raised when the extent or the shape of the image is empty.
+
+    Returns:
+        ndarray: A 2D double array with the mean value of each pixel, the first row at the bottom.
+                 Pixels not covered by any face are NaN.
+    """
+    _check_raster(extent, shape)
+    rows, columns = shape
+    sums = np.zeros(rows * columns, dtype=np.float64)
+    counts = np.zeros(rows * columns, dtype=np.int64)
+    nodes_per_face = np.asarray(nodes_per_face)
+    face_values = np.asarray(face_values, dtype=np.float64)
+
+    node_start = 0
+    for start in range(0, nodes_per_face.size, _RASTER_CHUNK_SIZE):
+        chunk_nodes_per_face = nodes_per_face[start : start + _RASTER_CHUNK_SIZE]
+        node_end = node_start + int(chunk_nodes_per_face.sum())
+        for faces, nodes in _face_node_groups(
+            face_nodes[node_start:node_end], chunk_nodes_per_face
+        ):
+            x, y = _to_pixels(node_x[nodes], node_y[nodes], extent, shape)
+            _rasterize_polygons(x, y, face_values[start + faces], shape, sums, counts)
+        node_start = node_end
+
+    with np.errstate(invalid="ignore"):
+        return (sums / counts).reshape(shape)
+
+
+def _rasterize_polygons(x, y, values, shape, sums, counts):
+    """For internal use only.
+
+    Adds the values of polygons with the same number of vertices to the pixels whose centers are inside them.
+    Polygons too small to cover any pixel center are added to the pixel of their center instead.
+
+    Args:
+        x (ndarray): A 2D double array with the continuous pixel column of the vertices of each polygon.
+        y (ndarray): A 2D double array with the continuous pixel row of the vertices of each polygon.
+        values (ndarray): A 1D double array with the value of each polygon.
+        shape (Tuple[int, int]): The number of rows and columns of the image.
+        sums (ndarray): A 1D double array with the sum of the values of each pixel, which is updated.
+        counts (ndarray): A 1D integer array with the number of values of each pixel, which is updated.
+    """
+    rows, columns = shape
+    num_polygons, num_vertices = x.shape
+    covered = np.zeros(num_polygons, dtype=bool)
+
+    # Split the polygons into fans of triangles
+    num_triangles = max(num_vertices - 2, 0)
+    polygon = np.repeat(np.arange(num_polygons), num_triangles)
+    corner = np.tile(np.arange(1, num_triangles + 1), num_polygons)
+    t_x = np.stack((x[polygon, 0], x[polygon, corner], x[polygon, corner + 1]))
+    t_y = np.stack((y[polygon, 0], y[polygon, corner], y[polygon, corner + 1]))
+
+    # The pixel centers within the bounding box of each triangle
+    column_min = np.maximum(np.ceil(t_x.min(axis=0) - 0.5), 0).astype(np.int64)
+    column_max = np.minimum(np.floor(t_x.max(axis=0) - 0.5), columns - 1)
+    row_min = np.maximum(np.ceil(t_y.min(axis=0) - 0.5), 0).astype(np.int64)
+    row_max = np.minimum(np.floor(t_y.max(axis=0) - 0.5), rows - 1)
+    num_columns = np.maximum(column_max.astype(np.int64) - column_min + 1, 0)
+    num_rows = np.maximum(row_max.astype(np.int64) - row_min + 1, 0)
+    area = (t_x[1] - t_x[0]) * (t_y[2] - t_y[0]) - (t_x[2] - t_x[0]) * (t_y[1] - t_y[0])
+    num_candidates = np.where(area != 0, num_columns * num_rows, 0)
+
+    # The candidates are tested in parts of whole polygons, so that a polygon is counted once per pixel
+    polygon_candidates = num_candidates.reshape(num_polygons, num_triangles).sum(axis=1)
+    for begin, end in _budget_parts(polygon_candidates):
+        begin, end = begin * num_triangles, end * num_triangles
+        part_candidates = num_candidates[begin:end]
+        triangle = np.repeat(np.arange(begin, end), part_candidates)
+        candidate = (
+            np.arange(triangle.size)
+            - (np.cumsum(part_candidates) - part_candidates)[triangle - begin]
+        )
+        column = column_min[triangle] + candidate % num_columns[triangle]
+        row = row_min[triangle] + candidate // num_columns[triangle]
+
+        # A pixel center is inside when it is on the same side of all triangle edges
+        center_x = column + 0.5
+        center_y = row + 0.5
+        sign = np.sign(area[triangle])
+        inside = np.ones(triangle.size, dtype=bool)
+        for i, j in ((0, 1), (1, 2), (2, 0)):
+            x_i, y_i = t_x[i, triangle], t_y[i, triangle]
+            x_j, y_j = t_x[j, triangle], t_y[j, triangle]
+            side = (x_j - x_i) * (center_y - y_i) - (y_j - y_i) * (center_x - x_i)
+            inside &= side * sign >= 0
+
+        # Pixel centers on an edge shared by two triangles of a polygon are counted once
+        pixels, first = np.unique(
+            polygon[triangle[inside]] * (rows * columns)
+            + row[inside] * columns
+            + column[inside],
+            return_index=True,
+        )
+        pixel_polygon = polygon[triangle[inside]][first]
+        pixels = pixels - pixel_polygon * (rows * columns)
+        sums += np.bincount(pixels, weights=values[pixel_polygon], minlength=sums.size)
+        counts += np.bincount(pixels, minlength=counts.size)
+        covered[pixel_polygon] = True
+
+    # Polygons smaller than a pixel contribute to the pixel of their center
+    small = np.flatnonzero(~covered)
+    center_x = x[small].mean(axis=1)
+    center_y = y[small].mean(axis=1)
+    within = (
+        (center_x >= 0) & (center_x <= columns) & (center_y >= 0) & (center_y <= rows)
+    )
+    small = small[within]
+    pixels = _pixel_indices(center_x[within], center_y[within], shape)
+    sums += np.bincount(pixels, weights=values[small], minlength=sums.size)
+    counts += np.bincount(pixels, minlength=counts.size)
+
+
+def _raster_extent_and_shape(node_x, node_y, ax, shape):
+    """For internal use only.
+
+    Returns the extent of the nodes and the shape of the image, by default that of the axes in pixels.
+    An extent of zero width or height, such as that of a straight mesh1d, is padded by half the other size
+    or by 0.5 if all nodes coincide.
+
+    Raises:
+        InputError: Raised when there are no nodes.
+    """
+    if node_x.size == 0:
+        raise InputError("A mesh without nodes cannot be rasterized")
+
+    x_min, x_max = node_x.min(), node_x.max()
+    y_min, y_max = node_y.min(), node_y.max()
+    width = x_max - x_min
+    height = y_max - y_min
+    pad_x = 0.0 if width > 0 else (height / 2 if height > 0 else 0.5)
+    pad_y = 0.0 if height > 0 else (width / 2 if width > 0 else 0.5)
+    extent = (x_min - pad_x, x_max + pad_x, y_min - pad_y, y_max + pad_y)
+
+    if shape is None:
+        shape = (max(int(ax.bbox.height), 1), max(int(ax.bbox.width), 1))
+    return extent, shape
+
+
+def imshow_edges(node_x, node_y, edge_nodes, ax, shape=None, **kwargs):
+    """Plots the edges at a given axes as an image rasterized by `rasterize_edges`.
+    `kwargs` will be used as parameters of the `imshow` method, pixels without edges are transparent.
+
+    Args:
+        node_x (ndarray): A 1D double array describing the x-coordinates of the nodes.
+        node_y (ndarray): A 1D double array describing the y-coordinates of the nodes.
+        edge_nodes (ndarray): A 1D integer array describing the nodes composing each mesh edge.
+        ax (matplotlib.axes.Axes): The axes where to plot the edges
+        shape (Tuple[int, int], optional): The number of rows and columns of the image.
+                                           Default is the size of the axes in pixels.
+
+    Raises:
+        InputError: Raised when there are no nodes.
+
+    Returns:
+        matplotlib.image.AxesImage: The image of the edge counts.
+    """
+    extent, shape = _raster_extent_and_shape(node_x, node_y, ax, shape)
+    image = rasterize_edges(node_x, node_y, edge_nodes, extent, shape)
+    kwargs.setdefault("interpolation", "nearest")
+    return ax.imshow(
+        np.ma.masked_equal(image, 0), origin="lower", extent=extent, **kwargs
+    )
+
+
+def imshow_faces(
+    node_x, node_y, face_nodes, nodes_per_face, face_values, ax, shape=None, **kwargs
+):
+    """Plots a value per face at a given axes as an image rasterized by `rasterize_faces`.
+    `kwargs` will be used as parameters of the `imshow` method, pixels without faces are transparent.
+
+    Args:
+        node_x (ndarray): A 1D double array describing the x-coordinates of the nodes.
+        node_y (ndarray): A 1D double array describing the y-coordinates of the nodes.
+        face_nodes (ndarray): A 1D integer array describing the nodes composing each mesh 2d face.
+        nodes_per_face (ndarray): A 1D integer array describing the number of nodes for each face.
+        face_values (ndarray): A 1D double array with a value per face.
+        ax (matplotlib.axes.Axes): The axes where to plot the faces
+        shape (Tuple[int, int], optional): The number of rows and columns of the image.
+                                           Default is the size of the axes in pixels.
+
+    Raises:
+        InputError: Raised when there are no nodes.
+
+    Returns:
+        matplotlib.image.AxesImage: The image of the face values, e.g. to create a colorbar.
+    """
+    extent, shape = _raster_extent_and_shape(node_x, node_y, ax, shape)
+    image = rasterize_faces(
+        node_x, node_y, face_nodes, nodes_per_face, face_values, extent, shape
+    )
+    kwargs.setdefault("interpolation", "nearest")
+    return ax.imshow(
+        np.ma.masked_invalid(image), origin="lower", extent=extent, **kwargs
+    )
@@ -106,16 +106,17 @@ setup(
     platforms="Windows, Linux",
     install_requires=["numpy"],
     extras_require={
-        "tests": ["pytest", "pytest-cov", "nbval", "matplotlib"],
+        "tests": ["pytest", "pytest-cov", "nbval", "matplotlib", "netCDF4"],
         "lint": [
             "flake8",
             "black==21.4b1",
             "isort",
         ],
         "docs": ["sphinx", "sphinx_book_theme", "myst_nb"],
+        "netcdf": ["netCDF4"],
     },
     python_requires=">=3.8",
-    packages=["meshkernel"],
+    packages=["meshkernel", "meshkernel.io"],
     package_data={
         "meshkernel": [get_meshkernel_name()],
     },
@@ -0,0 +1,101 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from meshkernel import (
+    CopyWarning,
+    GeometryList,
+    get_copied_bytes,
+    reset_copied_bytes,
+    set_strict_copies,
+)
+from meshkernel.arrays import as_c_array
+from meshkernel.c_structures import CGeometryList
+
+
+@pytest.fixture(autouse=True)
+def reset_copies():
+    """Resets the copy bookkeeping before and after each test."""
+    reset_copied_bytes()
+    set_strict_copies(False)
+    yield
+    reset_copied_bytes()
+    set_strict_copies(False)
+
+
+def test_as_c_array_does_not_copy_matching_array():
+    """Tests that `as_c_array` returns a contiguous array of the right type as it is."""
+    array = np.arange(10, dtype=np.double)
+
+    result = as_c_array(array, np.double)
+
+    assert result is array
+    assert get_copied_bytes() == 0
+
+
+def test_as_c_array_does_not_copy_read_only_array():
+    """Tests that `as_c_array` does not require writeable arrays."""
+    array = np.arange(10, dtype=np.int32)
+    array.flags.writeable = False
+
+    result = as_c_array(array, np.int32)
+
+    assert result is array
+    assert get_copied_bytes() == 0
+
+
+def test_as_c_array_does_not_copy_contiguous_2d_array():
+    """Tests that `as_c_array` flattens a contiguous 2D array without copying it."""
+    array = np.arange(10, dtype=np.int32).reshape(5, 2)
+
+    result = as_c_array(array, np.int32)
+
+    assert result.shape == (10,)
+    assert np.shares_memory(result, array)
+    assert get_copied_bytes() == 0
+
+
+@pytest.mark.parametrize(
+    "array, dtype",
+    [
+        (np.arange(10, dtype=np.int64), np.int32),
+        (np.arange(10, dtype=np.float32), np.double),
+        (np.arange(20, dtype=np.double)[::2], np.double),
+        (np.array([True, False, True, True, False]), np.int32),
+    ],
+)
+def test_as_c_array_copies_and_counts(array: np.ndarray, dtype: type):
+    """Tests that `as_c_array` converts arrays of another type or layout and counts the copied bytes."""
+
+    result = as_c_array(array, dtype)
+
+    assert result.dtype == dtype
+    assert result.flags.c_contiguous
+    np.testing.assert_array_equal(result, array)
+    assert get_copied_bytes() == result.nbytes
+
+
+def test_as_c_array_warns_in_strict_mode():
+    """Tests that `as_c_array` issues a `CopyWarning` for copies in strict mode only."""
+    set_strict_copies(True)
+
+    with pytest.warns(CopyWarning, match="node_x"):
+        as_c_array(np.arange(10, dtype=np.float32), np.double, "node_x")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", CopyWarning)
+        as_c_array(np.arange(10, dtype=np.double), np.double, "node_y")
+
+
+def test_cgeometrylist_from_geometrylist_converts_inputs():
+    """Tests that `CGeometryList.from_geometrylist` accepts non-contiguous float32 coordinates."""
+    coordinates = np.arange(20, dtype=np.float32)
+    geometry_list = GeometryList(coordinates[::2], coordinates[1::2])
+
+    c_geometry_list = CGeometryList.from_geometrylist(geometry_list)
+
+    assert c_geometry_list.n_coordinates == 10
+    assert c_geometry_list.x_coordinates[3] == 6.0
+    assert c_geometry_list.y_coordinates[3] == 7.0
+    assert get_copied_bytes() == 2 * 10 * np.dtype(np.double).itemsize
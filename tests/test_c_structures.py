@@ -1,3 +1,6 @@
+import gc
+from ctypes import addressof
+
 import numpy as np
 from numpy.ctypeslib import as_array
 from numpy.testing import assert_array_equal
@@ -7,6 +10,7 @@ from meshkernel import (
     GeometryList,
     Mesh1d,
     Mesh2d,
+    Mesh2dLocation,
     MeshRefinementParameters,
     OrthogonalizationParameters,
 )
@@ -74,6 +78,43 @@ def test_cmesh2d_from_mesh2d():
     assert c_mesh2d.num_face_nodes == 4
 
 
+def test_cmesh2d_from_mesh2d_does_not_copy_inputs():
+    """Tests that `from_mesh2d` points to the memory of matching arrays, even if they are read-only."""
+
+    node_x = np.array([0.0, 1.0, 1.0, 0.0], dtype=np.double)
+    node_y = np.array([0.0, 0.0, 1.0, 1.0], dtype=np.double)
+    edge_nodes = np.array([0, 1, 1, 3, 3, 2, 2, 0], dtype=np.int32)
+    node_x.flags.writeable = False
+    edge_nodes.flags.writeable = False
+
+    c_mesh2d = CMesh2d.from_mesh2d(Mesh2d(node_x, node_y, edge_nodes))
+
+    assert addressof(c_mesh2d.node_x.contents) == node_x.ctypes.data
+    assert addressof(c_mesh2d.node_y.contents) == node_y.ctypes.data
+    assert addressof(c_mesh2d.edge_nodes.contents) == edge_nodes.ctypes.data
+
+
+def test_cmesh2d_from_mesh2d_keeps_converted_arrays_alive():
+    """Tests that arrays converted by `from_mesh2d` live as long as the `CMesh2d` instance."""
+
+    mesh2d = Mesh2d(
+        np.array([0.0, 1.0, 1.0, 0.0], dtype=np.float32),
+        np.array([0.0, 0.0, 1.0, 1.0], dtype=np.float32),
+        np.array([0, 1, 1, 3, 3, 2, 2, 0], dtype=np.int64),
+    )
+
+    c_mesh2d = CMesh2d.from_mesh2d(mesh2d)
+    del mesh2d
+    gc.collect()
+
+    # Overwrite freed memory, if any, by allocating new arrays of the same size
+    _ = [np.full(4, -1.0) for _ in range(10)]
+
+    assert_array_equal(as_array(c_mesh2d.node_x, (4,)), [0.0, 1.0, 1.0, 0.0])
+    assert_array_equal(as_array(c_mesh2d.node_y, (4,)), [0.0, 0.0, 1.0, 1.0])
+    assert_array_equal(as_array(c_mesh2d.edge_nodes, (8,)), [0, 1, 1, 3, 3, 2, 2, 0])
+
+
 def test_cmesh2d_allocate_memory():
     """Tests `allocate_memory` of the `CMesh2D` class."""
 
@@ -96,6 +137,130 @@ def test_cmesh2d_allocate_memory():
     assert mesh2d.face_y.size == 1
 
 
+def test_cmesh2d_allocate_memory_reuses_out():
+    """Tests `allocate_memory` of the `CMesh2D` class reuses the memory of `out`
+    as long as it is large enough."""
+
+    c_mesh2d = CMesh2d()
+    c_mesh2d.num_nodes = 4
+    c_mesh2d.num_edges = 4
+    c_mesh2d.num_faces = 1
+    c_mesh2d.num_face_nodes = 4
+    mesh2d = c_mesh2d.allocate_memory()
+    node_x = mesh2d.node_x
+    edge_nodes = mesh2d.edge_nodes
+
+    # Smaller dimensions reuse the memory
+    c_mesh2d = CMesh2d()
+    c_mesh2d.num_nodes = 3
+    c_mesh2d.num_edges = 3
+    c_mesh2d.num_faces = 1
+    c_mesh2d.num_face_nodes = 3
+    out = c_mesh2d.allocate_memory(mesh2d)
+
+    assert out is mesh2d
+    assert mesh2d.node_x.size == 3
+    assert mesh2d.edge_nodes.size == 6
+    assert mesh2d.face_nodes.size == 3
+    assert np.shares_memory(mesh2d.node_x, node_x)
+    assert np.shares_memory(mesh2d.edge_nodes, edge_nodes)
+
+    # Larger dimensions allocate new memory
+    c_mesh2d = CMesh2d()
+    c_mesh2d.num_nodes = 5
+    c_mesh2d.num_edges = 4
+    c_mesh2d.num_faces = 1
+    c_mesh2d.num_face_nodes = 4
+    c_mesh2d.allocate_memory(mesh2d)
+
+    assert mesh2d.node_x.size == 5
+    assert mesh2d.edge_nodes.size == 8
+    assert not np.shares_memory(mesh2d.node_x, node_x)
+    assert np.shares_memory(mesh2d.edge_nodes, edge_nodes)
+
+
+def test_cmesh2d_allocate_memory_does_not_reuse_foreign_memory():
+    """Tests `allocate_memory` of the `CMesh2D` class does not write outside of the arrays of `out`."""
+
+    coordinates = np.zeros(10, dtype=np.double)
+    mesh2d = Mesh2d(coordinates[5:], coordinates[5:], np.empty(0, dtype=np.int32))
+
+    c_mesh2d = CMesh2d()
+    c_mesh2d.num_nodes = 5
+    c_mesh2d.allocate_memory(mesh2d)
+
+    assert not np.shares_memory(mesh2d.node_x, coordinates)
+    assert not np.shares_memory(mesh2d.node_y, coordinates)
+
+
+def test_cmesh2d_allocate_memory_does_not_grow_into_foreign_memory():
+    """Tests `allocate_memory` of the `CMesh2D` class does not grow arrays viewing the start
+    of a larger foreign buffer, such as a memory pool of the caller."""
+
+    pool = np.arange(8, dtype=np.double)
+    mesh2d = Mesh2d(pool[:4], pool[4:], np.empty(0, dtype=np.int32))
+
+    c_mesh2d = CMesh2d()
+    c_mesh2d.num_nodes = 6
+    c_mesh2d.allocate_memory(mesh2d)
+    mesh2d.node_x[:] = -1.0
+
+    assert not np.shares_memory(mesh2d.node_x, pool)
+    assert not np.shares_memory(mesh2d.node_y, pool)
+    assert_array_equal(pool, np.arange(8, dtype=np.double))
+
+
+def test_cmesh2d_allocate_memory_does_not_share_buffers():
+    """Tests `allocate_memory` of the `CMesh2D` class gives every array its own memory,
+    also when the same array is passed for several fields."""
+
+    coordinates = np.zeros(10, dtype=np.double)
+    mesh2d = Mesh2d(coordinates, coordinates, np.empty(0, dtype=np.int32))
+
+    c_mesh2d = CMesh2d()
+    c_mesh2d.num_nodes = 5
+    c_mesh2d.allocate_memory(mesh2d)
+
+    assert not np.shares_memory(mesh2d.node_x, mesh2d.node_y)
+
+    # The reused memory stays distinct on the next call
+    c_mesh2d.allocate_memory(mesh2d)
+
+    assert not np.shares_memory(mesh2d.node_x, mesh2d.node_y)
+
+
+def test_cmesh2d_allocate_memory_locations():
+    """Tests `allocate_memory` of the `CMesh2D` class only allocates the arrays of the given locations
+    and puts the other arrays into `scratch`."""
+
+    c_mesh2d = CMesh2d()
+    c_mesh2d.num_nodes = 4
+    c_mesh2d.num_edges = 4
+    c_mesh2d.num_faces = 1
+    c_mesh2d.num_face_nodes = 4
+    scratch = Mesh2d(
+        np.empty(0, dtype=np.double),
+        np.empty(0, dtype=np.double),
+        np.empty(0, dtype=np.int32),
+    )
+
+    mesh2d = c_mesh2d.allocate_memory(locations=[Mesh2dLocation.NODES], scratch=scratch)
+
+    assert mesh2d.node_x.size == 4
+    assert mesh2d.node_y.size == 4
+    assert mesh2d.edge_nodes.size == 0
+    assert mesh2d.edge_x.size == 0
+    assert mesh2d.face_nodes.size == 0
+    assert mesh2d.face_x.size == 0
+
+    assert scratch.node_x.size == 0
+    assert scratch.edge_nodes.size == 8
+    assert scratch.edge_x.size == 4
+    assert scratch.face_nodes.size == 4
+    assert scratch.nodes_per_face.size == 1
+    assert scratch.face_y.size == 1
+
+
 def test_cgeometrylist_from_geometrylist():
     """Tests `from_geometrylist` of the `CGeometryList` class."""
 
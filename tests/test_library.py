@@ -0,0 +1,73 @@
+import inspect
+import re
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import c_int
+
+import pytest
+
+import meshkernel.meshkernel
+from meshkernel import MeshKernel
+from meshkernel.library import PROTOTYPES, get_library_path, load_library
+
+cases_get_library_path = [
+    ("Windows", "MeshKernelApi.dll"),
+    ("Linux", "libMeshKernelApi.so"),
+    ("Darwin", "libMeshKernelApi.dylib"),
+]
+
+
+@pytest.mark.parametrize("system, exp_name", cases_get_library_path)
+def test_get_library_path(monkeypatch, system: str, exp_name: str):
+    """Tests `get_library_path` returns the library name of the operating system."""
+
+    monkeypatch.setattr("platform.system", lambda: system)
+
+    assert get_library_path().name == exp_name
+
+
+def test_get_library_path_unsupported_os(monkeypatch):
+    """Tests `get_library_path` raises an `OSError` for an unsupported operating system."""
+
+    monkeypatch.setattr("platform.system", lambda: "Plan9")
+
+    with pytest.raises(OSError):
+        get_library_path()
+
+
+def test_load_library_is_shared():
+    """Tests that the library is loaded once and shared by all `MeshKernel` instances."""
+
+    mk_1 = MeshKernel()
+    mk_2 = MeshKernel()
+
+    assert mk_1.lib is load_library()
+    assert mk_2.lib is load_library()
+
+
+def test_load_library_from_threads():
+    """Tests that concurrent calls of `load_library` return the same library object."""
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        libraries = list(executor.map(lambda _: load_library(), range(32)))
+
+    assert all(library is libraries[0] for library in libraries)
+
+
+def test_prototypes_cover_used_functions():
+    """Tests that every MeshKernel function called by `MeshKernel` has a prototype."""
+
+    source = inspect.getsource(meshkernel.meshkernel)
+    used_functions = set(re.findall(r"\.lib\.(mkernel_\w+)", source))
+
+    assert used_functions <= PROTOTYPES.keys()
+
+
+def test_load_library_sets_prototypes():
+    """Tests that `load_library` sets the argument and return types of the MeshKernel functions."""
+
+    library = load_library()
+
+    for function_name, argtypes in PROTOTYPES.items():
+        function = getattr(library, function_name)
+        assert function.argtypes == argtypes
+        assert function.restype is c_int
@@ -9,10 +9,14 @@ from meshkernel import (
     GeometryList,
     InputError,
     Mesh2d,
+    Mesh2dFactory,
+    Mesh2dLocation,
     MeshKernel,
     MeshKernelError,
     MeshRefinementParameters,
     RefinementType,
+    get_copied_bytes,
+    reset_copied_bytes,
 )
 
 cases_is_geometric_constructor = [(True), (False)]
@@ -66,6 +70,88 @@ def test_mesh2d_set_and_mesh2d_get():
     assert_array_equal(output_mesh2d.edge_y, np.array([0.0, 0.5, 1.0, 0.5]))
 
 
+def test_mesh2d_set_memory_mapped(tmp_path):
+    """Test `mesh2d_set` with a memory-mapped Mesh2d, whose arrays are passed without copying them."""
+    mk = MeshKernel()
+    path = tmp_path / "mesh2d.mk"
+    Mesh2dFactory.create_rectilinear_mesh(2, 3).save(path)
+    mesh2d = Mesh2d.load(path)
+
+    reset_copied_bytes()
+    mk.mesh2d_set(mesh2d)
+
+    assert get_copied_bytes() == 0
+    output_mesh2d = mk.mesh2d_get()
+    assert_array_equal(output_mesh2d.node_x, mesh2d.node_x)
+    assert_array_equal(output_mesh2d.node_y, mesh2d.node_y)
+    assert output_mesh2d.nodes_per_face.size == 6
+
+
+def test_mesh2d_get_out(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_get` fills a given Mesh2d in place and reuses its memory.
+
+    6---7---8
+    |   |   |
+    3---4---5
+    |   |   |
+    0---1---2
+
+    """
+    mk = meshkernel_with_mesh2d(2, 2)
+
+    mesh2d = mk.mesh2d_get()
+    node_x = mesh2d.node_x
+
+    mk.mesh2d_delete_node(4)
+    output_mesh2d = mk.mesh2d_get(out=mesh2d)
+
+    assert output_mesh2d is mesh2d
+    assert mesh2d.node_x.size == 8
+    assert mesh2d.edge_x.size == 8
+    assert mesh2d.face_x.size == 0
+    assert np.shares_memory(mesh2d.node_x, node_x)
+    assert_array_equal(mesh2d.node_x, mk.mesh2d_get().node_x)
+
+
+cases_mesh2d_get_locations = [
+    ([Mesh2dLocation.NODES], 9, 0, 0),
+    ([Mesh2dLocation.EDGES], 0, 12, 0),
+    ([Mesh2dLocation.FACES], 0, 0, 4),
+    ([Mesh2dLocation.NODES, Mesh2dLocation.FACES], 9, 0, 4),
+]
+
+
+@pytest.mark.parametrize(
+    "locations, exp_nodes, exp_edges, exp_faces", cases_mesh2d_get_locations
+)
+def test_mesh2d_get_locations(
+    meshkernel_with_mesh2d: MeshKernel,
+    locations: list,
+    exp_nodes: int,
+    exp_edges: int,
+    exp_faces: int,
+):
+    """Test `mesh2d_get` only returns the arrays of the requested locations of a 2x2 Mesh2d."""
+    mk = meshkernel_with_mesh2d(2, 2)
+    full_mesh2d = mk.mesh2d_get()
+
+    mesh2d = mk.mesh2d_get(locations=locations)
+
+    assert mesh2d.node_x.size == exp_nodes
+    assert mesh2d.node_y.size == exp_nodes
+    assert mesh2d.edge_nodes.size == 2 * exp_edges
+    assert mesh2d.edge_x.size == exp_edges
+    assert mesh2d.face_x.size == exp_faces
+    assert mesh2d.nodes_per_face.size == exp_faces
+
+    if exp_nodes > 0:
+        assert_array_equal(mesh2d.node_x, full_mesh2d.node_x)
+    if exp_edges > 0:
+        assert_array_equal(mesh2d.edge_nodes, full_mesh2d.edge_nodes)
+    if exp_faces > 0:
+        assert_array_equal(mesh2d.face_nodes, full_mesh2d.face_nodes)
+
+
 def test_mesh2d_insert_edge(meshkernel_with_mesh2d: MeshKernel):
     """Test `mesh2d_insert_edge` by inserting one edge within a 1x1 Mesh2d.
 
@@ -86,6 +172,70 @@ def test_mesh2d_insert_edge(meshkernel_with_mesh2d: MeshKernel):
     assert mesh2d.face_x.size == 2
 
 
+def test_mesh2d_insert_edges(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_insert_edges` by inserting both diagonals of the faces of a 2x1 Mesh2d.
+
+    3---4---5
+    |   |   |
+    0---1---2
+    """
+
+    mk = meshkernel_with_mesh2d(1, 2)
+
+    edge_indices = mk.mesh2d_insert_edges(np.array([[0, 4], [1, 5]], dtype=np.int32))
+
+    mesh2d = mk.mesh2d_get()
+
+    assert_array_equal(edge_indices, np.array([7, 8]))
+    assert mesh2d.node_x.size == 6
+    assert mesh2d.edge_x.size == 9
+    assert mesh2d.face_x.size == 4
+
+
+def test_mesh2d_insert_edges_existing_pairs(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_insert_edges` returns the existing edge for node pairs which are already connected.
+
+    3---4---5
+    |   |   |
+    0---1---2
+    """
+
+    mk = meshkernel_with_mesh2d(1, 2)
+
+    edge_indices = mk.mesh2d_insert_edges(
+        np.array([[0, 4], [4, 0], [1, 0]], dtype=np.int32)
+    )
+
+    mesh2d = mk.mesh2d_get()
+
+    assert edge_indices[0] == edge_indices[1] == 7
+    assert_array_equal(
+        np.sort(mesh2d.edge_nodes.reshape(-1, 2)[edge_indices[2]]), [0, 1]
+    )
+    assert mesh2d.edge_x.size == 8
+
+
+def test_mesh2d_insert_edges_invalid_nodes(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_insert_edges` by passing a node outside of the mesh and a node connected to itself."""
+
+    mk = meshkernel_with_mesh2d(1, 1)
+
+    with pytest.raises(InputError):
+        mk.mesh2d_insert_edges(np.array([[0, 4]], dtype=np.int32))
+
+    with pytest.raises(InputError):
+        mk.mesh2d_insert_edges(np.array([[1, 1]], dtype=np.int32))
+
+
+def test_mesh2d_insert_edges_invalid_shape(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_insert_edges` by passing node pairs with an invalid shape."""
+
+    mk = meshkernel_with_mesh2d(1, 1)
+
+    with pytest.raises(InputError):
+        mk.mesh2d_insert_edges(np.array([0, 3, 1], dtype=np.int32))
+
+
 def test_mesh2d_insert_node(meshkernel_with_mesh2d: MeshKernel):
     """Test `mesh2d_insert_node` with a 1x1 Mesh2d.
 
@@ -107,6 +257,37 @@ def test_mesh2d_insert_node(meshkernel_with_mesh2d: MeshKernel):
     assert mesh2d.edge_x.size == 5
 
 
+def test_mesh2d_insert_nodes(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_insert_nodes` by inserting three nodes into a 1x1 Mesh2d.
+
+    2---3
+    |   |
+    0---1
+    """
+
+    mk = meshkernel_with_mesh2d(1, 1)
+
+    node_indices = mk.mesh2d_insert_nodes(
+        np.array([1.5, 2.0, 2.5]), np.array([0.5, 1.0, 1.5])
+    )
+
+    mesh2d = mk.mesh2d_get()
+
+    assert_array_equal(node_indices, np.array([4, 5, 6]))
+    assert mesh2d.node_x.size == 7
+    assert_array_equal(mesh2d.node_x[node_indices], np.array([1.5, 2.0, 2.5]))
+    assert_array_equal(mesh2d.node_y[node_indices], np.array([0.5, 1.0, 1.5]))
+
+
+def test_mesh2d_insert_nodes_different_sizes(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_insert_nodes` by passing coordinate arrays of different sizes."""
+
+    mk = meshkernel_with_mesh2d(1, 1)
+
+    with pytest.raises(InputError):
+        mk.mesh2d_insert_nodes(np.array([1.5, 2.0]), np.array([0.5]))
+
+
 cases_mesh2d_delete_node = [
     (0, 0.0, 0.0),
     (1, 1.0, 0.0),
@@ -157,6 +338,43 @@ def test_mesh2d_delete_node_invalid_node_index(meshkernel_with_mesh2d: MeshKerne
         mk.mesh2d_delete_node(-1)
 
 
+def test_mesh2d_delete_nodes(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_delete_nodes` by deleting two corner nodes from a 2x2 Mesh2d.
+
+    6---7---8
+    |   |   |
+    3---4---5
+    |   |   |
+    0---1---2
+
+    """
+    mk = meshkernel_with_mesh2d(2, 2)
+
+    mk.mesh2d_delete_nodes(np.array([0, 8], dtype=np.int32))
+
+    mesh2d = mk.mesh2d_get()
+
+    assert mesh2d.node_x.size == 7
+    assert mesh2d.edge_x.size == 8
+    assert mesh2d.face_x.size == 2
+
+    for x, y in zip(mesh2d.node_x, mesh2d.node_y):
+        assert x != 0.0 or y != 0.0
+        assert x != 2.0 or y != 2.0
+
+
+def test_mesh2d_delete_nodes_invalid_node_indices(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_delete_nodes` by passing a negative and a too large node index."""
+
+    mk = meshkernel_with_mesh2d(1, 1)
+
+    with pytest.raises(InputError):
+        mk.mesh2d_delete_nodes(np.array([-1], dtype=np.int32))
+
+    with pytest.raises(InputError):
+        mk.mesh2d_delete_nodes(np.array([4], dtype=np.int32))
+
+
 cases_mesh2d_move_node = [
     (0, 0.0, 0.0),
     (1, 1.0, 0.0),
@@ -205,6 +423,103 @@ def test_mesh2d_move_node_invalid_node_index(meshkernel_with_mesh2d: MeshKernel)
         mk.mesh2d_move_node(5.0, 7.0, -1)
 
 
+def test_mesh2d_move_nodes(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_move_nodes` by moving the corner nodes of a 2x2 Mesh2d outwards.
+
+    6---7---8
+    |   |   |
+    3---4---5
+    |   |   |
+    0---1---2
+
+    """
+
+    mk = meshkernel_with_mesh2d(2, 2)
+
+    node_indices = np.array([0, 2, 6, 8], dtype=np.int32)
+    x = np.array([-1.0, 3.0, -1.0, 3.0])
+    y = np.array([-1.0, -1.0, 3.0, 3.0])
+
+    mk.mesh2d_move_nodes(node_indices, x, y)
+
+    mesh2d = mk.mesh2d_get()
+
+    assert mesh2d.node_x.size == 9
+    assert mesh2d.edge_x.size == 12
+    assert mesh2d.face_x.size == 4
+    assert_array_equal(mesh2d.node_x[node_indices], x)
+    assert_array_equal(mesh2d.node_y[node_indices], y)
+    assert mesh2d.node_x[4] == 1.0
+    assert mesh2d.node_y[4] == 1.0
+
+
+cases_mesh2d_move_nodes_invalid_node_indices = [
+    np.array([-1, 2], dtype=np.int32),
+    np.array([0, 9], dtype=np.int32),
+    np.array([1, 1], dtype=np.int32),
+    np.array([1], dtype=np.int32),
+]
+
+
+@pytest.mark.parametrize("node_indices", cases_mesh2d_move_nodes_invalid_node_indices)
+def test_mesh2d_move_nodes_invalid_node_indices(
+    meshkernel_with_mesh2d: MeshKernel, node_indices: ndarray
+):
+    """Test `mesh2d_move_nodes` by passing negative, too large, duplicate or too few `node_indices`."""
+
+    mk = meshkernel_with_mesh2d(2, 2)
+
+    with pytest.raises(InputError):
+        mk.mesh2d_move_nodes(node_indices, np.array([5.0, 6.0]), np.array([7.0, 8.0]))
+
+
+def test_mesh2d_set_node_coordinates(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_set_node_coordinates` by scaling and shifting the nodes of a 2x2 Mesh2d."""
+
+    mk = meshkernel_with_mesh2d(2, 2)
+    mesh2d = mk.mesh2d_get()
+
+    mk.mesh2d_set_node_coordinates(2.0 * mesh2d.node_x + 1.0, 3.0 * mesh2d.node_y)
+
+    output_mesh2d = mk.mesh2d_get()
+
+    assert_array_equal(output_mesh2d.node_x, 2.0 * mesh2d.node_x + 1.0)
+    assert_array_equal(output_mesh2d.node_y, 3.0 * mesh2d.node_y)
+    assert_array_equal(output_mesh2d.edge_nodes, mesh2d.edge_nodes)
+    assert_array_equal(output_mesh2d.face_nodes, mesh2d.face_nodes)
+    assert_array_equal(output_mesh2d.face_x, 2.0 * mesh2d.face_x + 1.0)
+
+
+def test_mesh2d_set_node_coordinates_with_edges(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_set_node_coordinates` by passing the edges of the mesh, which skips getting them."""
+
+    mk = meshkernel_with_mesh2d(2, 2)
+    mesh2d = mk.mesh2d_get()
+
+    mk.mesh2d_set_node_coordinates(
+        mesh2d.node_x + 1.0, mesh2d.node_y, edge_nodes=mesh2d.edge_nodes
+    )
+
+    output_mesh2d = mk.mesh2d_get()
+
+    assert_array_equal(output_mesh2d.node_x, mesh2d.node_x + 1.0)
+    assert_array_equal(output_mesh2d.edge_nodes, mesh2d.edge_nodes)
+
+    with pytest.raises(InputError):
+        mk.mesh2d_set_node_coordinates(
+            mesh2d.node_x, mesh2d.node_y, edge_nodes=mesh2d.edge_nodes[:4]
+        )
+
+
+def test_mesh2d_set_node_coordinates_invalid_size(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_set_node_coordinates` by passing less coordinates than there are nodes."""
+
+    mk = meshkernel_with_mesh2d(1, 1)
+
+    with pytest.raises(InputError):
+        mk.mesh2d_set_node_coordinates(np.zeros(3), np.zeros(3))
+
+
 cases_mesh2d_delete_edge = [
     (0.5, 0.0),
     (1.5, 0.0),
@@ -248,6 +563,69 @@ def test_mesh2d_delete_edge(
         assert x != delete_x or y != delete_y
 
 
+def test_mesh2d_delete_edges(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_delete_edges` by deleting two boundary edges from a 2x2 Mesh2d.
+
+    6---7-x-8
+    |   |   |
+    3---4---5
+    x   |   |
+    0---1---2
+
+    """
+    mk = meshkernel_with_mesh2d(2, 2)
+
+    edge_indices = mk.mesh2d_get_edges(np.array([0.0, 1.5]), np.array([0.5, 2.0]))
+    mk.mesh2d_delete_edges(edge_indices)
+
+    mesh2d = mk.mesh2d_get()
+
+    assert mesh2d.node_x.size == 9
+    assert mesh2d.edge_x.size == 10
+    assert mesh2d.face_x.size == 2
+
+    for x, y in zip(mesh2d.edge_x, mesh2d.edge_y):
+        assert x != 0.0 or y != 0.5
+        assert x != 1.5 or y != 2.0
+
+
+def test_mesh2d_delete_edges_by_points(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_delete_edges` by deleting the edges closest to two points from a 2x2 Mesh2d.
+
+    6---7-x-8
+    |   |   |
+    3---4---5
+    x   |   |
+    0---1---2
+
+    """
+    mk = meshkernel_with_mesh2d(2, 2)
+
+    mk.mesh2d_delete_edges(x=np.array([0.0, 1.5]), y=np.array([0.5, 2.0]))
+
+    mesh2d = mk.mesh2d_get()
+
+    assert mesh2d.edge_x.size == 10
+    for x, y in zip(mesh2d.edge_x, mesh2d.edge_y):
+        assert x != 0.0 or y != 0.5
+        assert x != 1.5 or y != 2.0
+
+
+def test_mesh2d_delete_edges_needs_indices_or_points(
+    meshkernel_with_mesh2d: MeshKernel,
+):
+    """Test `mesh2d_delete_edges` raises an `InputError` when neither or both indices and points are given."""
+    mk = meshkernel_with_mesh2d(1, 1)
+
+    with pytest.raises(InputError):
+        mk.mesh2d_delete_edges()
+
+    with pytest.raises(InputError):
+        mk.mesh2d_delete_edges(
+            np.array([0], dtype=np.int32), np.array([0.0]), np.array([0.5])
+        )
+
+
 cases_mesh2d_get_edge = [
     (0.5, 0.0, 2),
     (1.0, 0.5, 1),
@@ -277,6 +655,28 @@ def test_mesh2d_get_edge(
     assert edge_index == exp_index
 
 
+def test_mesh2d_get_edges(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_get_edges` on a 1x1 Mesh2d.
+
+        (3)
+       2---3
+    (0)|   |(1)
+       0---1
+        (2)
+
+    """
+
+    mk = meshkernel_with_mesh2d(1, 1)
+
+    x = np.array([point[0] for point in cases_mesh2d_get_edge])
+    y = np.array([point[1] for point in cases_mesh2d_get_edge])
+    exp_indices = np.array([point[2] for point in cases_mesh2d_get_edge])
+
+    edge_indices = mk.mesh2d_get_edges(x, y)
+
+    assert_array_equal(edge_indices, exp_indices)
+
+
 cases_mesh2d_get_node_index = [
     (0.0, 0.0, 0),
     (0.4, 0.0, 0),
@@ -323,6 +723,48 @@ def test_mesh2d_get_node_index_no_node_in_search_radius(
         mk.mesh2d_get_node_index(0.5, 0.5, 0.4)
 
 
+def test_mesh2d_get_node_indices(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_get_node_indices` on a 1x1 Mesh2d.
+    The point in the middle of the face has no node within the search radius.
+
+    2---3
+    |   |
+    0---1
+
+    """
+
+    mk = meshkernel_with_mesh2d(1, 1)
+
+    x = np.array([point[0] for point in cases_mesh2d_get_node_index] + [0.5])
+    y = np.array([point[1] for point in cases_mesh2d_get_node_index] + [0.5])
+    exp_indices = np.array([point[2] for point in cases_mesh2d_get_node_index] + [-1])
+
+    node_indices = mk.mesh2d_get_node_indices(x, y, 0.5)
+
+    assert_array_equal(node_indices, exp_indices)
+
+
+def test_mesh2d_get_node_indices_empty_mesh():
+    """Tests `mesh2d_get_node_indices` raises an `InputError` for a state without mesh,
+    instead of returning -1 for every point."""
+
+    mk = MeshKernel()
+
+    with pytest.raises(InputError):
+        mk.mesh2d_get_node_indices(np.array([0.0]), np.array([0.0]), 0.5)
+
+
+def test_mesh2d_get_node_indices_invalid_search_radius(
+    meshkernel_with_mesh2d: MeshKernel,
+):
+    """Tests `mesh2d_get_node_indices` raises an `InputError` for a search radius which is not positive."""
+
+    mk = meshkernel_with_mesh2d(1, 1)
+
+    with pytest.raises(InputError):
+        mk.mesh2d_get_node_indices(np.array([0.0]), np.array([0.0]), 0.0)
+
+
 cases_mesh2d_delete_small_polygon = [
     (True, DeleteMeshOption.ALL_NODES, 4, 4, 1),
     (True, DeleteMeshOption.ALL_FACE_CIRCUMCENTERS, 16, 24, 9),
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from meshkernel import GeometryList, InputError, Mesh2dFactory
+from meshkernel.parallel import MeshJob, MeshKernelCall, run_jobs
+
+
+def test_run_jobs_rejects_unknown_methods():
+    """Tests that `run_jobs` rejects calls of private or unknown methods before starting any process."""
+
+    with pytest.raises(InputError):
+        run_jobs([MeshJob([MeshKernelCall("_deallocate_state")])])
+
+    with pytest.raises(InputError):
+        run_jobs([MeshJob([MeshKernelCall("mesh2d_does_not_exist")])])
+
+
+def test_run_jobs():
+    """Tests `run_jobs` by editing and querying meshes of different sizes in worker processes."""
+
+    polygon = GeometryList(
+        np.array([-0.5, 1.5, 1.5, -0.5, -0.5]), np.array([-0.5, -0.5, 1.5, 1.5, -0.5])
+    )
+    jobs = [
+        MeshJob(
+            [
+                MeshKernelCall("mesh2d_insert_node", (-1.0, -1.0)),
+                MeshKernelCall("mesh2d_get_nodes_in_polygons", (polygon, True)),
+            ],
+            Mesh2dFactory.create_rectilinear_mesh(rows, 3),
+        )
+        for rows in range(1, 9)
+    ]
+
+    results = run_jobs(jobs, max_workers=2)
+
+    assert len(results) == len(jobs)
+    for rows, result in zip(range(1, 9), results):
+        assert result.mesh2d.node_x.size == (rows + 1) * 4 + 1
+        assert result.return_values[0] == (rows + 1) * 4
+        assert_array_equal(np.sort(result.return_values[1]), [0, 1, 4, 5])
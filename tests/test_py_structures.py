@@ -1,16 +1,27 @@
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import pytest
+from numpy.testing import assert_array_equal
 
 from meshkernel import (
     AveragingMethod,
+    Contacts,
     DeleteMeshOption,
     GeometryList,
+    InputError,
+    Mesh1d,
     Mesh2d,
+    Mesh2dFactory,
     Mesh2dLocation,
     MeshRefinementParameters,
+    MultiPolygon,
     OrthogonalizationParameters,
     ProjectToLandBoundaryOption,
     RefinementType,
+    SharedMemoryHandle,
 )
 
 cases_deletemeshoption_values = [
@@ -123,6 +134,52 @@ def test_geometrylist_constructor():
     assert geometry_list.inner_outer_separator == -998.0
 
 
+def test_mesh2d_default_arrays_are_not_shared():
+    """Tests that the default arrays of two `Mesh2d` instances are different objects."""
+
+    node_x = np.array([0.0, 1.0], dtype=np.double)
+    node_y = np.array([0.0, 0.0], dtype=np.double)
+    edge_nodes = np.array([0, 1], dtype=np.int32)
+
+    mesh2d_1 = Mesh2d(node_x, node_y, edge_nodes)
+    mesh2d_2 = Mesh2d(node_x, node_y, edge_nodes)
+
+    assert mesh2d_1.face_nodes is not mesh2d_2.face_nodes
+    assert mesh2d_1.nodes_per_face is not mesh2d_2.nodes_per_face
+    assert mesh2d_1.edge_x is not mesh2d_2.edge_x
+    assert mesh2d_1.edge_y is not mesh2d_2.edge_y
+    assert mesh2d_1.face_x is not mesh2d_2.face_x
+    assert mesh2d_1.face_y is not mesh2d_2.face_y
+    assert mesh2d_1.face_nodes.dtype == np.int32
+    assert mesh2d_1.face_x.dtype == np.double
+
+
+def test_geometrylist_default_arrays_are_not_shared():
+    """Tests that the default values of two `GeometryList` instances are different objects."""
+
+    x_coordinates = np.array([0.0, 1.0], dtype=np.double)
+    y_coordinates = np.array([0.0, 0.0], dtype=np.double)
+
+    geometry_list_1 = GeometryList(x_coordinates, y_coordinates)
+    geometry_list_2 = GeometryList(x_coordinates, y_coordinates)
+
+    assert geometry_list_1.values is not geometry_list_2.values
+    assert geometry_list_1.values.dtype == np.double
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="dataclasses support slots as of Python 3.10"
+)
+@pytest.mark.parametrize(
+    "structure", [Mesh2d, GeometryList, Mesh1d, Contacts, MultiPolygon]
+)
+def test_structures_use_slots(structure: type):
+    """Tests that the array containers declare `__slots__` instead of an instance `__dict__`."""
+
+    assert "__slots__" in vars(structure)
+    assert "__dict__" not in vars(structure)
+
+
 def test_orthogonalizationparameters_constructor():
     """Tests the default values after constructing a `OrthogonalizationParameters`."""
 
@@ -150,3 +207,195 @@ def test_meshrefinementparameter_constructor_defaults():
     assert parameters.connect_hanging_nodes is False
     assert parameters.account_for_samples_outside_face is True
     assert parameters.max_refinement_iterations == 10
+
+
+def _attach_in_other_process(handle: SharedMemoryHandle) -> float:
+    """Attaches to a Mesh2d in shared memory, modifies it and returns the sum of its y-coordinates."""
+
+    mesh2d = Mesh2d.from_shared_memory(handle)
+    mesh2d.node_x[0] = -1.0
+    return float(mesh2d.node_y.sum())
+
+
+def test_mesh2d_shared_memory():
+    """Tests that a Mesh2d in shared memory can be attached to by another process without copying."""
+
+    mesh2d = Mesh2dFactory.create_rectilinear_mesh(3, 4)
+    mesh2d.face_x = np.arange(12, dtype=np.double)
+
+    handle = mesh2d.to_shared_memory()
+    try:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            node_y_sum = executor.submit(_attach_in_other_process, handle).result()
+        attached = Mesh2d.from_shared_memory(handle)
+    finally:
+        handle.unlink()
+
+    assert node_y_sum == mesh2d.node_y.sum()
+
+    # The modification of the other process is visible
+    assert attached.node_x[0] == -1.0
+    assert_array_equal(attached.node_x[1:], mesh2d.node_x[1:])
+    assert_array_equal(attached.edge_nodes, mesh2d.edge_nodes)
+    assert_array_equal(attached.face_x, mesh2d.face_x)
+    assert attached.edge_nodes.dtype == np.int32
+    assert attached.face_y.size == 0
+
+
+def test_geometrylist_shared_memory_copy():
+    """Tests that a GeometryList copied out of shared memory keeps its arrays and separators."""
+
+    geometry_list = GeometryList(
+        np.array([0.0, 1.0, -1.0, 2.0]),
+        np.array([0.0, 1.0, -1.0, 2.0]),
+        np.array([5.0, 6.0, -1.0, 7.0]),
+        geometry_separator=-1.0,
+    )
+
+    handle = geometry_list.to_shared_memory()
+    copied = GeometryList.from_shared_memory(handle, copy=True)
+    handle.unlink()
+
+    assert_array_equal(copied.x_coordinates, geometry_list.x_coordinates)
+    assert_array_equal(copied.y_coordinates, geometry_list.y_coordinates)
+    assert_array_equal(copied.values, geometry_list.values)
+    assert copied.geometry_separator == -1.0
+    assert copied.inner_outer_separator == -998.0
+
+
+def test_mesh1d_shared_memory_handle_is_picklable():
+    """Tests that the handle of a Mesh1d in shared memory can be pickled."""
+
+    mesh1d = Mesh1d(
+        np.array([0.0, 1.0, 2.0]), np.array([0.0, 0.0, 0.0]), np.array([0, 1, 1, 2])
+    )
+
+    handle = pickle.loads(pickle.dumps(mesh1d.to_shared_memory()))
+    attached = Mesh1d.from_shared_memory(handle)
+    handle.unlink()
+
+    assert_array_equal(attached.node_x, mesh1d.node_x)
+    assert_array_equal(attached.edge_nodes, mesh1d.edge_nodes)
+
+
+def test_mesh2d_pickle_out_of_band():
+    """Tests that a Mesh2d pickled with protocol 5 passes its arrays as out-of-band buffers."""
+
+    mesh2d = Mesh2dFactory.create_rectilinear_mesh(3, 4)
+
+    buffers = []
+    data = pickle.dumps(mesh2d, protocol=5, buffer_callback=buffers.append)
+    unpickled = pickle.loads(data, buffers=buffers)
+
+    assert len(buffers) == 9
+    assert np.shares_memory(unpickled.node_x, mesh2d.node_x)
+    assert np.shares_memory(unpickled.edge_nodes, mesh2d.edge_nodes)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_mesh2d_save_and_load(tmp_path, mmap: bool):
+    """Tests that a saved Mesh2d is loaded with the same arrays and data types."""
+
+    mesh2d = Mesh2dFactory.create_rectilinear_mesh(3, 4)
+    mesh2d.face_x = np.arange(12, dtype=np.double)
+    path = tmp_path / "mesh2d.mk"
+
+    mesh2d.save(path)
+    loaded = Mesh2d.load(path, mmap=mmap)
+
+    for name in Mesh2d.__dataclass_fields__:
+        assert_array_equal(getattr(loaded, name), getattr(mesh2d, name))
+        assert getattr(loaded, name).dtype == getattr(mesh2d, name).dtype
+        assert getattr(loaded, name).flags.writeable != mmap
+        if mmap:
+            # The arrays are aligned within the page-aligned memory map
+            assert getattr(loaded, name).ctypes.data % 64 == 0
+
+
+def test_mesh2d_load_rejects_other_files(tmp_path):
+    """Tests that `Mesh2d.load` raises an `InputError` for files which do not contain a Mesh2d."""
+
+    path = tmp_path / "mesh2d.mk"
+    path.write_bytes(b"node_x,node_y")
+
+    with pytest.raises(InputError):
+        Mesh2d.load(path)
+
+
+def test_multipolygon_from_and_to_geometry_list():
+    """Tests that separators are converted to offsets and back.
+
+    The first polygon has a hole, the second one has none.
+    """
+
+    x_coordinates = np.array(
+        [0.0, 4.0, 4.0, 0.0, -998.0, 1.0, 2.0, 1.0, -999.0, 5.0, 6.0, 5.0]
+    )
+    y_coordinates = np.array(
+        [0.0, 0.0, 4.0, 4.0, -998.0, 1.0, 1.0, 2.0, -999.0, 0.0, 0.0, 1.0]
+    )
+    geometry_list = GeometryList(x_coordinates, y_coordinates)
+
+    multipolygon = MultiPolygon.from_geometry_list(geometry_list)
+
+    assert multipolygon.num_polygons == 2
+    assert_array_equal(multipolygon.ring_offsets, [0, 4, 7, 10])
+    assert_array_equal(multipolygon.polygon_offsets, [0, 2, 3])
+    assert_array_equal(
+        multipolygon.x_coordinates, [0.0, 4.0, 4.0, 0.0, 1.0, 2.0, 1.0, 5.0, 6.0, 5.0]
+    )
+
+    converted = multipolygon.to_geometry_list()
+    assert_array_equal(converted.x_coordinates, x_coordinates)
+    assert_array_equal(converted.y_coordinates, y_coordinates)
+    assert converted.values.size == 0
+
+
+def test_multipolygon_polygon():
+    """Tests that a single polygon is accessed as views of the coordinates."""
+
+    multipolygon = MultiPolygon(
+        x_coordinates=np.array([0.0, 4.0, 4.0, 1.0, 2.0, 1.0, 5.0, 6.0, 5.0]),
+        y_coordinates=np.array([0.0, 0.0, 4.0, 1.0, 1.0, 2.0, 0.0, 0.0, 1.0]),
+        values=np.arange(9, dtype=np.double),
+        ring_offsets=np.array([0, 3, 6, 9], dtype=np.int32),
+        polygon_offsets=np.array([0, 1, 3], dtype=np.int32),
+    )
+
+    polygon = multipolygon.polygon(1)
+
+    assert polygon.num_polygons == 1
+    assert_array_equal(polygon.ring_offsets, [0, 3, 6])
+    assert_array_equal(polygon.values, [3.0, 4.0, 5.0, 6.0, 7.0, 8.0])
+    assert np.shares_memory(polygon.x_coordinates, multipolygon.x_coordinates)
+    assert_array_equal(multipolygon.polygon(-1).x_coordinates, polygon.x_coordinates)
+    with pytest.raises(IndexError):
+        multipolygon.polygon(2)
+
+
+def test_multipolygon_bounding_boxes():
+    """Tests the bounding box of each polygon, including an empty one."""
+
+    multipolygon = MultiPolygon(
+        x_coordinates=np.array([0.0, 4.0, 4.0, 5.0, 6.0, 5.0]),
+        y_coordinates=np.array([0.0, 0.0, 3.0, -1.0, 0.0, 1.0]),
+        ring_offsets=np.array([0, 3, 3, 6], dtype=np.int32),
+        polygon_offsets=np.array([0, 1, 2, 3], dtype=np.int32),
+    )
+
+    assert_array_equal(
+        multipolygon.bounding_boxes(),
+        [[0.0, 0.0, 4.0, 3.0], [np.nan] * 4, [5.0, -1.0, 6.0, 1.0]],
+    )
+
+
+def test_multipolygon_empty():
+    """Tests that an empty MultiPolygon converts to and from an empty GeometryList."""
+
+    multipolygon = MultiPolygon.from_geometry_list(
+        GeometryList(np.empty(0, dtype=np.double), np.empty(0, dtype=np.double))
+    )
+
+    assert multipolygon.num_polygons == 0
+    assert multipolygon.bounding_boxes().shape == (0, 4)
+    assert multipolygon.to_geometry_list().x_coordinates.size == 0
@@ -0,0 +1,147 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from meshkernel import Mesh2dFactory, MeshKernel, MeshKernelError
+from meshkernel.library import StateLock
+
+NUM_THREADS = 8
+
+
+def test_state_lock_is_shared():
+    """Tests that several threads can hold a `StateLock` shared at the same time."""
+
+    state_lock = StateLock()
+    barrier = threading.Barrier(NUM_THREADS, timeout=10.0)
+
+    def hold_shared():
+        state_lock.acquire_shared()
+        try:
+            # Every thread has to hold the lock before any of them can pass
+            barrier.wait()
+        finally:
+            state_lock.release_shared()
+
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        for future in [executor.submit(hold_shared) for _ in range(NUM_THREADS)]:
+            future.result()
+
+
+def test_state_lock_exclusive_waits_for_shared():
+    """Tests that acquiring a `StateLock` exclusively waits until no thread holds it shared."""
+
+    state_lock = StateLock()
+    acquired = threading.Event()
+
+    def acquire_exclusive():
+        state_lock.acquire_exclusive()
+        acquired.set()
+        state_lock.release_exclusive()
+
+    state_lock.acquire_shared()
+    thread = threading.Thread(target=acquire_exclusive)
+    thread.start()
+
+    assert not acquired.wait(0.1)
+
+    state_lock.release_shared()
+    thread.join(10.0)
+
+    assert acquired.is_set()
+
+
+def test_state_lock_shared_waits_for_exclusive():
+    """Tests that acquiring a `StateLock` shared waits while it is held exclusively."""
+
+    state_lock = StateLock()
+    acquired = threading.Event()
+
+    def acquire_shared():
+        state_lock.acquire_shared()
+        acquired.set()
+        state_lock.release_shared()
+
+    assert state_lock.acquire_exclusive()
+    thread = threading.Thread(target=acquire_shared)
+    thread.start()
+
+    assert not acquired.wait(0.1)
+
+    state_lock.release_exclusive()
+    thread.join(10.0)
+
+    assert acquired.is_set()
+
+
+def test_state_lock_exclusive_within_held_lock():
+    """Tests that a thread holding a `StateLock` shared can acquire it shared again,
+    but does not wait for it exclusively while holding it."""
+
+    state_lock = StateLock()
+
+    state_lock.acquire_shared()
+    state_lock.acquire_shared()
+    assert not state_lock.acquire_exclusive()
+    state_lock.release_shared()
+    state_lock.release_shared()
+
+    assert state_lock.acquire_exclusive()
+    assert not state_lock.acquire_exclusive()
+    state_lock.release_exclusive()
+
+
+def test_meshkernel_instances_in_threads():
+    """Stress test driving independent `MeshKernel` instances from several threads at the same time.
+    Each thread works on a mesh of a different size and checks its own results."""
+
+    def process_mesh(rows: int) -> int:
+        mk = MeshKernel()
+        mk.mesh2d_set(Mesh2dFactory.create_rectilinear_mesh(rows, 10))
+
+        for _ in range(20):
+            mesh2d = mk.mesh2d_get()
+            assert mesh2d.node_x.size == (rows + 1) * 11
+            assert mesh2d.nodes_per_face.size == rows * 10
+
+            node_index = mk.mesh2d_get_node_index(10.0, float(rows), 0.5)
+            assert node_index == (rows + 1) * 11 - 1
+
+            with pytest.raises(MeshKernelError):
+                mk.mesh2d_get_node_index(0.5, 0.5, 0.1)
+
+        node_index = mk.mesh2d_insert_node(-1.0, -1.0)
+        mk.mesh2d_insert_edge(0, node_index)
+
+        return mk.mesh2d_get().node_x.size
+
+    all_rows = np.arange(1, 4 * NUM_THREADS + 1)
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        num_nodes = list(executor.map(process_mesh, all_rows))
+
+    assert num_nodes == [(rows + 1) * 11 + 1 for rows in all_rows]
+
+
+def test_meshkernel_instances_created_and_collected_in_threads():
+    """Stress test allocating and deallocating `MeshKernel` instances from several threads,
+    while other threads call MeshKernel."""
+
+    mk = MeshKernel()
+    mk.mesh2d_set(Mesh2dFactory.create_rectilinear_mesh(50, 50))
+    stop = time.perf_counter() + 2.0
+
+    def call_meshkernel():
+        while time.perf_counter() < stop:
+            assert mk.mesh2d_get().node_x.size == 51 * 51
+
+    def create_meshkernel():
+        while time.perf_counter() < stop:
+            MeshKernel().mesh2d_set(Mesh2dFactory.create_rectilinear_mesh(3, 3))
+
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        futures = [executor.submit(call_meshkernel) for _ in range(NUM_THREADS // 2)]
+        futures += [executor.submit(create_meshkernel) for _ in range(NUM_THREADS // 2)]
+        for future in futures:
+            future.result()
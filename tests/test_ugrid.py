@@ -0,0 +1,188 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from meshkernel import Contacts, InputError, Mesh1d, Mesh2d, Mesh2dLocation
+from meshkernel.io import ugrid
+
+netCDF4 = pytest.importorskip("netCDF4")
+
+
+def mixed_mesh2d() -> Mesh2d:
+    """Creates a Mesh2d with a quadrilateral and a triangle face.
+
+    3---2---4
+    |   |  /
+    0---1
+    """
+
+    return Mesh2d(
+        node_x=np.array([0.0, 1.0, 1.0, 0.0, 2.0], dtype=np.double),
+        node_y=np.array([0.0, 0.0, 1.0, 1.0, 1.0], dtype=np.double),
+        edge_nodes=np.array([0, 1, 1, 2, 2, 3, 3, 0, 2, 4, 4, 1], dtype=np.int32),
+        face_nodes=np.array([0, 1, 2, 3, 1, 4, 2], dtype=np.int32),
+        nodes_per_face=np.array([4, 3], dtype=np.int32),
+        face_x=np.array([0.5, 1.333], dtype=np.double),
+        face_y=np.array([0.5, 0.667], dtype=np.double),
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1 << 20])
+def test_mesh2d_write_and_read(tmp_path, monkeypatch, chunk_size: int):
+    """Tests that a Mesh2d with faces of different sizes is read as written,
+    also when the variables are accessed in several chunks."""
+
+    monkeypatch.setattr(ugrid, "_CHUNK_SIZE", chunk_size)
+    mesh2d = mixed_mesh2d()
+    path = tmp_path / "mesh2d.nc"
+
+    ugrid.write_mesh2d(path, mesh2d)
+    read = ugrid.read_mesh2d(path)
+
+    for name in Mesh2d.__dataclass_fields__:
+        assert_array_equal(getattr(read, name), getattr(mesh2d, name))
+        assert getattr(read, name).dtype == getattr(mesh2d, name).dtype
+
+    with netCDF4.Dataset(path) as dataset:
+        assert dataset.variables["mesh2d"].cf_role == "mesh_topology"
+        assert_array_equal(
+            dataset.variables["mesh2d_face_nodes"][:].filled(),
+            [[0, 1, 2, 3], [1, 4, 2, -999]],
+        )
+
+
+def test_mesh2d_read_locations(tmp_path):
+    """Tests that only the arrays of the requested locations are read."""
+
+    mesh2d = mixed_mesh2d()
+    path = tmp_path / "mesh2d.nc"
+    ugrid.write_mesh2d(path, mesh2d)
+
+    read = ugrid.read_mesh2d(path, locations=[Mesh2dLocation.NODES])
+
+    assert_array_equal(read.node_x, mesh2d.node_x)
+    assert read.edge_nodes.size == 0
+    assert read.face_nodes.size == 0
+    assert read.nodes_per_face.size == 0
+
+
+def test_mesh2d_read_one_based_indices(tmp_path):
+    """Tests that a Mesh2d written by other software with 1-based indices
+    and a different fill value is converted to 0-based indices."""
+
+    path = tmp_path / "mesh2d.nc"
+    with netCDF4.Dataset(path, "w") as dataset:
+        dataset.createDimension("nNodes", 4)
+        dataset.createDimension("nEdges", 4)
+        dataset.createDimension("nFaces", 2)
+        dataset.createDimension("nMaxNodes", 3)
+        dataset.createDimension("Two", 2)
+        topology = dataset.createVariable("grid", "i4")
+        topology.cf_role = "mesh_topology"
+        topology.topology_dimension = 2
+        topology.node_coordinates = "x y"
+        topology.edge_node_connectivity = "edges"
+        topology.face_node_connectivity = "faces"
+        dataset.createVariable("x", "f8", ("nNodes",))[:] = [0.0, 1.0, 1.0, 0.0]
+        dataset.createVariable("y", "f8", ("nNodes",))[:] = [0.0, 0.0, 1.0, 1.0]
+        edges = dataset.createVariable("edges", "i4", ("nEdges", "Two"))
+        edges.start_index = 1
+        edges[:] = [[1, 2], [2, 3], [3, 4], [4, 1]]
+        faces = dataset.createVariable(
+            "faces", "i4", ("nFaces", "nMaxNodes"), fill_value=-1
+        )
+        faces.start_index = 1
+        faces[:] = [[1, 2, 3], [1, 3, 4]]
+
+    read = ugrid.read_mesh2d(path)
+
+    assert_array_equal(read.edge_nodes, [0, 1, 1, 2, 2, 3, 3, 0])
+    assert_array_equal(read.face_nodes, [0, 1, 2, 0, 2, 3])
+    assert_array_equal(read.nodes_per_face, [3, 3])
+
+
+def test_mesh1d_and_contacts_in_one_file(tmp_path):
+    """Tests that a Mesh2d, a Mesh1d and their contacts are written to and read from one file."""
+
+    mesh2d = mixed_mesh2d()
+    mesh1d = Mesh1d(
+        node_x=np.array([0.5, 1.5, 2.5], dtype=np.double),
+        node_y=np.array([0.5, 0.5, 0.5], dtype=np.double),
+        edge_nodes=np.array([0, 1, 1, 2], dtype=np.int32),
+    )
+    contacts = Contacts(
+        mesh1d_indices=np.array([0, 1], dtype=np.int32),
+        mesh2d_indices=np.array([0, 1], dtype=np.int32),
+    )
+    path = tmp_path / "meshes.nc"
+
+    ugrid.write_mesh2d(path, mesh2d)
+    ugrid.write_mesh1d(path, mesh1d)
+    ugrid.write_contacts(path, contacts)
+
+    read_mesh1d = ugrid.read_mesh1d(path)
+    read_contacts = ugrid.read_contacts(path)
+
+    assert_array_equal(ugrid.read_mesh2d(path).face_nodes, mesh2d.face_nodes)
+    assert_array_equal(read_mesh1d.node_x, mesh1d.node_x)
+    assert_array_equal(read_mesh1d.node_y, mesh1d.node_y)
+    assert_array_equal(read_mesh1d.edge_nodes, mesh1d.edge_nodes)
+    assert_array_equal(read_contacts.mesh1d_indices, contacts.mesh1d_indices)
+    assert_array_equal(read_contacts.mesh2d_indices, contacts.mesh2d_indices)
+
+
+def test_write_without_unlimited_dimensions(tmp_path):
+    """Tests that a Mesh2d without faces, an empty Mesh1d and empty contacts are written without
+    unlimited dimensions and read back as empty arrays."""
+
+    mesh2d = mixed_mesh2d()
+    mesh2d = Mesh2d(mesh2d.node_x, mesh2d.node_y, mesh2d.edge_nodes)
+    mesh1d = Mesh1d(
+        np.empty(0, dtype=np.double),
+        np.empty(0, dtype=np.double),
+        np.empty(0, dtype=np.int32),
+    )
+    contacts = Contacts(np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32))
+    path = tmp_path / "meshes.nc"
+
+    ugrid.write_mesh2d(path, mesh2d)
+    ugrid.write_mesh1d(path, mesh1d)
+    ugrid.write_contacts(path, contacts)
+
+    with netCDF4.Dataset(path) as dataset:
+        assert dataset.dimensions
+        assert not any(
+            dimension.isunlimited() for dimension in dataset.dimensions.values()
+        )
+        assert "mesh2d_face_nodes" not in dataset.variables
+
+    read_mesh2d = ugrid.read_mesh2d(path)
+    read_mesh1d = ugrid.read_mesh1d(path)
+    read_contacts = ugrid.read_contacts(path)
+
+    assert_array_equal(read_mesh2d.node_x, mesh2d.node_x)
+    assert_array_equal(read_mesh2d.edge_nodes, mesh2d.edge_nodes)
+    assert read_mesh2d.face_nodes.size == 0
+    assert read_mesh2d.nodes_per_face.size == 0
+    assert read_mesh1d.node_x.size == 0
+    assert read_mesh1d.edge_nodes.size == 0
+    assert read_contacts.mesh1d_indices.size == 0
+    assert read_contacts.mesh2d_indices.size == 0
+
+
+def test_read_mesh2d_without_mesh2d(tmp_path):
+    """Tests that `read_mesh2d` raises an `InputError` for a file without 2D mesh topology."""
+
+    path = tmp_path / "mesh1d.nc"
+    ugrid.write_mesh1d(
+        path,
+        Mesh1d(
+            np.array([0.0, 1.0], dtype=np.double),
+            np.array([0.0, 0.0], dtype=np.double),
+            np.array([0, 1], dtype=np.int32),
+        ),
+        mode="w",
+    )
+
+    with pytest.raises(InputError):
+        ugrid.read_mesh2d(path)
@@ -2,7 +2,16 @@ import numpy as np
 import pytest
 from numpy.testing import assert_array_equal
 
-from meshkernel import InputError, Mesh2dFactory, MeshKernel, __version__
+from meshkernel import (
+    Contacts,
+    InputError,
+    Mesh1d,
+    Mesh2d,
+    Mesh2dFactory,
+    MeshKernel,
+    __version__,
+)
+from meshkernel.utils import imshow_edges, rasterize_edges, rasterize_faces
 
 
 def test_create_rectilinear_mesh_simple():
@@ -124,6 +133,32 @@ def test_create_rectilinear_mesh_reject_negative_rows_columns():
         Mesh2dFactory.create_rectilinear_mesh(2, -1)
 
 
+def test_create_rectilinear_mesh_large():
+    """Test create_rectilinear_mesh``by creating a 40x70 mesh and checking that every edge
+    connects two neighboring nodes and appears exactly once."""
+    rows = 40
+    columns = 70
+    mesh2d = Mesh2dFactory.create_rectilinear_mesh(
+        rows, columns, spacing_x=0.5, spacing_y=2.0
+    )
+
+    num_nodes = (rows + 1) * (columns + 1)
+    num_edges = rows * (columns + 1) + (rows + 1) * columns
+    assert mesh2d.node_x.size == num_nodes
+    assert mesh2d.edge_nodes.size == 2 * num_edges
+
+    node_0 = mesh2d.edge_nodes[0::2]
+    node_1 = mesh2d.edge_nodes[1::2]
+    edge_dx = np.abs(mesh2d.node_x[node_0] - mesh2d.node_x[node_1])
+    edge_dy = np.abs(mesh2d.node_y[node_0] - mesh2d.node_y[node_1])
+    assert np.all(
+        (edge_dx == 0.5) & (edge_dy == 0.0) | (edge_dx == 0.0) & (edge_dy == 2.0)
+    )
+
+    edge_keys = np.minimum(node_0, node_1) * num_nodes + np.maximum(node_0, node_1)
+    assert np.unique(edge_keys).size == num_edges
+
+
 def test_get_meshkernel_version():
     """Tests if we can get the version of MeshKernel through the API"""
     mk = MeshKernel()
@@ -136,3 +171,299 @@ def test_get_meshkernelpy_version():
     mk = MeshKernel()
     meshkernelpy_version = mk.get_meshkernelpy_version()
     assert meshkernelpy_version == __version__
+
+
+def test_plot_faces_single_collection():
+    """Tests that `plot_faces` plots faces with different numbers of nodes
+    as a single collection colored by the face values.
+
+    3---2---4
+    |   |  /
+    0---1
+    """
+    plt = pytest.importorskip("matplotlib.pyplot")
+    mesh2d = Mesh2d(
+        node_x=np.array([0.0, 1.0, 1.0, 0.0, 2.0]),
+        node_y=np.array([0.0, 0.0, 1.0, 1.0, 1.0]),
+        edge_nodes=np.array([0, 1, 1, 2, 2, 3, 3, 0, 2, 4, 4, 1], dtype=np.int32),
+        face_nodes=np.array([0, 1, 2, 3, 1, 4, 2], dtype=np.int32),
+        nodes_per_face=np.array([4, 3], dtype=np.int32),
+    )
+
+    fig, ax = plt.subplots()
+    faces = mesh2d.plot_faces(ax, face_values=np.array([1.0, 2.0]))
+
+    assert list(ax.collections) == [faces]
+    paths = faces.get_paths()
+    assert len(paths) == 2
+    assert_array_equal(paths[0].vertices[:4], [[0, 0], [1, 0], [1, 1], [0, 1]])
+    assert_array_equal(paths[1].vertices[:3], [[1, 0], [2, 1], [1, 1]])
+    assert_array_equal(faces.get_array(), [1.0, 2.0])
+    plt.close(fig)
+
+
+def test_plot_faces_color_and_empty_faces():
+    """Tests that `plot_faces` uses a positional argument as face color, rejects other positional
+    arguments and skips faces without nodes."""
+    plt = pytest.importorskip("matplotlib.pyplot")
+    mesh2d = Mesh2d(
+        node_x=np.array([0.0, 1.0, 1.0, 0.0, 2.0]),
+        node_y=np.array([0.0, 0.0, 1.0, 1.0, 1.0]),
+        edge_nodes=np.array([0, 1, 1, 2, 2, 3, 3, 0, 2, 4, 4, 1], dtype=np.int32),
+        face_nodes=np.array([1, 4, 2, 0, 1, 2, 3], dtype=np.int32),
+        nodes_per_face=np.array([3, 0, 4], dtype=np.int32),
+    )
+
+    fig, ax = plt.subplots()
+    faces = mesh2d.plot_faces(ax, "r")
+
+    paths = faces.get_paths()
+    assert len(paths) == 2
+    assert_array_equal(paths[0].vertices[:3], [[1, 0], [2, 1], [1, 1]])
+    assert_array_equal(paths[1].vertices[:4], [[0, 0], [1, 0], [1, 1], [0, 1]])
+    assert_array_equal(faces.get_facecolor(), [[1.0, 0.0, 0.0, 1.0]])
+
+    faces = mesh2d.plot_faces(ax, face_values=np.array([1.0, 2.0, 3.0]))
+    assert_array_equal(faces.get_array(), [1.0, 3.0])
+
+    with pytest.raises(InputError):
+        mesh2d.plot_faces(ax, "r", 0.5)
+    plt.close(fig)
+
+
+def test_plot_contacts_single_collection():
+    """Tests that `Contacts.plot_edges` plots all contacts as a single collection
+    of segments from the mesh1d nodes to the mesh2d face centers."""
+    plt = pytest.importorskip("matplotlib.pyplot")
+    mesh1d = Mesh1d(
+        node_x=np.array([0.0, 1.0, 2.0]),
+        node_y=np.array([2.0, 2.0, 2.0]),
+        edge_nodes=np.array([0, 1, 1, 2], dtype=np.int32),
+    )
+    mesh2d = Mesh2d(
+        node_x=np.empty(0),
+        node_y=np.empty(0),
+        edge_nodes=np.empty(0, dtype=np.int32),
+        face_x=np.array([0.5, 1.5]),
+        face_y=np.array([0.5, 0.5]),
+    )
+    contacts = Contacts(
+        mesh1d_indices=np.array([0, 2], dtype=np.int32),
+        mesh2d_indices=np.array([0, 1], dtype=np.int32),
+    )
+
+    fig, ax = plt.subplots()
+    line_segments = contacts.plot_edges(ax, mesh1d, mesh2d, color="red")
+
+    assert list(ax.collections) == [line_segments]
+    assert_array_equal(
+        [path.vertices for path in line_segments.get_paths()],
+        [[[0.0, 2.0], [0.5, 0.5]], [[2.0, 2.0], [1.5, 0.5]]],
+    )
+    plt.close(fig)
+
+
+def test_plot_edges_level_of_detail():
+    """Tests that `plot_edges` with level of detail only draws the edges within the view limits,
+    keeps one edge per pixel when the edges are smaller than a pixel, and updates on zooming."""
+    plt = pytest.importorskip("matplotlib.pyplot")
+    mesh2d = Mesh2dFactory.create_rectilinear_mesh(100, 100)
+
+    fig, ax = plt.subplots(figsize=(1, 1), dpi=50)
+    ax.set_position([0, 0, 1, 1])
+    edges = mesh2d.plot_edges(ax, level_of_detail=True)
+    fig.canvas.draw()
+
+    # All 20200 edges are visible, but at most one is kept per pixel
+    assert 0 < len(edges.get_segments()) <= 50 * 50
+
+    ax.set_xlim(10.5, 12.5)
+    ax.set_ylim(20.5, 22.5)
+    fig.canvas.draw()
+
+    # The edges crossing the view of 2 by 2 cells are all larger than a pixel
+    segments = np.array(edges.get_segments())
+    assert len(segments) == 12
+    assert np.all(segments[:, :, 0].max(axis=1) >= 10.5)
+    assert np.all(segments[:, :, 0].min(axis=1) <= 12.5)
+    plt.close(fig)
+
+
+def test_plot_faces_level_of_detail():
+    """Tests that `plot_faces` with level of detail only draws the faces within the view limits
+    with their own values and the color limits of all faces."""
+    plt = pytest.importorskip("matplotlib.pyplot")
+    node_x, node_y = np.meshgrid(np.arange(11.0), np.arange(11.0))
+    lower_left = (np.arange(10)[:, np.newaxis] * 11 + np.arange(10)).ravel()
+    mesh2d = Mesh2d(
+        node_x=node_x.ravel(),
+        node_y=node_y.ravel(),
+        edge_nodes=np.empty(0, dtype=np.int32),
+        face_nodes=np.column_stack(
+            (lower_left, lower_left + 1, lower_left + 12, lower_left + 11)
+        )
+        .ravel()
+        .astype(np.int32),
+        nodes_per_face=np.full(100, 4, dtype=np.int32),
+    )
+    face_values = np.arange(100, dtype=np.double)
+
+    fig, ax = plt.subplots()
+    faces = mesh2d.plot_faces(ax, face_values=face_values, level_of_detail=True)
+    ax.set_xlim(0.5, 1.5)
+    ax.set_ylim(0.5, 1.5)
+    fig.canvas.draw()
+
+    assert_array_equal(faces.get_array(), [0.0, 1.0, 10.0, 11.0])
+    assert faces.get_clim() == (0.0, 99.0)
+    plt.close(fig)
+
+
+def test_rasterize_edges():
+    """Tests that `rasterize_edges` counts the edges crossing each pixel,
+    clipping edges to the extent and counting every edge once per pixel."""
+    node_x = np.array([0.0, 4.0, 0.0, 1.5, -10.0, 10.0])
+    node_y = np.array([0.5, 0.5, 0.5, 3.5, 2.5, 2.5])
+    edge_nodes = np.array([0, 1, 2, 3, 4, 5], dtype=np.int32)
+
+    image = rasterize_edges(node_x, node_y, edge_nodes, (0.0, 4.0, 0.0, 4.0), (4, 4))
+
+    assert_array_equal(
+        image[::-1],
+        [
+            [0, 1, 0, 0],
+            [1, 2, 1, 1],
+            [1, 0, 0, 0],
+            [2, 1, 1, 1],
+        ],
+    )
+
+
+def test_rasterize_faces():
+    """Tests that `rasterize_faces` averages the values of the faces covering each pixel center
+    and adds faces smaller than a pixel to the pixel of their center.
+
+    3-------2
+    |     / |
+    |    /  |
+    |   /   |
+    |  /    |
+    | /     |
+    0-------1   4-5-6
+    """
+    node_x = np.array([0.0, 2.0, 2.0, 0.0, 2.2, 2.3, 2.25])
+    node_y = np.array([0.0, 0.0, 2.0, 2.0, 0.2, 0.2, 0.3])
+    face_nodes = np.array([0, 1, 2, 0, 2, 3, 4, 5, 6], dtype=np.int32)
+    nodes_per_face = np.array([3, 3, 3], dtype=np.int32)
+    face_values = np.array([1.0, 3.0, 10.0])
+
+    image = rasterize_faces(
+        node_x,
+        node_y,
+        face_nodes,
+        nodes_per_face,
+        face_values,
+        (0.0, 4.0, 0.0, 4.0),
+        (4, 4),
+    )
+
+    # The pixel centers on the diagonal are covered by both triangles
+    expected = np.full((4, 4), np.nan)
+    expected[0, :2] = [2.0, 1.0]
+    expected[1, :2] = [3.0, 2.0]
+    expected[0, 2] = 10.0
+    assert_array_equal(image, expected)
+
+
+def test_rasterize_in_small_parts(monkeypatch):
+    """Tests that rasterizing in many small chunks and parts, splitting long edges and large faces
+    from each other, gives the same images, also with a face without nodes."""
+    node_x, node_y = np.meshgrid(np.linspace(0.0, 8.0, 5), np.linspace(0.0, 8.0, 5))
+    node_x = node_x.ravel()
+    node_y = node_y.ravel()
+    edge_nodes = np.array([0, 24, 4, 20, 2, 22, 10, 14, 0, 1], dtype=np.int32)
+    face_nodes = np.array([0, 4, 24, 20, 0, 6, 7, 12, 13, 18], dtype=np.int32)
+    nodes_per_face = np.array([4, 0, 3, 3], dtype=np.int32)
+    face_values = np.array([1.0, 100.0, 2.0, 4.0])
+    extent = (0.0, 8.0, 0.0, 8.0)
+    shape = (16, 16)
+
+    edge_image = rasterize_edges(node_x, node_y, edge_nodes, extent, shape)
+    face_image = rasterize_faces(
+        node_x, node_y, face_nodes, nodes_per_face, face_values, extent, shape
+    )
+
+    monkeypatch.setattr("meshkernel.utils._RASTER_CHUNK_SIZE", 3)
+
+    assert_array_equal(
+        rasterize_edges(node_x, node_y, edge_nodes, extent, shape), edge_image
+    )
+    assert_array_equal(
+        rasterize_faces(
+            node_x, node_y, face_nodes, nodes_per_face, face_values, extent, shape
+        ),
+        face_image,
+    )
+    assert np.nanmax(face_image) < 100.0
+
+
+def test_rasterize_edges_memory_bounded(monkeypatch):
+    """Tests that the memory of `rasterize_edges` does not grow with the total length of the edges."""
+    tracemalloc = pytest.importorskip("tracemalloc")
+    monkeypatch.setattr("meshkernel.utils._RASTER_CHUNK_SIZE", 1 << 12)
+    num_edges = 2000
+    node_x = np.tile([0.0, 1.0], num_edges)
+    node_y = np.repeat(np.linspace(0.0, 1.0, num_edges), 2)
+    edge_nodes = np.arange(2 * num_edges, dtype=np.int32)
+
+    tracemalloc.start()
+    try:
+        image = rasterize_edges(
+            node_x, node_y, edge_nodes, (0.0, 1.0, 0.0, 1.0), (500, 500)
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert image.sum() >= num_edges * 500
+    # Sampling all 1000000 pixels of the edges at once would take tens of MB
+    assert peak < 8 * 1024 * 1024
+
+
+def test_imshow_edges_straight_mesh():
+    """Tests that `imshow_edges` pads the zero height extent of a straight mesh,
+    so that its edges are drawn."""
+    plt = pytest.importorskip("matplotlib.pyplot")
+    node_x = np.array([0.0, 1.0, 2.0])
+    node_y = np.array([3.0, 3.0, 3.0])
+    edge_nodes = np.array([0, 1, 1, 2], dtype=np.int32)
+
+    fig, ax = plt.subplots()
+    image = imshow_edges(node_x, node_y, edge_nodes, ax, shape=(5, 10))
+
+    assert image.get_extent() == [0.0, 2.0, 2.0, 4.0]
+    # Both edges cross the pixel of the middle node
+    assert_array_equal(image.get_array().filled(0)[2], [1, 1, 1, 1, 1, 2, 1, 1, 1, 1])
+    assert image.get_array().count() == 10
+    plt.close(fig)
+
+
+def test_rasterize_rejects_empty_input():
+    """Tests that rasterizing raises an `InputError` for a mesh without nodes
+    and for an empty extent, instead of returning an empty image."""
+    plt = pytest.importorskip("matplotlib.pyplot")
+    empty = np.empty(0, dtype=np.double)
+
+    fig, ax = plt.subplots()
+    with pytest.raises(InputError):
+        imshow_edges(empty, empty, np.empty(0, dtype=np.int32), ax)
+    plt.close(fig)
+
+    with pytest.raises(InputError):
+        rasterize_edges(
+            np.array([0.0, 1.0]),
+            np.array([0.0, 0.0]),
+            np.array([0, 1], dtype=np.int32),
+            (0.0, 1.0, 0.0, 0.0),
+            (4, 4),
+        )